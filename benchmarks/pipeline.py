@@ -0,0 +1,382 @@
+"""Benchmark the fetch, decode and model pipeline of the client.
+
+Synthetic FeatureCollections of each dataset are served by a local
+stand-in for the Urban Data Platform API. Every stage is timed on its
+own, from decoding the JSON to the full collection methods, and the
+results can be compared with an earlier run to catch regressions:
+
+    python -m benchmarks.pipeline --output baseline.json
+    python -m benchmarks.pipeline --baseline baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from aiohttp import web
+
+from hamburg import DisabledParking, Garage, ParkAndRide, UDPHamburg
+from hamburg.hamburg import (
+    DISABLED_PARKINGS,
+    GARAGES,
+    PARK_AND_RIDES,
+    VERSION,
+    default_json_loads,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+FIXTURES = Path(__file__).parents[1] / "tests" / "fixtures"
+SIZES = (1_000, 10_000, 100_000)
+
+
+@dataclass(frozen=True, slots=True)
+class Dataset:
+    """Object representing a dataset that is benchmarked."""
+
+    name: str
+    uri: str
+    model: Any
+    fixture: str
+
+
+DATASETS = (
+    Dataset(
+        "disabled_parkings", DISABLED_PARKINGS, DisabledParking, "disabled_parking"
+    ),
+    Dataset("park_and_rides", PARK_AND_RIDES, ParkAndRide, "park_and_ride"),
+    Dataset("garages", GARAGES, Garage, "garages_live"),
+)
+
+
+@dataclass(frozen=True, slots=True)
+class Result:
+    """Object representing the result of a single benchmark."""
+
+    name: str
+    size: int
+    seconds: float
+    peak_bytes: int
+
+    @property
+    def key(self) -> str:
+        """Return the key to compare results of different runs.
+
+        Returns
+        -------
+            The name and size of the benchmark.
+
+        """
+        return f"{self.name}[{self.size}]"
+
+    @property
+    def features_per_second(self) -> float:
+        """Return the throughput of the benchmark.
+
+        Returns
+        -------
+            The number of features handled per second.
+
+        """
+        return self.size / self.seconds
+
+
+def generate(dataset: Dataset, size: int, seed: int = 0) -> list[dict[str, Any]]:
+    """Generate the features of a synthetic collection.
+
+    The features are copies of the fixtures with a unique ID and
+    coordinates spread over Hamburg, so the result is the same on
+    every run.
+
+    Args:
+    ----
+        dataset: The dataset to generate features for.
+        size: The number of features.
+        seed: The seed of the random coordinates.
+
+    Returns:
+    -------
+        A list of GeoJSON features.
+
+    """
+    templates = json.loads((FIXTURES / f"{dataset.fixture}.geojson").read_text())
+    templates = [item for item in templates["features"] if item["geometry"]]
+    generator = random.Random(seed)  # noqa: S311
+    return [
+        {
+            **templates[index % len(templates)],
+            "id": index,
+            "geometry": {
+                "type": "Point",
+                "coordinates": [
+                    generator.uniform(9.7, 10.3),
+                    generator.uniform(53.4, 53.75),
+                ],
+            },
+        }
+        for index in range(size)
+    ]
+
+
+@asynccontextmanager
+async def serve(collections: dict[str, list[dict[str, Any]]]) -> AsyncIterator[str]:
+    """Serve collections from a local stand-in for the API.
+
+    The items endpoints support the limit and offset parameters and
+    report numberMatched, like the real API.
+
+    Args:
+    ----
+        collections: The features per URI of an items endpoint.
+
+    Yields:
+    ------
+        The base URL to use as api_url of the client.
+
+    """
+    encoded = {
+        uri: [json.dumps(item).encode() for item in features]
+        for uri, features in collections.items()
+    }
+
+    async def items(request: web.Request) -> web.Response:
+        features = encoded[request.match_info["uri"]]
+        offset = int(request.query.get("offset", 0))
+        page = features[offset : offset + int(request.query.get("limit", 10))]
+        body = b"".join(
+            (
+                b'{"type":"FeatureCollection","numberMatched":%d,' % len(features),
+                b'"numberReturned":%d,"features":[' % len(page),
+                b",".join(page),
+                b"]}",
+            )
+        )
+        return web.Response(body=body, content_type="application/geo+json")
+
+    app = web.Application()
+    app.router.add_get("/datasets/v1/{uri:.+}", items)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    try:
+        yield f"http://{host}:{port}/datasets/v1/"
+    finally:
+        await runner.cleanup()
+
+
+async def measure(
+    name: str,
+    size: int,
+    func: Callable[[], Awaitable[Any]],
+    repeat: int,
+) -> Result:
+    """Time a benchmark and measure the peak of its allocations.
+
+    The fastest of the runs is reported. The allocations are traced in
+    a separate run, as tracing slows the code down.
+
+    Args:
+    ----
+        name: The name of the benchmark.
+        size: The number of features handled per run.
+        func: The benchmark.
+        repeat: The number of timed runs.
+
+    Returns:
+    -------
+        The result of the benchmark.
+
+    """
+    timings: list[float] = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        await func()
+        timings.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        await func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return Result(name, size, min(timings), peak)
+
+
+def stages(
+    client: UDPHamburg,
+    dataset: Dataset,
+    features: list[dict[str, Any]],
+) -> dict[str, Callable[[], Awaitable[Any]]]:
+    """Return the benchmarks of each stage of the pipeline for a dataset.
+
+    Args:
+    ----
+        client: The client connected to the stand-in API.
+        dataset: The dataset to benchmark.
+        features: The features of the synthetic collection.
+
+    Returns:
+    -------
+        The benchmarks by the name of the stage.
+
+    """
+    loads = default_json_loads()
+    body = json.dumps({"type": "FeatureCollection", "features": features}).encode()
+    data = loads(body)
+    model = dataset.model
+    method = getattr(client, dataset.name)
+
+    async def json_loads() -> Any:
+        return loads(body)
+
+    async def from_dict() -> Any:
+        return [model.from_dict(item) for item in features]
+
+    async def from_feature_collection() -> Any:
+        return model.from_feature_collection(data)
+
+    async def request() -> Any:
+        return await client._request(  # noqa: SLF001
+            dataset.uri, params={"limit": len(features)}
+        )
+
+    async def collection() -> Any:
+        return await method(limit=None)
+
+    return {
+        "json_loads": json_loads,
+        "from_dict": from_dict,
+        "from_feature_collection": from_feature_collection,
+        "request": request,
+        "collection": collection,
+    }
+
+
+async def run(sizes: list[int], repeat: int) -> list[Result]:
+    """Run all benchmarks.
+
+    Args:
+    ----
+        sizes: The sizes of the synthetic collections.
+        repeat: The number of timed runs of each benchmark.
+
+    Returns:
+    -------
+        The results of the benchmarks.
+
+    """
+    results: list[Result] = []
+    for size in sizes:
+        collections = {dataset.uri: generate(dataset, size) for dataset in DATASETS}
+        async with serve(collections) as api_url, UDPHamburg(api_url=api_url) as client:
+            for dataset in DATASETS:
+                benchmarks = stages(client, dataset, collections[dataset.uri])
+                for stage, func in benchmarks.items():
+                    result = await measure(
+                        f"{dataset.name}.{stage}", size, func, repeat
+                    )
+                    results.append(result)
+                    print(
+                        f"{result.key:<55} {result.seconds * 1000:>10.2f} ms"
+                        f" {result.features_per_second:>12,.0f} features/s"
+                        f" {result.peak_bytes / 2**20:>8.1f} MiB"
+                    )
+    return results
+
+
+def compare(
+    results: list[Result],
+    baseline: dict[str, Any],
+    threshold: float,
+) -> list[str]:
+    """Compare results with those of an earlier run.
+
+    Args:
+    ----
+        results: The results of this run.
+        baseline: The output of the earlier run.
+        threshold: The allowed slowdown or growth, 0.1 is 10%.
+
+    Returns:
+    -------
+        A description of each regression.
+
+    """
+    previous = {
+        Result(**item).key: Result(**item) for item in baseline.get("results", [])
+    }
+    regressions: list[str] = []
+    for result in results:
+        before = previous.get(result.key)
+        if before is None:
+            continue
+        if result.seconds > before.seconds * (1 + threshold):
+            regressions.append(
+                f"{result.key}: {before.seconds * 1000:.2f} ms"
+                f" -> {result.seconds * 1000:.2f} ms"
+            )
+        if result.peak_bytes > before.peak_bytes * (1 + threshold):
+            regressions.append(
+                f"{result.key}: {before.peak_bytes} -> {result.peak_bytes} bytes"
+            )
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks from the command line.
+
+    Returns
+    -------
+        The exit code, 1 when a regression was found.
+
+    """
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES))
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--output", type=Path, help="write the results as JSON")
+    parser.add_argument("--baseline", type=Path, help="compare with earlier results")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args.sizes, args.repeat))
+    if args.output is not None:
+        args.output.write_text(
+            json.dumps(
+                {
+                    "version": VERSION,
+                    "python": platform.python_version(),
+                    "platform": platform.platform(),
+                    "results": [asdict(result) for result in results],
+                },
+                indent=2,
+            )
+        )
+    if args.baseline is None:
+        return 0
+    regressions = compare(
+        results, json.loads(args.baseline.read_text()), args.threshold
+    )
+    for regression in regressions:
+        print(f"Regression {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,14 +1,171 @@
 """Asynchronous Python client providing Urban Data information of Hamburg."""
 
-from .exceptions import UDPHamburgConnectionError, UDPHamburgError
-from .hamburg import UDPHamburg
-from .models import DisabledParking, Garage, ParkAndRide
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .analytics import OccupancyReport, OccupancyStats, emptiest, fullest
+    from .batch import BatchResult, fetch_all, iter_fetch_all
+    from .cache import ResponseCache
+    from .columnar import LocationColumns
+    from .connection import ConnectionSettings
+    from .datasets import Collection, Feature
+    from .delta import Change, Delta, SnapshotTracker
+    from .exceptions import (
+        UDPHamburgCircuitOpenError,
+        UDPHamburgConnectionError,
+        UDPHamburgError,
+    )
+    from .export import (
+        ArrowExporter,
+        CSVExporter,
+        Exporter,
+        GeoJSONExporter,
+        NDJSONExporter,
+    )
+    from .filters import Query
+    from .hamburg import UDPHamburg
+    from .history import OccupancyRecorder, Sample
+    from .instrumentation import EndpointMetrics, Instrumentation, Timing
+    from .models import DisabledParking, Garage, ParkAndRide
+    from .poller import Poller, Subscription
+    from .retry import CircuitBreaker, RetryPolicy
+    from .scheduler import Priority, RequestScheduler, request_priority
+    from .snapshot import Snapshot, SnapshotStore
+    from .spatial import SpatialIndex
+    from .sync import SyncUDPHamburg
+
+# The public names by the module that defines them. The modules are only
+# imported when a name is first used, so `import hamburg` is cheap and
+# the models can be used without loading aiohttp.
+_LAZY_IMPORTS = {
+    "ArrowExporter": "export",
+    "BatchResult": "batch",
+    "CSVExporter": "export",
+    "Change": "delta",
+    "CircuitBreaker": "retry",
+    "Collection": "datasets",
+    "ConnectionSettings": "connection",
+    "Delta": "delta",
+    "DisabledParking": "models",
+    "EndpointMetrics": "instrumentation",
+    "Exporter": "export",
+    "Feature": "datasets",
+    "Garage": "models",
+    "GeoJSONExporter": "export",
+    "Instrumentation": "instrumentation",
+    "LocationColumns": "columnar",
+    "NDJSONExporter": "export",
+    "OccupancyRecorder": "history",
+    "OccupancyReport": "analytics",
+    "OccupancyStats": "analytics",
+    "ParkAndRide": "models",
+    "Poller": "poller",
+    "Priority": "scheduler",
+    "Query": "filters",
+    "RequestScheduler": "scheduler",
+    "ResponseCache": "cache",
+    "RetryPolicy": "retry",
+    "Sample": "history",
+    "Snapshot": "snapshot",
+    "SnapshotStore": "snapshot",
+    "SnapshotTracker": "delta",
+    "SpatialIndex": "spatial",
+    "Subscription": "poller",
+    "SyncUDPHamburg": "sync",
+    "Timing": "instrumentation",
+    "UDPHamburg": "hamburg",
+    "UDPHamburgCircuitOpenError": "exceptions",
+    "UDPHamburgConnectionError": "exceptions",
+    "UDPHamburgError": "exceptions",
+    "emptiest": "analytics",
+    "fetch_all": "batch",
+    "fullest": "analytics",
+    "iter_fetch_all": "batch",
+    "request_priority": "scheduler",
+}
 
 __all__ = [
+    "ArrowExporter",
+    "BatchResult",
+    "CSVExporter",
+    "Change",
+    "CircuitBreaker",
+    "Collection",
+    "ConnectionSettings",
+    "Delta",
     "DisabledParking",
+    "EndpointMetrics",
+    "Exporter",
+    "Feature",
     "Garage",
+    "GeoJSONExporter",
+    "Instrumentation",
+    "LocationColumns",
+    "NDJSONExporter",
+    "OccupancyRecorder",
+    "OccupancyReport",
+    "OccupancyStats",
     "ParkAndRide",
+    "Poller",
+    "Priority",
+    "Query",
+    "RequestScheduler",
+    "ResponseCache",
+    "RetryPolicy",
+    "Sample",
+    "Snapshot",
+    "SnapshotStore",
+    "SnapshotTracker",
+    "SpatialIndex",
+    "Subscription",
+    "SyncUDPHamburg",
+    "Timing",
     "UDPHamburg",
+    "UDPHamburgCircuitOpenError",
     "UDPHamburgConnectionError",
     "UDPHamburgError",
+    "emptiest",
+    "fetch_all",
+    "fullest",
+    "iter_fetch_all",
+    "request_priority",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name on first use.
+
+    Args:
+    ----
+        name: The name of the attribute.
+
+    Returns:
+    -------
+        The class or function.
+
+    Raises:
+    ------
+        AttributeError: If the package has no such attribute.
+
+    """
+    module = _LAZY_IMPORTS.get(name)
+    if module is None:
+        msg = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(msg)
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """Return the attributes of the package, including the lazy ones.
+
+    Returns
+    -------
+        The names of the attributes.
+
+    """
+    return sorted({*globals(), *__all__})
@@ -0,0 +1,279 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any
+
+from .columnar import LocationColumns
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Callable, Iterable, Sequence
+
+
+@dataclass(slots=True)
+class OccupancyStats:
+    """Object representing the totals of a group of locations.
+
+    Only locations that report both their free space and capacity count
+    towards `free_space` and `capacity`, so the availability is weighted
+    by capacity: a large garage weighs more than a small one.
+    """
+
+    count: int = 0
+    reporting: int = 0
+    free_space: float = 0
+    capacity: float = 0
+    disabled_parking_spaces: int = 0
+
+    @property
+    def occupied(self) -> float:
+        """Return the number of occupied spaces.
+
+        Returns
+        -------
+            The occupied spaces of the reporting locations.
+
+        """
+        return self.capacity - self.free_space
+
+    @property
+    def availability_pct(self) -> float | None:
+        """Return the weighted availability.
+
+        Returns
+        -------
+            The percentage of free spaces of the reporting locations,
+            or None if none of the locations report their occupancy.
+
+        """
+        if self.capacity <= 0:
+            return None
+        return round(self.free_space / self.capacity * 100, 1)
+
+    def add(
+        self,
+        free_space: float | None,
+        capacity: float | None,
+        disabled_parking_spaces: int | None = None,
+    ) -> None:
+        """Add a location to the totals.
+
+        Args:
+        ----
+            free_space: The free spaces of the location, if known.
+            capacity: The capacity of the location, if known.
+            disabled_parking_spaces: The spaces for disabled people.
+
+        """
+        self.count += 1
+        if disabled_parking_spaces:
+            self.disabled_parking_spaces += disabled_parking_spaces
+        if free_space is not None and capacity is not None and capacity > 0:
+            self.reporting += 1
+            self.free_space += free_space
+            self.capacity += capacity
+
+
+@dataclass(slots=True)
+class OccupancyReport:
+    """City-wide and grouped occupancy totals of a collection.
+
+    The totals are built in a single pass over the models, without
+    holding on to them, so a report can be built straight from one of
+    the `iter_*` methods of the client.
+    """
+
+    by: str | Callable[[Any], Any] | None = None
+    total: OccupancyStats = field(default_factory=OccupancyStats)
+    groups: dict[Any, OccupancyStats] = field(default_factory=dict)
+
+    _key: Callable[[Any], Any] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Resolve the group key."""
+        self._key = attrgetter(self.by) if isinstance(self.by, str) else self.by
+
+    @classmethod
+    def from_models(
+        cls: type[OccupancyReport],
+        items: Iterable[Any],
+        by: str | Callable[[Any], Any] | None = None,
+    ) -> OccupancyReport:
+        """Return an OccupancyReport object from model objects.
+
+        Args:
+        ----
+            items: ParkAndRide or Garage objects.
+            by: The field to group by, for example 'park_type',
+                'data_origin' or 'status', or a function of a model.
+
+        Returns:
+        -------
+            An OccupancyReport object.
+
+        """
+        report = cls(by)
+        for item in items:
+            report.add(item)
+        return report
+
+    @classmethod
+    async def collect(
+        cls: type[OccupancyReport],
+        items: AsyncIterable[Any],
+        by: str | Callable[[Any], Any] | None = None,
+    ) -> OccupancyReport:
+        """Return an OccupancyReport object from an async iterator of models.
+
+        Args:
+        ----
+            items: For example `client.iter_garages()`.
+            by: The field to group by, or a function of a model.
+
+        Returns:
+        -------
+            An OccupancyReport object.
+
+        """
+        report = cls(by)
+        async for item in items:
+            report.add(item)
+        return report
+
+    @classmethod
+    def from_columns(
+        cls: type[OccupancyReport],
+        columns: LocationColumns,
+        keys: Sequence[Any] | None = None,
+    ) -> OccupancyReport:
+        """Return an OccupancyReport object from columnar results.
+
+        Args:
+        ----
+            columns: The LocationColumns object.
+            keys: The group of every location, in the order of the
+                columns. Without keys only the total is computed.
+
+        Returns:
+        -------
+            An OccupancyReport object.
+
+        Raises:
+        ------
+            ValueError: If the number of keys does not match the columns.
+
+        """
+        if keys is not None and len(keys) != len(columns):
+            msg = f"Expected {len(columns)} keys, got {len(keys)}"
+            raise ValueError(msg)
+        report = cls()
+        total = report.total
+        groups = report.groups
+        for index, (free_space, capacity) in enumerate(
+            zip(columns.free_space, columns.capacity, strict=True)
+        ):
+            free = None if math.isnan(free_space) else free_space
+            size = None if math.isnan(capacity) else capacity
+            total.add(free, size)
+            if keys is not None:
+                stats = groups.get(keys[index])
+                if stats is None:
+                    stats = groups[keys[index]] = OccupancyStats()
+                stats.add(free, size)
+        return report
+
+    def add(self, item: Any) -> None:
+        """Add a model object to the totals.
+
+        Args:
+        ----
+            item: A ParkAndRide or Garage object.
+
+        """
+        free_space = item.free_space
+        capacity = item.capacity
+        disabled = getattr(item, "disabled_parking_spaces", None)
+        self.total.add(free_space, capacity, disabled)
+        if self._key is not None:
+            key = self._key(item)
+            stats = self.groups.get(key)
+            if stats is None:
+                stats = self.groups[key] = OccupancyStats()
+            stats.add(free_space, capacity, disabled)
+
+
+def _top(
+    items: Iterable[Any] | LocationColumns,
+    n: int,
+    *,
+    fullest: bool,
+) -> list[Any]:
+    """Return the n locations with the lowest or highest availability.
+
+    Args:
+    ----
+        items: Model objects, or a LocationColumns object.
+        n: The number of locations.
+        fullest: True for the lowest availability.
+
+    Returns:
+    -------
+        The model objects, or the rows of the columns.
+
+    """
+    select = heapq.nsmallest if fullest else heapq.nlargest
+    if isinstance(items, LocationColumns):
+        pct = items.availability_pct
+        indices = select(
+            n,
+            (index for index, value in enumerate(pct) if not math.isnan(value)),
+            key=pct.__getitem__,
+        )
+        return [items.row(index) for index in indices]
+    return select(
+        n,
+        (item for item in items if getattr(item, "availability_pct", None) is not None),
+        key=attrgetter("availability_pct"),
+    )
+
+
+def fullest(items: Iterable[Any] | LocationColumns, n: int = 5) -> list[Any]:
+    """Return the n locations with the lowest availability.
+
+    Locations without occupancy data are left out.
+
+    Args:
+    ----
+        items: ParkAndRide or Garage objects, or a LocationColumns object.
+        n: The number of locations.
+
+    Returns:
+    -------
+        The model objects, or the rows of the columns (see
+        `LocationColumns.row`), fullest first.
+
+    """
+    return _top(items, n, fullest=True)
+
+
+def emptiest(items: Iterable[Any] | LocationColumns, n: int = 5) -> list[Any]:
+    """Return the n locations with the highest availability.
+
+    Locations without occupancy data are left out.
+
+    Args:
+    ----
+        items: ParkAndRide or Garage objects, or a LocationColumns object.
+        n: The number of locations.
+
+    Returns:
+    -------
+        The model objects, or the rows of the columns (see
+        `LocationColumns.row`), emptiest first.
+
+    """
+    return _top(items, n, fullest=False)
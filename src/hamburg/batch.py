@@ -0,0 +1,88 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Mapping
+
+
+@dataclass
+class BatchResult:
+    """Object representing the outcome of one request of a batch."""
+
+    name: str
+    value: Any = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Return if the request succeeded.
+
+        Returns
+        -------
+            True if the request did not fail.
+
+        """
+        return self.error is None
+
+
+async def iter_fetch_all(
+    requests: Mapping[str, Awaitable[Any]],
+) -> AsyncIterator[BatchResult]:
+    """Run requests concurrently and yield each result as soon as it is done.
+
+    A request that fails is reported in its result, whatever the error,
+    and the other requests carry on. Requests that are still running when
+    the iteration stops are cancelled.
+
+    Args:
+    ----
+        requests: The requests by name, for example
+            {"garages": client.garages(limit=None)}.
+
+    Yields:
+    ------
+        A BatchResult object for every request, in order of completion.
+
+    """
+    tasks = {asyncio.ensure_future(request): name for name, request in requests.items()}
+    order = list(tasks)
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in sorted(done, key=order.index):
+                try:
+                    value = task.result()
+                except Exception as exception:  # noqa: BLE001
+                    yield BatchResult(tasks[task], error=exception)
+                else:
+                    yield BatchResult(tasks[task], value)
+    finally:
+        for task in pending:
+            task.cancel()
+        # Also retrieves the exceptions of failed requests that were not yielded.
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+async def fetch_all(requests: Mapping[str, Awaitable[Any]]) -> dict[str, BatchResult]:
+    """Run requests concurrently and wait for all of them.
+
+    Args:
+    ----
+        requests: The requests by name, for example
+            {"garages": client.garages(limit=None)}.
+
+    Returns:
+    -------
+        The BatchResult objects by name, in the order of the requests.
+
+    """
+    results = {result.name: result async for result in iter_fetch_all(requests)}
+    return {name: results[name] for name in requests}
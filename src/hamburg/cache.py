@@ -0,0 +1,126 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any
+
+# Static datasets hardly change, live occupancy data does every few minutes.
+DEFAULT_TTLS: dict[str, float] = {
+    "behindertenstellplaetze": 6 * 3600.0,
+}
+
+
+@dataclass
+class CacheEntry:
+    """Object representing a cached response of the Urban Data Platform API."""
+
+    data: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @property
+    def fresh(self) -> bool:
+        """Return if the entry can be used without revalidation.
+
+        Returns
+        -------
+            True if the time to live of the entry has not passed yet.
+
+        """
+        return time.monotonic() < self.expires_at
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Return the headers to revalidate this entry with the API.
+
+        Returns
+        -------
+            A dictionary with conditional request headers.
+
+        """
+        headers: dict[str, str] = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class ResponseCache:
+    """In-memory LRU cache for decoded responses, with a TTL per dataset.
+
+    Subclass it to plug in another storage, the client only uses `ttl`,
+    `get` and `set`.
+    """
+
+    max_entries: int = 128
+    default_ttl: float = 60.0
+    ttls: dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TTLS))
+
+    _entries: OrderedDict[str, CacheEntry] = field(
+        default_factory=OrderedDict, init=False, repr=False
+    )
+
+    def ttl(self, uri: str) -> float:
+        """Return the time to live for a request URI.
+
+        Args:
+        ----
+            uri: Request URI, the dataset is the first part of the path.
+
+        Returns:
+        -------
+            The time to live in seconds.
+
+        """
+        return self.ttls.get(uri.split("/", 1)[0], self.default_ttl)
+
+    def get(self, key: str) -> CacheEntry | None:
+        """Return a cached entry, also when it is no longer fresh.
+
+        Args:
+        ----
+            key: The cache key, the full request URL.
+
+        Returns:
+        -------
+            The cached entry or None if nothing is cached.
+
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry and evict the least recently used ones.
+
+        Args:
+        ----
+            key: The cache key, the full request URL.
+            entry: The entry to store.
+
+        """
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        """Return the number of cached entries.
+
+        Returns
+        -------
+            The number of entries.
+
+        """
+        return len(self._entries)
@@ -0,0 +1,149 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import math
+from array import array
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Iterable
+
+
+def _float_array() -> array[float]:
+    """Return an empty array of doubles.
+
+    Returns
+    -------
+        An empty array.
+
+    """
+    return array("d")
+
+
+def _value(number: float) -> float | None:
+    """Return a column value, with NaN as missing value.
+
+    Args:
+    ----
+        number: The value from the column.
+
+    Returns:
+    -------
+        The value or None if it is missing.
+
+    """
+    return None if math.isnan(number) else number
+
+
+@dataclass(slots=True)
+class LocationColumns:
+    """Columnar, array-backed container for a large set of locations.
+
+    Numeric values are stored as doubles, missing values are stored as NaN.
+    Disabled parking spaces have no occupancy data, those are stored with
+    the number of parking spots as capacity.
+    """
+
+    spot_id: list[str] = field(default_factory=list)
+    longitude: array[float] = field(default_factory=_float_array)
+    latitude: array[float] = field(default_factory=_float_array)
+    free_space: array[float] = field(default_factory=_float_array)
+    capacity: array[float] = field(default_factory=_float_array)
+    availability_pct: array[float] = field(default_factory=_float_array)
+
+    @classmethod
+    def from_models(
+        cls: type[LocationColumns], items: Iterable[Any]
+    ) -> LocationColumns:
+        """Return a LocationColumns object from model objects.
+
+        Args:
+        ----
+            items: DisabledParking, ParkAndRide or Garage objects.
+
+        Returns:
+        -------
+            A LocationColumns object.
+
+        """
+        columns = cls()
+        for item in items:
+            columns.append(item)
+        return columns
+
+    @classmethod
+    async def collect(
+        cls: type[LocationColumns], items: AsyncIterable[Any]
+    ) -> LocationColumns:
+        """Return a LocationColumns object from an async iterator of models.
+
+        Every model object can be released as soon as it is added, so the
+        full list of objects is never held in memory.
+
+        Args:
+        ----
+            items: For example `client.iter_garages()`.
+
+        Returns:
+        -------
+            A LocationColumns object.
+
+        """
+        columns = cls()
+        async for item in items:
+            columns.append(item)
+        return columns
+
+    def append(self, item: Any) -> None:
+        """Add a model object to the columns.
+
+        Args:
+        ----
+            item: A DisabledParking, ParkAndRide or Garage object.
+
+        """
+        nan = math.nan
+        free_space = getattr(item, "free_space", None)
+        capacity = getattr(item, "capacity", getattr(item, "number", None))
+        availability_pct = getattr(item, "availability_pct", None)
+        self.spot_id.append(item.spot_id)
+        self.longitude.append(item.longitude)
+        self.latitude.append(item.latitude)
+        self.free_space.append(nan if free_space is None else free_space)
+        self.capacity.append(nan if capacity is None else capacity)
+        self.availability_pct.append(
+            nan if availability_pct is None else availability_pct
+        )
+
+    def row(self, index: int) -> dict[str, Any]:
+        """Return a single location as a dictionary.
+
+        Args:
+        ----
+            index: The position of the location.
+
+        Returns:
+        -------
+            A dictionary with the values of the location.
+
+        """
+        return {
+            "spot_id": self.spot_id[index],
+            "longitude": self.longitude[index],
+            "latitude": self.latitude[index],
+            "free_space": _value(self.free_space[index]),
+            "capacity": _value(self.capacity[index]),
+            "availability_pct": _value(self.availability_pct[index]),
+        }
+
+    def __len__(self) -> int:
+        """Return the number of locations.
+
+        Returns
+        -------
+            The number of locations.
+
+        """
+        return len(self.spot_id)
@@ -0,0 +1,61 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from aiohttp import ClientSession, TraceConfig
+
+
+@dataclass(frozen=True, slots=True)
+class ConnectionSettings:
+    """Object representing the connection pool settings of a client session."""
+
+    pool_size: int = 100
+    pool_size_per_host: int = 0
+    keepalive_timeout: float = 30.0
+    dns_cache_ttl: int | None = 300
+    compression: bool = True
+
+    @property
+    def accept_encoding(self) -> str:
+        """Return the Accept-Encoding header for requests.
+
+        Returns
+        -------
+            The content encodings the client accepts.
+
+        """
+        return "gzip, deflate" if self.compression else "identity"
+
+    def create_session(
+        self, trace_configs: list[TraceConfig] | None = None
+    ) -> ClientSession:
+        """Create a client session with a tuned connection pool.
+
+        One session can be shared by many clients and tasks, which then
+        reuse the open (TLS) connections. The owner of the session has
+        to close it.
+
+        Args:
+        ----
+            trace_configs: Trace configs of the session, for example
+                the one of Instrumentation.
+
+        Returns:
+        -------
+            A new aiohttp client session.
+
+        """
+        from aiohttp import ClientSession, TCPConnector  # noqa: PLC0415
+
+        connector = TCPConnector(
+            limit=self.pool_size,
+            limit_per_host=self.pool_size_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            use_dns_cache=self.dns_cache_ttl is not None,
+            ttl_dns_cache=self.dns_cache_ttl,
+        )
+        return ClientSession(connector=connector, trace_configs=trace_configs)
@@ -0,0 +1,174 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+
+@dataclass(slots=True)
+class Feature:
+    """Object representing a feature of any dataset.
+
+    The properties are kept as they come from the API. Point features
+    also have a longitude and latitude, so they can be used with
+    SpatialIndex and LocationColumns.
+    """
+
+    spot_id: str
+    properties: dict[str, Any]
+    geometry: dict[str, Any] | None
+
+    @property
+    def longitude(self) -> float | None:
+        """Return the longitude of a point feature.
+
+        Returns
+        -------
+            The longitude, or None if the feature is not a point.
+
+        """
+        geometry = self.geometry
+        if geometry is None or geometry.get("type") != "Point":
+            return None
+        longitude: float = geometry["coordinates"][0]
+        return longitude
+
+    @property
+    def latitude(self) -> float | None:
+        """Return the latitude of a point feature.
+
+        Returns
+        -------
+            The latitude, or None if the feature is not a point.
+
+        """
+        geometry = self.geometry
+        if geometry is None or geometry.get("type") != "Point":
+            return None
+        latitude: float = geometry["coordinates"][1]
+        return latitude
+
+    @classmethod
+    def from_dict(cls: type[Feature], data: dict[str, Any]) -> Feature:
+        """Return a Feature object from a dictionary.
+
+        Args:
+        ----
+            data: The data from the API.
+
+        Returns:
+        -------
+            A Feature object.
+
+        """
+        return cls(
+            spot_id=str(data.get("id")),
+            properties=data.get("properties") or {},
+            geometry=data.get("geometry"),
+        )
+
+    @classmethod
+    def from_feature_collection(
+        cls: type[Feature], data: dict[str, Any]
+    ) -> list[Feature]:
+        """Return Feature objects from a FeatureCollection.
+
+        Unlike the models of the parking datasets, features without a
+        geometry are kept.
+
+        Args:
+        ----
+            data: The FeatureCollection from the API.
+
+        Returns:
+        -------
+            A list of Feature objects.
+
+        """
+        return [
+            cls(str(item.get("id")), item.get("properties") or {}, item.get("geometry"))
+            for item in data["features"]
+        ]
+
+
+@dataclass(slots=True)
+class Collection:
+    """Object representing a collection of a dataset of the API."""
+
+    dataset: str
+    collection_id: str
+    title: str | None
+    description: str | None
+    item_type: str | None
+    bbox: tuple[float, float, float, float] | None
+
+    @property
+    def path(self) -> str:
+        """Return the path of the collection, used to fetch its items.
+
+        Returns
+        -------
+            The dataset and collection ID, for example
+            'parkhaeuser/verkehr_parkhaeuser'.
+
+        """
+        return f"{self.dataset}/{self.collection_id}"
+
+    @classmethod
+    def from_dict(
+        cls: type[Collection], dataset: str, data: dict[str, Any]
+    ) -> Collection:
+        """Return a Collection object from a dictionary.
+
+        Args:
+        ----
+            dataset: The name of the dataset, for example 'parkhaeuser'.
+            data: The collection from the collections endpoint of the API.
+
+        Returns:
+        -------
+            A Collection object.
+
+        """
+        bboxes = (data.get("extent") or {}).get("spatial", {}).get("bbox") or []
+        bbox = None
+        if bboxes and len(bboxes[0]) == 4:
+            bbox = tuple(bboxes[0])
+        elif bboxes and len(bboxes[0]) == 6:
+            # Leave out the minimum and maximum elevation.
+            west, south, _, east, north, _ = bboxes[0]
+            bbox = (west, south, east, north)
+        return cls(
+            dataset=dataset,
+            collection_id=data["id"],
+            title=data.get("title"),
+            description=data.get("description"),
+            item_type=data.get("itemType"),
+            bbox=bbox,
+        )
+
+
+def items_uri(collection: str | Collection) -> str:
+    """Return the URI of the items of a collection.
+
+    Args:
+    ----
+        collection: A Collection object, or its path in the form
+            'dataset/collection', for example 'parkhaeuser/verkehr_parkhaeuser'.
+
+    Returns:
+    -------
+        The request URI of the items endpoint.
+
+    Raises:
+    ------
+        ValueError: If the path is not in the form 'dataset/collection'.
+
+    """
+    path = collection.path if isinstance(collection, Collection) else collection
+    dataset, _, collection_id = path.strip("/").partition("/")
+    if not dataset or not collection_id or "/" in collection_id:
+        msg = f"Invalid collection path, expected 'dataset/collection': {path!r}"
+        raise ValueError(msg)
+    return f"{dataset}/collections/{collection_id}/items"
@@ -0,0 +1,128 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+
+@dataclass
+class Change:
+    """Object representing a record that changed between two snapshots."""
+
+    previous: Any
+    current: Any
+    fields: dict[str, tuple[Any, Any]]
+
+    @property
+    def spot_id(self) -> str:
+        """Return the ID of the changed record.
+
+        Returns
+        -------
+            The spot ID.
+
+        """
+        return str(self.current.spot_id)
+
+
+@dataclass
+class Delta:
+    """Object representing the difference between two snapshots."""
+
+    added: list[Any] = field(default_factory=list)
+    removed: list[Any] = field(default_factory=list)
+    changed: list[Change] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        """Return if anything changed.
+
+        Returns
+        -------
+            True if records were added, removed or changed.
+
+        """
+        return bool(self.added or self.removed or self.changed)
+
+
+@dataclass
+class SnapshotTracker:
+    """Track a collection between polls and report what moved.
+
+    Features are compared in their raw form by ID first, so model objects
+    are only built for records that are new or have changed. Like the
+    collection methods, features without a geometry are left out.
+    """
+
+    from_dict: Callable[[dict[str, Any]], Any]
+
+    _features: dict[str, dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _items: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+
+    @property
+    def items(self) -> list[Any]:
+        """Return the records of the last snapshot.
+
+        Returns
+        -------
+            A list of model objects.
+
+        """
+        return list(self._items.values())
+
+    def update(self, features: Iterable[dict[str, Any]]) -> Delta:
+        """Compare a new snapshot with the previous one.
+
+        Args:
+        ----
+            features: The features of the new snapshot, as returned by the API.
+
+        Returns:
+        -------
+            A Delta object with the added, removed and changed records.
+
+        """
+        # The new snapshot is built aside, so a feature that fails to
+        # convert leaves the previous snapshot in place.
+        delta = Delta()
+        previous_features = self._features
+        previous_items = self._items
+        new_features: dict[str, dict[str, Any]] = {}
+        new_items: dict[str, Any] = {}
+
+        for feature in features:
+            if feature.get("geometry") is None:
+                continue
+            spot_id = str(feature.get("id"))
+            new_features[spot_id] = feature
+            previous_feature = previous_features.get(spot_id)
+            if previous_feature is not None and previous_feature == feature:
+                new_items[spot_id] = previous_items[spot_id]
+                continue
+
+            item = self.from_dict(feature)
+            new_items[spot_id] = item
+            if previous_feature is None:
+                delta.added.append(item)
+                continue
+
+            previous = previous_items[spot_id]
+            changed_fields = {
+                name: (old, new)
+                for name in (attribute.name for attribute in fields(item))
+                if (old := getattr(previous, name)) != (new := getattr(item, name))
+            }
+            if changed_fields:
+                delta.changed.append(Change(previous, item, changed_fields))
+
+        delta.removed.extend(
+            item for spot_id, item in previous_items.items() if spot_id not in new_items
+        )
+        self._features = new_features
+        self._items = new_items
+        return delta
@@ -7,3 +7,7 @@ class UDPHamburgError(Exception):
 
 class UDPHamburgConnectionError(UDPHamburgError):
     """Urban Data Platform Hamburg - connection error."""
+
+
+class UDPHamburgCircuitOpenError(UDPHamburgConnectionError):
+    """Urban Data Platform Hamburg - endpoint unavailable, failing fast."""
@@ -0,0 +1,589 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import abc
+import csv
+import io
+import json
+import types
+import typing
+from dataclasses import dataclass, field, fields, is_dataclass
+from datetime import date, datetime
+from operator import attrgetter
+from typing import IO, TYPE_CHECKING, Any, Literal, Self
+
+from .datasets import Feature
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, Callable, Iterable
+
+# Fields of the models that end up in the geometry of a GeoJSON feature.
+GEOMETRY_FIELDS = frozenset({"spot_id", "longitude", "latitude"})
+
+
+def _default(value: Any) -> Any:
+    """Return a JSON serializable form of a value.
+
+    Args:
+    ----
+        value: A value the json module cannot serialize.
+
+    Returns:
+    -------
+        The value in a form the json module can serialize.
+
+    Raises:
+    ------
+        TypeError: If the value is not supported.
+
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+def _json_dumps(value: Any) -> bytes:
+    """Encode a value as compact JSON with the json module.
+
+    Args:
+    ----
+        value: The value.
+
+    Returns:
+    -------
+        The JSON as bytes.
+
+    """
+    return json.dumps(value, default=_default, separators=(",", ":")).encode()
+
+
+def default_json_dumps() -> Callable[[Any], bytes]:
+    """Return the fastest available JSON encoder.
+
+    Returns
+    -------
+        The dumps function of orjson when it is installed, otherwise
+        one based on the json module from the standard library.
+
+    """
+    try:
+        import orjson  # noqa: PLC0415
+    except ImportError:
+        return _json_dumps
+    return orjson.dumps
+
+
+def _coordinates(geometry: dict[str, Any] | None) -> tuple[Any, Any]:
+    """Return the longitude and latitude of a point geometry.
+
+    Args:
+    ----
+        geometry: The GeoJSON geometry.
+
+    Returns:
+    -------
+        The longitude and latitude, or None for other geometries.
+
+    """
+    if geometry is None or geometry.get("type") != "Point":
+        return None, None
+    longitude, latitude = geometry["coordinates"][:2]
+    return longitude, latitude
+
+
+@dataclass(frozen=True, slots=True)
+class _Layout:
+    """The columns of a collection and a function that returns a row."""
+
+    names: tuple[str, ...]
+    values: Callable[[Any], tuple[Any, ...]]
+
+
+def _layout(item: Any) -> _Layout:
+    """Return the columns of a collection, based on its first record.
+
+    Models are read field by field. GeoJSON features, and Feature
+    objects, get a column for each property of the first record.
+
+    Args:
+    ----
+        item: The first record, a model object or a GeoJSON feature.
+
+    Returns:
+    -------
+        The layout of the rows.
+
+    """
+    if isinstance(item, dict | Feature):
+        raw = isinstance(item, dict)
+        first = item.get("properties") if isinstance(item, dict) else item.properties
+        keys = tuple(first or {})
+
+        def values(feature: Any) -> tuple[Any, ...]:
+            if raw:
+                spot_id = feature.get("id")
+                properties = feature.get("properties") or {}
+                geometry = feature.get("geometry")
+            else:
+                spot_id = feature.spot_id
+                properties = feature.properties
+                geometry = feature.geometry
+            return (
+                None if spot_id is None else str(spot_id),
+                *(properties.get(key) for key in keys),
+                *_coordinates(geometry),
+            )
+
+        return _Layout(("spot_id", *keys, "longitude", "latitude"), values)
+
+    names = tuple(item.name for item in fields(item))
+    getter = attrgetter(*names)
+    if len(names) == 1:
+        return _Layout(names, lambda model: (getter(model),))
+    return _Layout(names, getter)
+
+
+@dataclass
+class Exporter(abc.ABC):
+    """Base class of the streaming exporters.
+
+    Records are buffered and written in chunks of `chunk_size`, so a
+    collection can be streamed from one of the `iter_*` methods of the
+    client without holding all of it. Records are model objects, Feature
+    objects or the GeoJSON features of a raw page, and a collection must
+    not mix them. The file is not closed by the exporter.
+    """
+
+    file: IO[bytes]
+    chunk_size: int = 1000
+    count: int = field(default=0, init=False)
+
+    _chunk: list[Any] = field(default_factory=list, init=False, repr=False)
+    _layout: _Layout | None = field(default=None, init=False, repr=False)
+
+    def write(self, items: Iterable[Any]) -> int:
+        """Write records.
+
+        Args:
+        ----
+            items: The records, for example the result of `garages()`.
+
+        Returns:
+        -------
+            The number of records.
+
+        """
+        written = 0
+        for item in items:
+            self._add(item)
+            written += 1
+        return written
+
+    async def write_async(self, items: AsyncIterable[Any]) -> int:
+        """Write the records of an async iterator.
+
+        Args:
+        ----
+            items: For example `client.iter_garages()`.
+
+        Returns:
+        -------
+            The number of records.
+
+        """
+        written = 0
+        async for item in items:
+            self._add(item)
+            written += 1
+        return written
+
+    def write_page(self, page: bytes | dict[str, Any]) -> int:
+        """Write the features of a FeatureCollection.
+
+        Args:
+        ----
+            page: A page from `raw_items`, or the decoded FeatureCollection.
+
+        Returns:
+        -------
+            The number of features.
+
+        """
+        if isinstance(page, bytes):
+            from .hamburg import default_json_loads  # noqa: PLC0415
+
+            data: dict[str, Any] = default_json_loads()(page)
+        else:
+            data = page
+        return self.write(data["features"])
+
+    def _add(self, item: Any) -> None:
+        """Buffer a record, and write the buffer once it is full.
+
+        Args:
+        ----
+            item: The record.
+
+        """
+        if self._layout is None:
+            self._layout = _layout(item)
+        self._chunk.append(item)
+        if len(self._chunk) >= self.chunk_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the buffered records."""
+        if self._chunk and self._layout is not None:
+            self._write_chunk(self._chunk, self._layout)
+            self.count += len(self._chunk)
+            self._chunk = []
+
+    def close(self) -> None:
+        """Write the buffered records and finish the output."""
+        self.flush()
+        self._finish()
+
+    @abc.abstractmethod
+    def _write_chunk(self, chunk: list[Any], layout: _Layout) -> None:
+        """Write a chunk of records.
+
+        Args:
+        ----
+            chunk: The records.
+            layout: The columns of the collection.
+
+        """
+
+    def _finish(self) -> None:  # noqa: B027
+        """Finish the output, for example with a footer."""
+
+    def __enter__(self) -> Self:
+        """Enter the context.
+
+        Returns
+        -------
+            The exporter.
+
+        """
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Finish the output.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        self.close()
+
+
+@dataclass
+class NDJSONExporter(Exporter):
+    """Write records as newline-delimited JSON, one object per line.
+
+    Every line holds the columns of the collection, the same as a row of
+    the CSV output, whichever JSON encoder is used.
+    """
+
+    _dumps: Callable[[Any], bytes] = field(
+        default_factory=default_json_dumps, init=False, repr=False
+    )
+
+    def _write_chunk(self, chunk: list[Any], layout: _Layout) -> None:
+        """Write a chunk of records.
+
+        Args:
+        ----
+            chunk: The records.
+            layout: The columns of the collection.
+
+        """
+        dumps = self._dumps
+        names = layout.names
+        values = layout.values
+        lines = [dumps(dict(zip(names, values(item), strict=True))) for item in chunk]
+        self.file.write(b"\n".join(lines) + b"\n")
+
+
+@dataclass
+class GeoJSONExporter(Exporter):
+    """Write records as a GeoJSON FeatureCollection.
+
+    Models become Point features with their spot ID as ID, and their
+    other fields as properties.
+    """
+
+    _dumps: Callable[[Any], bytes] = field(
+        default_factory=default_json_dumps, init=False, repr=False
+    )
+    _started: bool = field(default=False, init=False, repr=False)
+
+    def _feature(self, item: Any, layout: _Layout) -> Any:
+        """Return a record as a GeoJSON feature.
+
+        Args:
+        ----
+            item: The record.
+            layout: The columns of the collection.
+
+        Returns:
+        -------
+            The GeoJSON feature.
+
+        """
+        if isinstance(item, dict):
+            return item
+        if isinstance(item, Feature):
+            geometry = item.geometry
+            properties = item.properties
+        else:
+            geometry = {
+                "type": "Point",
+                "coordinates": [item.longitude, item.latitude],
+            }
+            properties = {
+                name: value
+                for name, value in zip(layout.names, layout.values(item), strict=True)
+                if name not in GEOMETRY_FIELDS
+            }
+        return {
+            "type": "Feature",
+            "id": item.spot_id,
+            "geometry": geometry,
+            "properties": properties,
+        }
+
+    def _write_chunk(self, chunk: list[Any], layout: _Layout) -> None:
+        """Write a chunk of records.
+
+        Args:
+        ----
+            chunk: The records.
+            layout: The columns of the collection.
+
+        """
+        dumps = self._dumps
+        body = b",".join(dumps(self._feature(item, layout)) for item in chunk)
+        if self._started:
+            self.file.write(b"," + body)
+        else:
+            self.file.write(b'{"type":"FeatureCollection","features":[' + body)
+            self._started = True
+
+    def _finish(self) -> None:
+        """Close the FeatureCollection."""
+        if not self._started:
+            self.file.write(b'{"type":"FeatureCollection","features":[')
+            self._started = True
+        self.file.write(b"]}\n")
+
+
+def _csv_value(value: Any) -> Any:
+    """Return a value as it is written to a CSV file.
+
+    Args:
+    ----
+        value: The value of a field.
+
+    Returns:
+    -------
+        Dates as ISO 8601, dictionaries and lists as JSON, other values
+        as they are.
+
+    """
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, dict | list):
+        return json.dumps(value, default=_default)
+    return value
+
+
+@dataclass
+class CSVExporter(Exporter):
+    """Write records as CSV, with a header of the field names."""
+
+    encoding: str = "utf-8"
+
+    _header: bool = field(default=False, init=False, repr=False)
+
+    def _write_chunk(self, chunk: list[Any], layout: _Layout) -> None:
+        """Write a chunk of records.
+
+        Args:
+        ----
+            chunk: The records.
+            layout: The columns of the collection.
+
+        """
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator="\n")
+        if not self._header:
+            writer.writerow(layout.names)
+            self._header = True
+        values = layout.values
+        writer.writerows(
+            [_csv_value(value) for value in values(item)] for item in chunk
+        )
+        self.file.write(buffer.getvalue().encode(self.encoding))
+
+
+def _arrow_type(pa: Any, hint: Any) -> Any:
+    """Return the Arrow type of a type annotation.
+
+    Args:
+    ----
+        pa: The pyarrow module.
+        hint: The type of a field of a model.
+
+    Returns:
+    -------
+        The Arrow type, or None if the type has no Arrow counterpart.
+
+    """
+    origin = typing.get_origin(hint)
+    arguments = typing.get_args(hint)
+    if origin in {typing.Union, types.UnionType}:
+        members = [argument for argument in arguments if argument is not type(None)]
+        return _arrow_type(pa, members[0]) if len(members) == 1 else None
+    if origin is dict and len(arguments) == 2:
+        key, value = (_arrow_type(pa, argument) for argument in arguments)
+        return None if key is None or value is None else pa.map_(key, value)
+    if origin is list and len(arguments) == 1:
+        value = _arrow_type(pa, arguments[0])
+        return None if value is None else pa.list_(value)
+    return {
+        bool: pa.bool_(),
+        int: pa.int64(),
+        float: pa.float64(),
+        str: pa.string(),
+        datetime: pa.timestamp("us", tz="UTC"),
+        date: pa.date32(),
+    }.get(hint)
+
+
+@dataclass
+class ArrowExporter(Exporter):
+    """Write records as Apache Arrow or Parquet, this requires pyarrow.
+
+    Every chunk becomes a record batch, or a row group of a Parquet file.
+    The schema is inferred from the first chunk. A column without any
+    value in that chunk gets the type of its model field, or is written
+    as strings. Pass the model to write an empty file with its schema
+    when there are no records.
+    """
+
+    format: Literal["arrow", "parquet"] = "arrow"
+    model: type[Any] | None = None
+
+    _pyarrow: Any = field(default=None, init=False, repr=False)
+    _writer: Any = field(default=None, init=False, repr=False)
+    _schema: Any = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Import pyarrow.
+
+        Raises
+        ------
+            ImportError: If pyarrow is not installed.
+
+        """
+        try:
+            import pyarrow as pa  # noqa: PLC0415
+        except ImportError as exception:
+            msg = f"Exporting to {self.format} requires pyarrow"
+            raise ImportError(msg) from exception
+        self._pyarrow = pa
+
+    def _field_types(self, model: type[Any]) -> dict[str, Any]:
+        """Return the Arrow types of the fields of a model.
+
+        Args:
+        ----
+            model: The dataclass of the records.
+
+        Returns:
+        -------
+            The Arrow type of every field that has one.
+
+        """
+        try:
+            hints = typing.get_type_hints(model)
+        except (NameError, TypeError):
+            return {}
+        pa = self._pyarrow
+        arrow_types = {name: _arrow_type(pa, hint) for name, hint in hints.items()}
+        return {name: value for name, value in arrow_types.items() if value is not None}
+
+    def _open(self, schema: Any) -> None:
+        """Open the Arrow or Parquet writer.
+
+        Args:
+        ----
+            schema: The Arrow schema of the file.
+
+        """
+        pa = self._pyarrow
+        self._schema = schema
+        if self.format == "parquet":
+            import pyarrow.parquet as pq  # noqa: PLC0415
+
+            self._writer = pq.ParquetWriter(self.file, schema)
+        else:
+            self._writer = pa.ipc.new_stream(self.file, schema)
+
+    def _write_chunk(self, chunk: list[Any], layout: _Layout) -> None:
+        """Write a chunk of records.
+
+        Args:
+        ----
+            chunk: The records.
+            layout: The columns of the collection.
+
+        """
+        pa = self._pyarrow
+        values = layout.values
+        data = dict(
+            zip(
+                layout.names,
+                (list(column) for column in zip(*map(values, chunk), strict=True)),
+                strict=True,
+            )
+        )
+        if self._writer is None:
+            item = chunk[0]
+            field_types: dict[str, Any] = {}
+            if is_dataclass(item) and not isinstance(item, Feature):
+                field_types = self._field_types(type(item))
+            # A column without any value in the first chunk gets the type of
+            # its field, or is written as strings.
+            self._open(
+                pa.schema(
+                    column.with_type(field_types.get(column.name, pa.string()))
+                    if pa.types.is_null(column.type)
+                    else column
+                    for column in pa.table(data).schema
+                )
+            )
+        try:
+            table = pa.table(data, self._schema)
+        except (pa.ArrowInvalid, pa.ArrowTypeError):
+            # An inferred column may get values of another type later on.
+            table = pa.table(data).cast(self._schema)
+        self._writer.write_table(table)
+
+    def _finish(self) -> None:
+        """Close the Arrow or Parquet writer, with an empty file if needed."""
+        if self._writer is None:
+            pa = self._pyarrow
+            columns = []
+            if self.model is not None:
+                field_types = self._field_types(self.model)
+                columns = [
+                    (item.name, field_types.get(item.name, pa.string()))
+                    for item in fields(self.model)
+                ]
+            self._open(pa.schema(columns))
+        self._writer.close()
@@ -0,0 +1,122 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+# Property names that can be written in a CQL2 expression without quotes.
+IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+KEYWORDS = frozenset(
+    {"AND", "BETWEEN", "FALSE", "IN", "IS", "LIKE", "NOT", "NULL", "OR", "TRUE"}
+)
+
+
+def cql_property(name: str) -> str:
+    """Return a property name as it is written in a CQL2 expression.
+
+    Args:
+    ----
+        name: The name of the property.
+
+    Returns:
+    -------
+        The name, double-quoted unless it is a plain identifier.
+
+    """
+    if IDENTIFIER.fullmatch(name) and name.upper() not in KEYWORDS:
+        return name
+    text = name.replace('"', '""')
+    return f'"{text}"'
+
+
+def cql_literal(value: Any) -> str:
+    """Return a value as a CQL2 text literal.
+
+    Args:
+    ----
+        value: A string, number or boolean.
+
+    Returns:
+    -------
+        The literal, strings are quoted.
+
+    """
+    if isinstance(value, bool):
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, int | float):
+        return repr(value)
+    text = str(value).replace("'", "''")
+    return f"'{text}'"
+
+
+@dataclass(frozen=True, slots=True)
+class Query:
+    """Object representing the filters sent along with a collection request.
+
+    The filtering is done by the API, so only the matching features and
+    the requested properties are downloaded.
+
+    - bbox: Only return features within (min longitude, min latitude,
+      max longitude, max latitude).
+    - where: Only return features of which the properties have these
+      values. Property names that are not plain identifiers are quoted.
+    - cql: Only return features matching a CQL2 text filter expression,
+      for example `"frei > 10"`.
+    - properties: Only return these properties of the features. Note that
+      these are the property names of the dataset, the fields of the model
+      for properties left out are None.
+    """
+
+    bbox: tuple[float, float, float, float] | None = None
+    where: Mapping[str, Any] = field(default_factory=dict)
+    cql: str | None = None
+    properties: Sequence[str] | None = None
+
+    @property
+    def filter(self) -> str | None:
+        """Return the CQL2 text filter expression of the query.
+
+        Returns
+        -------
+            The conditions of `where` and `cql` joined with AND, or None
+            without conditions.
+
+        """
+        conditions = [
+            f"{cql_property(name)} = {cql_literal(value)}"
+            for name, value in self.where.items()
+        ]
+        if self.cql:
+            conditions.append(f"({self.cql})" if conditions else self.cql)
+        return " AND ".join(conditions) or None
+
+    def params(self, set_filter: str | None = None) -> dict[str, Any]:
+        """Return the query parameters of the OGC API request.
+
+        Args:
+        ----
+            set_filter: An extra filter expression to join with AND.
+
+        Returns:
+        -------
+            A dictionary with the bbox, filter and properties parameters.
+
+        """
+        params: dict[str, Any] = {}
+        if self.bbox is not None:
+            params["bbox"] = ",".join(str(value) for value in self.bbox)
+        expression = self.filter
+        if set_filter is not None:
+            expression = (
+                f"({set_filter}) AND ({expression})" if expression else set_filter
+            )
+        if expression is not None:
+            params["filter"] = expression
+        if self.properties is not None:
+            params["properties"] = ",".join(self.properties)
+        return params
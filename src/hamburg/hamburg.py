@@ -3,19 +3,235 @@
 from __future__ import annotations
 
 import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import itertools
+import json
 import socket
-from dataclasses import dataclass
-from importlib import metadata
-from typing import Any, Self
+import time
+from dataclasses import dataclass, field
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, Self
 
-from aiohttp import ClientError, ClientSession
-from aiohttp.hdrs import METH_GET
+from aiohttp import ClientError, ClientResponse, ClientSession
+from aiohttp.hdrs import ETAG, LAST_MODIFIED, METH_GET
 from yarl import URL
 
-from .exceptions import UDPHamburgConnectionError, UDPHamburgError
-from .models import DisabledParking, Garage, ParkAndRide
+from .cache import CacheEntry, ResponseCache
+from .connection import ConnectionSettings
+from .datasets import Collection, Feature, items_uri
+from .delta import Delta, SnapshotTracker
+from .exceptions import (
+    UDPHamburgCircuitOpenError,
+    UDPHamburgConnectionError,
+    UDPHamburgError,
+)
+from .models import DisabledParking, Garage, ParkAndRide, decode_features
+from .poller import Poller
+from .retry import CircuitBreaker, RetryPolicy
 
-VERSION = metadata.version(__package__)
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+    from concurrent.futures import Executor
+    from contextlib import AbstractContextManager
+
+    from .filters import Query
+    from .instrumentation import Instrumentation
+    from .models import Accessor
+    from .scheduler import RequestScheduler
+
+API_URL = "https://api.hamburg.de/datasets/v1/"
+
+# Items are GeoJSON, the other endpoints such as the collections are JSON.
+JSON_CONTENT_TYPES = ("application/geo+json", "application/json")
+
+DISABLED_PARKINGS = (
+    "behindertenstellplaetze/collections/verkehr_behindertenparkpl/items"
+)
+PARK_AND_RIDES = "p_und_r/collections/p_und_r/items"
+GARAGES = "parkhaeuser/collections/verkehr_parkhaeuser/items"
+
+
+@functools.cache
+def package_version() -> str:
+    """Return the version of the package.
+
+    The package metadata is read on first use, for example by the first
+    request, and not when the module is imported.
+
+    Returns
+    -------
+        The version of the package.
+
+    """
+    from importlib import metadata  # noqa: PLC0415
+
+    return metadata.version(__package__)
+
+
+@functools.cache
+def user_agent() -> str:
+    """Return the User-Agent header of the requests.
+
+    Returns
+    -------
+        The User-Agent, with the version of the package.
+
+    """
+    return f"PythonUDPHamburg/{package_version()}"
+
+
+def __getattr__(name: str) -> Any:
+    """Return the attributes that are loaded on first use.
+
+    Args:
+    ----
+        name: The name of the attribute.
+
+    Returns:
+    -------
+        The version of the package for VERSION.
+
+    Raises:
+    ------
+        AttributeError: If the module has no such attribute.
+
+    """
+    if name == "VERSION":
+        return package_version()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@functools.cache
+def default_json_loads() -> Callable[[bytes], Any]:
+    """Return the fastest available JSON decoder.
+
+    Returns
+    -------
+        The loads function of orjson when it is installed, otherwise
+        the one of the json module from the standard library.
+
+    """
+    try:
+        import orjson  # noqa: PLC0415
+    except ImportError:
+        return json.loads
+    return orjson.loads
+
+
+def _api_url(uri: str, api_url: str) -> URL:
+    """Return the URL of an endpoint of the Urban Data Platform API.
+
+    Args:
+    ----
+        uri: Request URI, without '/', for example, 'status'
+        api_url: The base URL of the API.
+
+    Returns:
+    -------
+        The URL without query string.
+
+    """
+    return URL(api_url).join(URL(uri))
+
+
+def _decode_page(
+    model: Callable[..., Any], fields: dict[str, Accessor], page: dict[str, Any]
+) -> list[Any]:
+    """Return the model objects of a page, using a mapping table.
+
+    Args:
+    ----
+        model: The model class to create.
+        fields: The mapping table of model field names to accessors.
+        page: The FeatureCollection of the page.
+
+    Returns:
+    -------
+        A list of model objects.
+
+    """
+    return decode_features(model, fields, page["features"])
+
+
+def _decode_models(
+    loads: Callable[[bytes], Any],
+    decoder: Callable[[dict[str, Any]], list[Any]],
+    body: bytes,
+) -> tuple[list[Any], int, int | None]:
+    """Decode a page and build its model objects, in an executor.
+
+    Only the models and the counts of the page are returned, so with a
+    process pool the decoded page is not sent back to the event loop.
+
+    Args:
+    ----
+        loads: The JSON decoder.
+        decoder: The batch decoder of the model.
+        body: The undecoded FeatureCollection of the page.
+
+    Returns:
+    -------
+        The model objects, the number of features on the page and the
+        number of matched features, if the API reported it.
+
+    """
+    page = loads(body)
+    return decoder(page), len(page["features"]), page.get("numberMatched")
+
+
+def _endpoint(uri: str) -> str:
+    """Return the endpoint of a request, used to group metrics and failures.
+
+    Args:
+    ----
+        uri: Request URI, without '/', for example, 'status'
+
+    Returns:
+    -------
+        The first segment of the URI, the dataset name.
+
+    """
+    return uri.split("/", 1)[0]
+
+
+def _request_key(uri: str, params: dict[str, Any] | None, api_url: str) -> str:
+    """Return the full URL of a request, used as key for the cache.
+
+    Args:
+    ----
+        uri: Request URI, without '/', for example, 'status'
+        params: Extra options to improve or limit the response.
+        api_url: The base URL of the API.
+
+    Returns:
+    -------
+        The URL including the query string.
+
+    """
+    url = _api_url(uri, api_url)
+    return str(url.update_query(params) if params else url)
+
+
+def _query_params(query: Query | None, set_filter: str | None = None) -> dict[str, Any]:
+    """Return the query parameters of a filtered collection request.
+
+    Args:
+    ----
+        query: The filters of the request.
+        set_filter: A filter expression, joined with the query using AND.
+
+    Returns:
+    -------
+        The parameters for the OGC API request.
+
+    """
+    if query is not None:
+        return query.params(set_filter)
+    return {} if set_filter is None else {"filter": str(set_filter)}
 
 
 @dataclass
@@ -24,8 +240,25 @@ class UDPHamburg:
 
     request_timeout: float = 10.0
     session: ClientSession | None = None
+    page_size: int = 1000
+    max_concurrent_requests: int = 5
+    cache: ResponseCache | None = None
+    json_loads: Callable[[bytes], Any] | None = None
+    connection: ConnectionSettings = field(default_factory=ConnectionSettings)
+    retry: RetryPolicy | None = None
+    circuit_breaker: CircuitBreaker | None = None
+    scheduler: RequestScheduler | None = None
+    api_url: str = API_URL
+    instrumentation: Instrumentation | None = None
+    executor: Executor | None = None
 
     _close_session: bool = False
+    _in_flight: dict[str, asyncio.Future[Any]] = field(default_factory=dict, repr=False)
+    _trackers: dict[str, SnapshotTracker] = field(default_factory=dict, repr=False)
+    _pollers: list[Poller] = field(default_factory=list, repr=False)
+    _decoders: dict[str, Callable[[dict[str, Any]], list[Any]]] = field(
+        default_factory=dict, repr=False
+    )
 
     async def _request(
         self,
@@ -33,19 +266,85 @@ class UDPHamburg:
         *,
         method: str = METH_GET,
         params: dict[str, Any] | None = None,
+        raw: bool = False,
     ) -> Any:
         """Handle a request to the Urban Data Platform API of Hamburg.
 
+        Fresh responses are served from the cache, and concurrent identical
+        GET requests share a single in-flight request and its result.
+
         Args:
         ----
             uri: Request URI, without '/', for example, 'status'
             method: HTTP method to use, for example, 'GET'
             params: Extra options to improve or limit the response.
+            raw: Return the undecoded response body.
 
         Returns:
         -------
             A Python dictionary (text) with the response from
-            the Urban Data Platform API.
+            the Urban Data Platform API, or the bytes of the body
+            when raw is set.
+
+        """
+        if method != METH_GET:
+            return await self._fetch(uri, method, params, raw=raw)
+
+        url = _request_key(uri, params, self.api_url)
+        cached: CacheEntry | None = None
+        if self.cache is not None and not raw:
+            cached = self.cache.get(url)
+            if cached is not None and cached.fresh:
+                self._count(uri, "cache_hits")
+                return cached.data
+
+        key = f"{url} raw" if raw else url
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                self._fetch(uri, method, params, raw=raw, cached=cached)
+            )
+            self._in_flight[key] = task
+            task.add_done_callback(functools.partial(self._request_done, key))
+        return await asyncio.shield(task)
+
+    def _request_done(self, key: str, task: asyncio.Future[Any]) -> None:
+        """Forget a finished in-flight request.
+
+        Args:
+        ----
+            key: The key of the in-flight request.
+            task: The finished request.
+
+        """
+        if self._in_flight.get(key) is task:
+            del self._in_flight[key]
+        # Mark the exception as retrieved, in case all callers were cancelled.
+        if not task.cancelled():
+            task.exception()
+
+    async def _fetch(
+        self,
+        uri: str,
+        method: str,
+        params: dict[str, Any] | None,
+        *,
+        raw: bool = False,
+        cached: CacheEntry | None = None,
+    ) -> Any:
+        """Send a request to the Urban Data Platform API and decode the response.
+
+        Args:
+        ----
+            uri: Request URI, without '/', for example, 'status'
+            method: HTTP method to use, for example, 'GET'
+            params: Extra options to improve or limit the response.
+            raw: Return the undecoded response body.
+            cached: The cached entry to revalidate with this request.
+
+        Returns:
+        -------
+            The decoded response, or the bytes of the body when raw is set.
 
         Raises:
         ------
@@ -54,44 +353,28 @@ class UDPHamburg:
             UDPHamburgError: If the data is not valid.
 
         """
-        url = URL.build(
-            scheme="https",
-            host="api.hamburg.de",
-            path="/datasets/v1/",
-        ).join(URL(uri))
-
         headers = {
-            "Accept": "application/geo+json",
-            "User-Agent": f"PythonUDPHamburg/{VERSION}",
+            "Accept": "application/geo+json, application/json;q=0.9",
+            "Accept-Encoding": self.connection.accept_encoding,
+            "User-Agent": user_agent(),
         }
+        if cached is not None:
+            headers.update(cached.validators)
 
-        if self.session is None:
-            self.session = ClientSession()
-            self._close_session = True
+        response = await self._send(uri, method, params, headers)
 
-        try:
-            async with asyncio.timeout(self.request_timeout):
-                response = await self.session.request(
-                    method,
-                    url,
-                    params=params,
-                    headers=headers,
-                    ssl=True,
-                )
-                response.raise_for_status()
-        except TimeoutError as exception:
-            msg = "Timeout occurred while connecting to the Urban Data Platform API."
-            raise UDPHamburgConnectionError(
-                msg,
-            ) from exception
-        except (ClientError, socket.gaierror) as exception:
-            msg = "Error occurred while communicating with Urban Data Platform API."
-            raise UDPHamburgConnectionError(
-                msg,
-            ) from exception
+        cache = self.cache if method == METH_GET and not raw else None
+        if (
+            cache is not None
+            and cached is not None
+            and response.status == HTTPStatus.NOT_MODIFIED
+        ):
+            cached.expires_at = time.monotonic() + cache.ttl(uri)
+            self._count(uri, "not_modified")
+            return cached.data
 
         content_type = response.headers.get("Content-Type", "")
-        if "application/geo+json" not in content_type:
+        if not content_type.startswith(JSON_CONTENT_TYPES):
             text = await response.text()
             msg = "Unexpected content type response from the Urban Data Platform API"
             raise UDPHamburgError(
@@ -99,86 +382,712 @@ class UDPHamburg:
                 {"Content-Type": content_type, "Response": text},
             )
 
-        return await response.json()
+        body = await response.read()
+        self._count(uri, "bytes_received", len(body))
+        if raw:
+            return body
 
-    async def disabled_parkings(
+        loads = self.json_loads or default_json_loads()
+        with self._measure(uri, "decode") as attributes:
+            attributes["size"] = len(body)
+            data = await self._offload(loads, body)
+        if cache is not None:
+            cache.set(
+                _request_key(uri, params, self.api_url),
+                CacheEntry(
+                    data=data,
+                    expires_at=time.monotonic() + cache.ttl(uri),
+                    etag=response.headers.get(ETAG),
+                    last_modified=response.headers.get(LAST_MODIFIED),
+                ),
+            )
+        return data
+
+    async def _send(
         self,
+        uri: str,
+        method: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+    ) -> ClientResponse:
+        """Send a request, retrying transient failures with backoff.
+
+        Args:
+        ----
+            uri: Request URI, without '/', for example, 'status'
+            method: HTTP method to use, for example, 'GET'
+            params: Extra options to improve or limit the response.
+            headers: The request headers.
+
+        Returns:
+        -------
+            The response of the Urban Data Platform API.
+
+        Raises:
+        ------
+            UDPHamburgCircuitOpenError: The endpoint keeps failing and
+                requests to it are not sent for a while.
+            UDPHamburgConnectionError: Timeout occurred while
+                connecting to the Urban Data Platform API.
+
+        """
+        endpoint = _endpoint(uri)
+        breaker = self.circuit_breaker
+        if breaker is not None and not breaker.allow(endpoint):
+            msg = f"Too many failed requests to the {endpoint} endpoint, not retrying."
+            raise UDPHamburgCircuitOpenError(msg)
+
+        if self.session is None:
+            self.session = self.connection.create_session(
+                [self.instrumentation.trace_config()]
+                if self.instrumentation is not None
+                else None
+            )
+            self._close_session = True
+
+        policy = self.retry or RetryPolicy(attempts=1)
+        attempt = 0
+        scheduler = self.scheduler
+        while True:
+            slot = (
+                scheduler.slot(scheduler.priority(endpoint))
+                if scheduler is not None
+                else contextlib.nullcontext()
+            )
+            self._count(uri, "requests")
+            try:
+                async with slot:
+                    async with asyncio.timeout(self.request_timeout):
+                        response = await self.session.request(
+                            method,
+                            _api_url(uri, self.api_url),
+                            params=params,
+                            headers=headers,
+                            ssl=True,
+                            trace_request_ctx={"hamburg_endpoint": endpoint},
+                        )
+                        response.raise_for_status()
+                    # Download within the slot, the body is kept on the response.
+                    with self._measure(uri, "download"):
+                        await response.read()
+            except (TimeoutError, ClientError, socket.gaierror) as exception:
+                attempt += 1
+                transient = policy.is_transient(exception)
+                if transient and attempt < policy.attempts:
+                    self._count(uri, "retries")
+                    await asyncio.sleep(policy.delay(attempt - 1, exception))
+                    continue
+                self._count(uri, "errors")
+                if transient and breaker is not None:
+                    breaker.record_failure(endpoint)
+                if isinstance(exception, TimeoutError):
+                    msg = (
+                        "Timeout occurred while connecting to the "
+                        "Urban Data Platform API."
+                    )
+                else:
+                    msg = (
+                        "Error occurred while communicating with "
+                        "Urban Data Platform API."
+                    )
+                raise UDPHamburgConnectionError(msg) from exception
+
+            if breaker is not None:
+                breaker.record_success(endpoint)
+            return response
+
+    def _measure(self, uri: str, stage: str) -> AbstractContextManager[dict[str, Any]]:
+        """Time a stage of a request, when the client is instrumented.
+
+        Args:
+        ----
+            uri: Request URI, without '/', for example, 'status'
+            stage: The name of the stage, see instrumentation.STAGES.
+
+        Returns:
+        -------
+            A context manager that yields the attributes of the timing.
+
+        """
+        if self.instrumentation is None:
+            return contextlib.nullcontext({})
+        return self.instrumentation.measure(_endpoint(uri), stage)
+
+    def _count(self, uri: str, counter: str, amount: int = 1) -> None:
+        """Increase a counter, when the client is instrumented.
+
+        Args:
+        ----
+            uri: Request URI, without '/', for example, 'status'
+            counter: The name of the counter, see EndpointMetrics.
+            amount: The amount to add.
+
+        """
+        if self.instrumentation is not None:
+            self.instrumentation.count(_endpoint(uri), counter, amount)
+
+    async def _offload(self, func: Callable[[Any], Any], argument: Any) -> Any:
+        """Run CPU-bound work in the executor, so it does not block the loop.
+
+        Args:
+        ----
+            func: The function, for example the JSON decoder.
+            argument: The argument of the function.
+
+        Returns:
+        -------
+            The result of the function, run directly without executor.
+
+        """
+        if self.executor is None or isinstance(
+            self.executor, concurrent.futures.ProcessPoolExecutor
+        ):
+            # Sending the result back from a process costs about as much as
+            # the work itself, pages are sent to processes by _page instead.
+            return func(argument)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, func, argument)
+
+    async def _models(
+        self,
+        uri: str,
+        from_feature_collection: Callable[[dict[str, Any]], list[Any]],
+        page: dict[str, Any],
+    ) -> list[Any]:
+        """Build the model objects of a page, timed as the models stage.
+
+        Args:
+        ----
+            uri: Request URI, without '/', for example, 'status'
+            from_feature_collection: The batch decoder of the model.
+            page: The FeatureCollection of the page.
+
+        Returns:
+        -------
+            A list of model objects.
+
+        """
+        with self._measure(uri, "models") as attributes:
+            items: list[Any] = await self._offload(from_feature_collection, page)
+            attributes["count"] = len(items)
+        self._count(uri, "models", len(items))
+        return items
+
+    async def _page(
+        self,
+        uri: str,
+        params: dict[str, Any],
+        decoder: Callable[[dict[str, Any]], list[Any]] | None,
+    ) -> tuple[Any, int, int | None]:
+        """Fetch a page of a collection, and build its models with a decoder.
+
+        With a decoder and an executor, the undecoded body is sent to the
+        executor in a single task that decodes the JSON and builds the
+        models, so only the models come back. Pages are then not kept in
+        the response cache, so with a cache the JSON is decoded here.
+
+        Args:
+        ----
+            uri: Request URI of the collection items.
+            params: Options of the request, such as the limit and offset.
+            decoder: The batch decoder of the model, None for the page.
+
+        Returns:
+        -------
+            The FeatureCollection, or the model objects with a decoder,
+            the number of features on the page and the number of matched
+            features, if the API reported it.
+
+        """
+        if decoder is not None and self.executor is not None and self.cache is None:
+            body: bytes = await self._request(uri, params=params, raw=True)
+            loads = self.json_loads or default_json_loads()
+            loop = asyncio.get_running_loop()
+            with self._measure(uri, "models") as attributes:
+                items, returned, matched = await loop.run_in_executor(
+                    self.executor, _decode_models, loads, decoder, body
+                )
+                attributes["count"] = len(items)
+            self._count(uri, "models", len(items))
+            return items, returned, matched
+
+        page: dict[str, Any] = await self._request(uri, params=params)
+        returned = len(page["features"])
+        matched = page.get("numberMatched")
+        if decoder is None:
+            return page, returned, matched
+        return await self._models(uri, decoder, page), returned, matched
+
+    async def _iter_pages(
+        self,
+        uri: str,
+        *,
+        limit: int | None,
+        params: dict[str, Any] | None = None,
+        decoder: Callable[[dict[str, Any]], list[Any]] | None = None,
+    ) -> AsyncIterator[Any]:
+        """Yield the pages of a collection in order, as soon as each arrives.
+
+        With a limit a single page is requested. Without a limit, the first
+        page tells how many items are matched in total, after which the
+        remaining pages are planned by offset and fetched concurrently, in
+        a window of `max_concurrent_requests` pages that moves on as pages
+        are yielded.
+
+        Args:
+        ----
+            uri: Request URI of the collection items.
+            limit: Number of items to return, None to return all items.
+            params: Extra options to limit the response, for example a filter.
+            decoder: The batch decoder of a model, to yield the models of
+                every page instead of the page itself.
+
+        Yields:
+        ------
+            A FeatureCollection for every page of the collection, or a list
+            of model objects with a decoder.
+
+        """
+        if limit is not None:
+            page, _, _ = await self._page(
+                uri, {**(params or {}), "limit": limit}, decoder
+            )
+            yield page
+            return
+
+        params = {**(params or {}), "limit": self.page_size}
+        first, returned, matched = await self._page(uri, params, decoder)
+        yield first
+
+        if returned == 0 or (matched is not None and returned >= matched):
+            return
+
+        if matched is None:
+            # Without a total count, walk the pages one by one until a short
+            # page. The server may cap the page size, so a page is short when
+            # it holds fewer items than the first one.
+            offset = step = returned
+            while returned >= step:
+                page, returned, _ = await self._page(
+                    uri, {**params, "offset": offset}, decoder
+                )
+                offset += returned
+                yield page
+            return
+
+        # The server may cap the page size, so step by what it actually returned.
+        async def fetch_page(offset: int) -> Any:
+            page, _, _ = await self._page(
+                uri, {**params, "limit": returned, "offset": offset}, decoder
+            )
+            return page
+
+        # Pages are fetched in a window that only moves on once the oldest
+        # page is yielded, so a slow consumer does not pile up pages.
+        offsets = iter(range(returned, matched, returned))
+        window = collections.deque(
+            asyncio.ensure_future(fetch_page(offset))
+            for offset in itertools.islice(
+                offsets, max(self.max_concurrent_requests, 1)
+            )
+        )
+        try:
+            while window:
+                page = await window[0]
+                window.popleft()
+                window.extend(
+                    asyncio.ensure_future(fetch_page(offset))
+                    for offset in itertools.islice(offsets, 1)
+                )
+                yield page
+        finally:
+            for task in window:
+                task.cancel()
+            await asyncio.gather(*window, return_exceptions=True)
+
+    async def _request_items(
+        self,
+        uri: str,
+        *,
+        limit: int | None,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch a single page of items, or all items when no limit is given.
+
+        Args:
+        ----
+            uri: Request URI of the collection items.
+            limit: Number of items to return, None to return all items.
+            params: Extra options to limit the response, for example a filter.
+
+        Returns:
+        -------
+            A FeatureCollection with the features of all pages combined.
+
+        """
+        collection: dict[str, Any] = {}
+        async for page in self._iter_pages(uri, limit=limit, params=params):
+            if not collection:
+                # Copy the page, as it may be shared with the response cache.
+                collection = {**page, "features": list(page["features"])}
+            else:
+                collection["features"].extend(page["features"])
+        collection["numberReturned"] = len(collection["features"])
+        return collection
+
+    async def raw_items(
+        self,
+        uri: str,
+        *,
         limit: int = 10,
+        offset: int = 0,
+        params: dict[str, Any] | None = None,
+    ) -> bytes:
+        """Get a page of items as the undecoded GeoJSON from the API.
+
+        Useful to forward the data to another service without decoding it.
+
+        Args:
+        ----
+            uri: Request URI of the collection items, for example
+                'parkhaeuser/collections/verkehr_parkhaeuser/items'.
+            limit: Number of items to return.
+            offset: Number of items to skip.
+            params: Extra options to limit the response, for example a filter.
+
+        Returns:
+        -------
+            The GeoJSON FeatureCollection as bytes.
+
+        """
+        body: bytes = await self._request(
+            uri,
+            params={**(params or {}), "limit": limit, "offset": offset},
+            raw=True,
+        )
+        return body
+
+    async def iter_disabled_parkings(
+        self,
+        limit: int | None = None,
+        query: Query | None = None,
+    ) -> AsyncIterator[DisabledParking]:
+        """Iterate over disabled parking spaces, page by page as they arrive.
+
+        Args:
+        ----
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
+
+        Yields:
+        ------
+            A DisabledParking object.
+
+        """
+        async for items in self._iter_pages(
+            DISABLED_PARKINGS,
+            limit=limit,
+            params=query.params() if query else None,
+            decoder=DisabledParking.from_feature_collection,
+        ):
+            for item in items:
+                yield item
+
+    async def iter_park_and_rides(
+        self,
+        limit: int | None = None,
+        query: Query | None = None,
+    ) -> AsyncIterator[ParkAndRide]:
+        """Iterate over park and ride spaces, page by page as they arrive.
+
+        Args:
+        ----
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
+
+        Yields:
+        ------
+            A ParkAndRide object.
+
+        """
+        async for items in self._iter_pages(
+            PARK_AND_RIDES,
+            limit=limit,
+            params=query.params() if query else None,
+            decoder=ParkAndRide.from_feature_collection,
+        ):
+            for item in items:
+                yield item
+
+    async def iter_garages(
+        self,
+        limit: int | None = None,
+        set_filter: str | None = None,
+        query: Query | None = None,
+    ) -> AsyncIterator[Garage]:
+        """Iterate over garages, page by page as they arrive.
+
+        Args:
+        ----
+            limit: Number of items to return, None to fetch all items.
+            set_filter: Filter the garages by a defined filter expression.
+            query: Filter the garages on the server, see Query.
+
+        Yields:
+        ------
+            A Garage object.
+
+        """
+        params = _query_params(query, set_filter)
+
+        async for items in self._iter_pages(
+            GARAGES,
+            limit=limit,
+            params=params,
+            decoder=Garage.from_feature_collection,
+        ):
+            for item in items:
+                yield item
+
+    async def disabled_parkings(
+        self,
+        limit: int | None = 10,
+        query: Query | None = None,
     ) -> list[DisabledParking]:
         """Get all disabled parking spaces.
 
         Args:
         ----
-            limit: Number of items to return.
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
 
         Returns:
         -------
             A list of DisabledParking objects.
 
         """
-        locations = await self._request(
-            "behindertenstellplaetze/collections/verkehr_behindertenparkpl/items",
-            params={"limit": limit},
-        )
-        return [DisabledParking.from_dict(item) for item in locations["features"]]
+        return [item async for item in self.iter_disabled_parkings(limit, query)]
 
     async def park_and_rides(
         self,
-        limit: int = 10,
+        limit: int | None = 10,
+        query: Query | None = None,
     ) -> list[ParkAndRide]:
         """Get all park and ride spaces.
 
         Args:
         ----
-            limit: Number of items to return.
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
 
         Returns:
         -------
             A list of ParkAndRide objects.
 
         """
-        locations = await self._request(
-            "p_und_r/collections/p_und_r/items",
-            params={"limit": limit},
-        )
-        return [ParkAndRide.from_dict(item) for item in locations["features"]]
+        return [item async for item in self.iter_park_and_rides(limit, query)]
 
     async def garages(
         self,
-        limit: int = 10,
+        limit: int | None = 10,
         set_filter: str | None = None,
+        query: Query | None = None,
     ) -> list[Garage]:
         """Get all garages.
 
         Args:
         ----
-            limit: Number of items to return.
+            limit: Number of items to return, None to fetch all items.
             set_filter: Filter the garages by a defined filter expression.
+            query: Filter the garages on the server, see Query.
 
         Returns:
         -------
             A list of Garage objects.
 
         """
-        params: dict[str, Any] = {"limit": limit}
+        return [item async for item in self.iter_garages(limit, set_filter, query)]
 
-        if set_filter is not None:
-            params["filter"] = str(set_filter)
+    async def park_and_ride_changes(self, query: Query | None = None) -> Delta:
+        """Get the park and ride spaces that changed since the previous call.
 
-        locations = await self._request(
-            "parkhaeuser/collections/verkehr_parkhaeuser/items",
-            params=params,
+        The first call reports every park and ride space as added.
+
+        Args:
+        ----
+            query: Filter the park and ride spaces on the server, see Query.
+
+        Returns:
+        -------
+            A Delta object with the added, removed and changed ParkAndRide objects.
+
+        """
+        params = _query_params(query)
+        tracker = self._trackers.setdefault(
+            _request_key(PARK_AND_RIDES, params, self.api_url),
+            SnapshotTracker(ParkAndRide.from_dict),
         )
+        locations = await self._request_items(PARK_AND_RIDES, limit=None, params=params)
+        return tracker.update(locations["features"])
+
+    async def garage_changes(
+        self,
+        set_filter: str | None = None,
+        query: Query | None = None,
+    ) -> Delta:
+        """Get the garages that changed since the previous call.
+
+        The first call reports every garage as added.
+
+        Args:
+        ----
+            set_filter: Filter the garages by a defined filter expression.
+            query: Filter the garages on the server, see Query.
+
+        Returns:
+        -------
+            A Delta object with the added, removed and changed Garage objects.
+
+        """
+        params = _query_params(query, set_filter)
+        tracker = self._trackers.setdefault(
+            _request_key(GARAGES, params, self.api_url),
+            SnapshotTracker(Garage.from_dict),
+        )
+        locations = await self._request_items(GARAGES, limit=None, params=params)
+        return tracker.update(locations["features"])
+
+    async def collections(self, dataset: str) -> list[Collection]:
+        """Get the collections of a dataset.
+
+        Args:
+        ----
+            dataset: The name of the dataset, for example 'parkhaeuser'.
+
+        Returns:
+        -------
+            A list of Collection objects.
 
-        # By default filter out garages without location coordinates.
+        """
+        data = await self._request(f"{dataset}/collections")
+        return [Collection.from_dict(dataset, item) for item in data["collections"]]
+
+    def register_model(
+        self,
+        collection: str | Collection,
+        model: Any,
+        fields: dict[str, Accessor] | None = None,
+    ) -> None:
+        """Decode the items of a collection into a model class.
+
+        Args:
+        ----
+            collection: A Collection object, or its path in the form
+                'dataset/collection'.
+            model: The model class. Without fields, it needs a
+                from_feature_collection class method.
+            fields: The mapping table of the model fields onto the
+                properties of the collection, see decode_features.
+
+        """
+        decoder: Callable[[dict[str, Any]], list[Any]]
+        if fields is None:
+            decoder = model.from_feature_collection
+        else:
+            decoder = functools.partial(_decode_page, model, fields)
+        self._decoders[items_uri(collection)] = decoder
+
+    async def iter_items(
+        self,
+        collection: str | Collection,
+        *,
+        limit: int | None = None,
+        query: Query | None = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the items of any collection, page by page.
+
+        Args:
+        ----
+            collection: A Collection object, or its path in the form
+                'dataset/collection'.
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
+
+        Yields:
+        ------
+            An object of the registered model, or else a Feature object.
+
+        """
+        uri = items_uri(collection)
+        decoder = self._decoders.get(uri, Feature.from_feature_collection)
+        async for items in self._iter_pages(
+            uri,
+            limit=limit,
+            params=query.params() if query else None,
+            decoder=decoder,
+        ):
+            for item in items:
+                yield item
+
+    async def items(
+        self,
+        collection: str | Collection,
+        *,
+        limit: int | None = 10,
+        query: Query | None = None,
+    ) -> list[Any]:
+        """Get the items of any collection.
+
+        Args:
+        ----
+            collection: A Collection object, or its path in the form
+                'dataset/collection'.
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
+
+        Returns:
+        -------
+            A list of objects of the registered model, or else of
+            Feature objects.
+
+        """
         return [
-            Garage.from_dict(item)
-            for item in locations["features"]
-            if item["geometry"] is not None
+            item async for item in self.iter_items(collection, limit=limit, query=query)
         ]
 
+    def poll(
+        self,
+        changes: Callable[[], Awaitable[Delta]],
+        *,
+        interval: float = 60.0,
+        max_interval: float = 900.0,
+    ) -> Poller:
+        """Refresh a collection in the background.
+
+        The poller is stopped when the client is closed.
+
+        Args:
+        ----
+            changes: The change tracking method of the collection,
+                for example client.garage_changes.
+            interval: The shortest time between two polls, in seconds.
+            max_interval: The longest time between two polls, in seconds.
+
+        Returns:
+        -------
+            The running Poller, subscribe to it to receive the changes.
+
+        """
+        poller = Poller(changes, interval=interval, max_interval=max_interval)
+        self._pollers.append(poller)
+        poller.start()
+        return poller
+
     async def close(self) -> None:
-        """Close open client session."""
+        """Stop the pollers and close open client session."""
+        pollers, self._pollers = self._pollers, []
+        for poller in pollers:
+            await poller.stop()
         if self.session and self._close_session:
             await self.session.close()
 
@@ -0,0 +1,379 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import bisect
+import math
+from array import array
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .delta import Delta
+
+# The default resolutions of the history in seconds: 1 minute, 15 minutes
+# and 1 hour. With the default size this keeps a day, two weeks and two
+# months of history.
+RESOLUTIONS = (60, 900, 3600)
+
+
+@dataclass(frozen=True, slots=True)
+class Sample:
+    """Object representing the occupancy of a location in a time bucket."""
+
+    timestamp: datetime
+    free_space: float
+    minimum: float
+    maximum: float
+    capacity: float | None
+    count: int
+
+
+@dataclass(slots=True)
+class _Ring:
+    """Ring buffer of at most `size` time buckets, stored in arrays.
+
+    The arrays grow as buckets are added until the ring is full, so a
+    location with a short history only takes the memory it uses. The
+    buckets are kept in order of time, so the ring can be searched with
+    bisect: indexing it returns the start of a bucket.
+    """
+
+    size: int
+    start: array[float] = field(default_factory=lambda: array("d"), init=False)
+    total: array[float] = field(default_factory=lambda: array("d"), init=False)
+    minimum: array[float] = field(default_factory=lambda: array("d"), init=False)
+    maximum: array[float] = field(default_factory=lambda: array("d"), init=False)
+    capacity: array[float] = field(default_factory=lambda: array("d"), init=False)
+    count: array[int] = field(default_factory=lambda: array("q"), init=False)
+    _head: int = field(default=0, init=False)
+    _length: int = field(default=0, init=False)
+
+    def _slot(self, index: int) -> int:
+        """Return the position in the arrays of a bucket.
+
+        Args:
+        ----
+            index: The index of the bucket, 0 is the oldest.
+
+        Returns:
+        -------
+            The position in the arrays.
+
+        """
+        return (self._head - self._length + index) % self.size
+
+    def __len__(self) -> int:
+        """Return the number of buckets.
+
+        Returns
+        -------
+            The number of buckets.
+
+        """
+        return self._length
+
+    def __getitem__(self, index: int) -> float:
+        """Return the start of a bucket.
+
+        Args:
+        ----
+            index: The index of the bucket, 0 is the oldest.
+
+        Returns:
+        -------
+            The start of the bucket in seconds since the epoch.
+
+        """
+        return self.start[self._slot(index)]
+
+    def add(self, bucket: float, free_space: float, capacity: float) -> None:
+        """Add a value to the last bucket, or start a new bucket.
+
+        Once the ring is full, a new bucket replaces the oldest one.
+
+        Args:
+        ----
+            bucket: The start of the bucket of the value.
+            free_space: The free spaces.
+            capacity: The capacity, NaN if unknown.
+
+        """
+        if self._length:
+            slot = self._slot(self._length - 1)
+            if self.start[slot] == bucket:
+                self.total[slot] += free_space
+                self.minimum[slot] = min(self.minimum[slot], free_space)
+                self.maximum[slot] = max(self.maximum[slot], free_space)
+                self.capacity[slot] = capacity
+                self.count[slot] += 1
+                return
+        slot = self._head
+        if slot == len(self.start):
+            self.start.append(bucket)
+            self.total.append(free_space)
+            self.minimum.append(free_space)
+            self.maximum.append(free_space)
+            self.capacity.append(capacity)
+            self.count.append(1)
+        else:
+            self.start[slot] = bucket
+            self.total[slot] = free_space
+            self.minimum[slot] = free_space
+            self.maximum[slot] = free_space
+            self.capacity[slot] = capacity
+            self.count[slot] = 1
+        self._head = (slot + 1) % self.size
+        self._length = min(self._length + 1, self.size)
+
+    def samples(self, first: int, last: int) -> list[Sample]:
+        """Return the buckets in a range as Sample objects.
+
+        Args:
+        ----
+            first: The index of the first bucket.
+            last: The index after the last bucket.
+
+        Returns:
+        -------
+            A list of Sample objects, oldest first.
+
+        """
+        samples = []
+        for index in range(first, last):
+            slot = self._slot(index)
+            capacity = self.capacity[slot]
+            samples.append(
+                Sample(
+                    timestamp=datetime.fromtimestamp(self.start[slot], UTC),
+                    free_space=self.total[slot] / self.count[slot],
+                    minimum=self.minimum[slot],
+                    maximum=self.maximum[slot],
+                    capacity=None if math.isnan(capacity) else capacity,
+                    count=self.count[slot],
+                )
+            )
+        return samples
+
+
+@dataclass
+class OccupancyRecorder:
+    """Keep the occupancy history of locations in memory.
+
+    Feed it the results of repeated `garages()` or `park_and_rides()`
+    calls, or the deltas of a poller. Every location has a ring buffer of
+    up to `size` buckets for each resolution, so memory use is bounded:
+    a full ring takes 48 bytes per bucket, about 200 KB per location with
+    the defaults. The rings grow as buckets are added, so a location that
+    is only seen a few times stays small.
+
+    The same update is often returned by several polls, so a record is
+    only added when its `updated_at` is newer than the last one of the
+    spot.
+    """
+
+    resolutions: tuple[int, ...] = RESOLUTIONS
+    size: int = 1440
+
+    _rings: dict[str, tuple[_Ring, ...]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _last: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Validate the resolutions.
+
+        Raises
+        ------
+            ValueError: If the resolutions are not increasing.
+
+        """
+        if not self.resolutions or list(self.resolutions) != sorted(
+            set(self.resolutions)
+        ):
+            msg = "The resolutions must be unique and in increasing order"
+            raise ValueError(msg)
+
+    @property
+    def spot_ids(self) -> list[str]:
+        """Return the IDs of the recorded locations.
+
+        Returns
+        -------
+            The spot IDs.
+
+        """
+        return list(self._rings)
+
+    def add(
+        self,
+        spot_id: str,
+        updated_at: datetime,
+        free_space: float,
+        capacity: float | None = None,
+    ) -> bool:
+        """Add a sample of a location.
+
+        Args:
+        ----
+            spot_id: The ID of the location.
+            updated_at: The time of the sample.
+            free_space: The free spaces.
+            capacity: The capacity, if known.
+
+        Returns:
+        -------
+            True if the sample was added, False if it is not newer than
+            the last sample of the location.
+
+        """
+        timestamp = updated_at.timestamp()
+        if timestamp <= self._last.get(spot_id, -math.inf):
+            return False
+        self._last[spot_id] = timestamp
+        rings = self._rings.get(spot_id)
+        if rings is None:
+            rings = self._rings[spot_id] = tuple(
+                _Ring(self.size) for _ in self.resolutions
+            )
+        size = math.nan if capacity is None else capacity
+        for resolution, ring in zip(self.resolutions, rings, strict=True):
+            ring.add(timestamp - timestamp % resolution, free_space, size)
+        return True
+
+    def record(self, items: Iterable[Any]) -> int:
+        """Add the samples of a collection result.
+
+        Records without an `updated_at` or free spaces are skipped.
+
+        Args:
+        ----
+            items: ParkAndRide or Garage objects.
+
+        Returns:
+        -------
+            The number of samples added.
+
+        """
+        added = 0
+        for item in items:
+            if item.updated_at is None or item.free_space is None:
+                continue
+            added += self.add(
+                item.spot_id, item.updated_at, item.free_space, item.capacity
+            )
+        return added
+
+    def record_delta(self, delta: Delta) -> int:
+        """Add the samples of the added and changed records of a delta.
+
+        Args:
+        ----
+            delta: A Delta from `garage_changes`, `park_and_ride_changes`
+                or a poller.
+
+        Returns:
+        -------
+            The number of samples added.
+
+        """
+        return self.record(delta.added) + self.record(
+            change.current for change in delta.changed
+        )
+
+    def series(
+        self,
+        spot_id: str,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        resolution: int | None = None,
+    ) -> list[Sample]:
+        """Return the history of a location in a time range.
+
+        Without a resolution, the finest resolution that still covers
+        the start of the range is used.
+
+        Args:
+        ----
+            spot_id: The ID of the location.
+            start: The start of the range, None for all history.
+            end: The end of the range, None for up to now.
+            resolution: The resolution in seconds, one of `resolutions`.
+
+        Returns:
+        -------
+            A list of Sample objects, oldest first. Each covers the time
+            bucket from its timestamp.
+
+        Raises:
+        ------
+            ValueError: If the resolution is not recorded.
+
+        """
+        if resolution is not None and resolution not in self.resolutions:
+            msg = f"Resolution {resolution} is not one of {self.resolutions}"
+            raise ValueError(msg)
+        rings = self._rings.get(spot_id)
+        if rings is None:
+            return []
+        low = -math.inf if start is None else start.timestamp()
+        high = math.inf if end is None else end.timestamp()
+
+        if resolution is None:
+            index = len(rings) - 1
+            for position, ring in enumerate(rings):
+                if ring[0] <= low:
+                    index = position
+                    break
+        else:
+            index = self.resolutions.index(resolution)
+        ring = rings[index]
+        # A bucket that started before the range still covers its start.
+        first = bisect.bisect_right(ring, low - self.resolutions[index])
+        last = bisect.bisect_right(ring, high)
+        return ring.samples(first, last)
+
+    def latest(self, spot_id: str) -> Sample | None:
+        """Return the last bucket of the finest resolution of a location.
+
+        Args:
+        ----
+            spot_id: The ID of the location.
+
+        Returns:
+        -------
+            A Sample object, or None if the location is not recorded.
+
+        """
+        rings = self._rings.get(spot_id)
+        if rings is None:
+            return None
+        ring = rings[0]
+        return ring.samples(len(ring) - 1, len(ring))[0]
+
+    def __len__(self) -> int:
+        """Return the number of recorded locations.
+
+        Returns
+        -------
+            The number of locations.
+
+        """
+        return len(self._rings)
+
+    def __contains__(self, spot_id: object) -> bool:
+        """Return if a location is recorded.
+
+        Args:
+        ----
+            spot_id: The ID of the location.
+
+        Returns:
+        -------
+            True if the location has samples.
+
+        """
+        return spot_id in self._rings
@@ -0,0 +1,250 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import SimpleNamespace
+
+    from aiohttp import (
+        ClientSession,
+        TraceConfig,
+        TraceConnectionCreateEndParams,
+        TraceConnectionCreateStartParams,
+        TraceDnsResolveHostEndParams,
+        TraceDnsResolveHostStartParams,
+        TraceRequestEndParams,
+        TraceRequestHeadersSentParams,
+    )
+
+# The stages of a request that are timed:
+# - dns: resolving the host name of the API.
+# - connect: opening a new (TLS) connection.
+# - ttfb: waiting for the response headers, after the request was sent.
+# - download: reading the response body.
+# - decode: decoding the JSON of the response body.
+# - models: building the model objects from the features.
+STAGES = ("dns", "connect", "ttfb", "download", "decode", "models")
+
+
+@dataclass(frozen=True, slots=True)
+class Timing:
+    """Object representing a timed stage of a request.
+
+    The start and end are in nanoseconds since the epoch, like the
+    timestamps of OpenTelemetry spans, so a callback can export them as
+    spans: `tracer.start_span(timing.name, start_time=timing.start_ns)`.
+    """
+
+    name: str
+    endpoint: str
+    start_ns: int
+    end_ns: int
+    attributes: dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def duration(self) -> float:
+        """Return the duration of the stage.
+
+        Returns
+        -------
+            The duration in seconds.
+
+        """
+        return (self.end_ns - self.start_ns) / 1e9
+
+
+@dataclass
+class EndpointMetrics:
+    """Object representing the counters of an endpoint of the API."""
+
+    requests: int = 0
+    retries: int = 0
+    errors: int = 0
+    cache_hits: int = 0
+    not_modified: int = 0
+    bytes_received: int = 0
+    models: int = 0
+    seconds: dict[str, float] = field(default_factory=dict)
+
+
+@dataclass
+class Instrumentation:
+    """Collect timings and counters of the requests of a client.
+
+    Every timed stage is added to the counters of its endpoint and passed
+    to the callbacks, which can forward them to a metrics or tracing
+    system. Pass `trace_config()` to a shared session, to time the DNS
+    lookups and connections of its requests as well.
+    """
+
+    metrics: dict[str, EndpointMetrics] = field(default_factory=dict)
+
+    _callbacks: list[Callable[[Timing], None]] = field(
+        default_factory=list, init=False, repr=False
+    )
+
+    def subscribe(self, callback: Callable[[Timing], None]) -> Callable[[], None]:
+        """Call a function for every timed stage.
+
+        Args:
+        ----
+            callback: The function, it receives a Timing object.
+
+        Returns:
+        -------
+            A function to remove the callback again.
+
+        """
+        self._callbacks.append(callback)
+        return lambda: self._callbacks.remove(callback)
+
+    def endpoint(self, endpoint: str) -> EndpointMetrics:
+        """Return the counters of an endpoint.
+
+        Args:
+        ----
+            endpoint: The endpoint, for example the dataset name.
+
+        Returns:
+        -------
+            The EndpointMetrics object of the endpoint.
+
+        """
+        metrics = self.metrics.get(endpoint)
+        if metrics is None:
+            metrics = self.metrics[endpoint] = EndpointMetrics()
+        return metrics
+
+    def count(self, endpoint: str, counter: str, amount: int = 1) -> None:
+        """Increase a counter of an endpoint.
+
+        Args:
+        ----
+            endpoint: The endpoint, for example the dataset name.
+            counter: The name of the counter, for example 'retries'.
+            amount: The amount to add.
+
+        """
+        metrics = self.endpoint(endpoint)
+        setattr(metrics, counter, getattr(metrics, counter) + amount)
+
+    def record(self, timing: Timing) -> None:
+        """Add a timed stage to the counters and pass it to the callbacks.
+
+        Args:
+        ----
+            timing: The timed stage.
+
+        """
+        seconds = self.endpoint(timing.endpoint).seconds
+        seconds[timing.name] = seconds.get(timing.name, 0.0) + timing.duration
+        for callback in self._callbacks:
+            callback(timing)
+
+    @contextmanager
+    def measure(self, endpoint: str, stage: str) -> Iterator[dict[str, Any]]:
+        """Time the code in the context as a stage of a request.
+
+        Args:
+        ----
+            endpoint: The endpoint, for example the dataset name.
+            stage: The name of the stage, see STAGES.
+
+        Yields:
+        ------
+            The attributes of the timing, to add details such as a size.
+
+        """
+        attributes: dict[str, Any] = {}
+        start_ns = time.time_ns()
+        try:
+            yield attributes
+        finally:
+            self.record(Timing(stage, endpoint, start_ns, time.time_ns(), attributes))
+
+    def trace_config(self) -> TraceConfig:
+        """Return an aiohttp trace config that times DNS, connect and TTFB.
+
+        Only requests of the client are timed, other requests sent with
+        the same session are ignored.
+
+        Returns
+        -------
+            The TraceConfig for a client session.
+
+        """
+        from aiohttp import TraceConfig  # noqa: PLC0415
+
+        trace_config = TraceConfig()
+
+        def endpoint(context: SimpleNamespace) -> str | None:
+            request_context = context.trace_request_ctx
+            if isinstance(request_context, dict):
+                value = request_context.get("hamburg_endpoint")
+                return value if isinstance(value, str) else None
+            return None
+
+        def start(context: SimpleNamespace, stage: str) -> None:
+            setattr(context, f"{stage}_start_ns", time.time_ns())
+
+        def end(context: SimpleNamespace, stage: str) -> None:
+            name = endpoint(context)
+            start_ns = getattr(context, f"{stage}_start_ns", None)
+            if name is not None and start_ns is not None:
+                self.record(Timing(stage, name, start_ns, time.time_ns()))
+
+        async def on_dns_start(
+            _session: ClientSession,
+            context: SimpleNamespace,
+            _params: TraceDnsResolveHostStartParams,
+        ) -> None:
+            start(context, "dns")
+
+        async def on_dns_end(
+            _session: ClientSession,
+            context: SimpleNamespace,
+            _params: TraceDnsResolveHostEndParams,
+        ) -> None:
+            end(context, "dns")
+
+        async def on_connect_start(
+            _session: ClientSession,
+            context: SimpleNamespace,
+            _params: TraceConnectionCreateStartParams,
+        ) -> None:
+            start(context, "connect")
+
+        async def on_connect_end(
+            _session: ClientSession,
+            context: SimpleNamespace,
+            _params: TraceConnectionCreateEndParams,
+        ) -> None:
+            end(context, "connect")
+
+        async def on_headers_sent(
+            _session: ClientSession,
+            context: SimpleNamespace,
+            _params: TraceRequestHeadersSentParams,
+        ) -> None:
+            start(context, "ttfb")
+
+        async def on_request_end(
+            _session: ClientSession,
+            context: SimpleNamespace,
+            _params: TraceRequestEndParams,
+        ) -> None:
+            end(context, "ttfb")
+
+        trace_config.on_dns_resolvehost_start.append(on_dns_start)
+        trace_config.on_dns_resolvehost_end.append(on_dns_end)
+        trace_config.on_connection_create_start.append(on_connect_start)
+        trace_config.on_connection_create_end.append(on_connect_end)
+        trace_config.on_request_headers_sent.append(on_headers_sent)
+        trace_config.on_request_end.append(on_request_end)
+        return trace_config
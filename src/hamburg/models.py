@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import re
+from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
-import pytz
+if TYPE_CHECKING:
+    from collections.abc import Iterable
 
+    from pytz import BaseTzInfo
 
-@dataclass
+# Function that reads a model field from the properties of a feature.
+Accessor = Callable[[dict[str, Any]], Any]
+
+
+@dataclass(slots=True)
 class DisabledParking:
     """Object representing a disabled parking."""
 
@@ -33,36 +42,28 @@ class DisabledParking:
             A DisabledParking object.
 
         """
+        item: DisabledParking = decode_feature(cls, DISABLED_PARKING_FIELDS, data)
+        return item
 
-        def strip_spaces(string: str) -> str | None:
-            """Strip spaces from a string.
-
-            Args:
-            ----
-                string: The string to strip.
+    @classmethod
+    def from_feature_collection(
+        cls: type[DisabledParking], data: dict[str, Any]
+    ) -> list[DisabledParking]:
+        """Return DisabledParking objects from a FeatureCollection.
 
-            Returns:
-            -------
-                The string without spaces or None if the string is empty.
+        Args:
+        ----
+            data: The FeatureCollection from the API.
 
-            """
-            if string is None:
-                return None
-            return string.strip()
+        Returns:
+        -------
+            A list of DisabledParking objects.
 
-        attr = data["properties"]
-        geo = data["geometry"]["coordinates"]
-        return cls(
-            spot_id=str(data.get("id")),
-            street=strip_spaces(attr.get("nahe_adresse")),
-            limitation=strip_spaces(attr.get("befristung")),
-            number=attr.get("anzahl"),
-            longitude=geo[0],
-            latitude=geo[1],
-        )
+        """
+        return decode_features(cls, DISABLED_PARKING_FIELDS, data["features"])
 
 
-@dataclass
+@dataclass(slots=True)
 class ParkAndRide:
     """Object representing a park and ride spot."""
 
@@ -97,37 +98,28 @@ class ParkAndRide:
             A ParkAndRide object.
 
         """
-        attr = data["properties"]
-        geo = data["geometry"]["coordinates"]
-        return cls(
-            spot_id=str(data.get("id")),
-            name=attr.get("name"),
-            park_type=attr.get("art"),
-            address=attr.get("adresse"),
-            construction_year=attr.get("baujahr"),
-            public_transport_line=attr.get("linie"),
-            disabled_parking_spaces=int(attr.get("stellplaetze_behinderte_gesamt")),
-            tickets={
-                "day": attr.get("ticket_1_tag"),
-                "month": attr.get("ticket_30_tage"),
-                "year": attr.get("ticket_1_jahr"),
-            },
-            url=attr.get("homepage"),
-            free_space=int(attr.get("stellplaetze_frei")),
-            capacity=int(attr.get("stellplaetze_gesamt")),
-            availability_pct=availability_calc(
-                attr.get("stellplaetze_frei"),
-                attr.get("stellplaetze_gesamt"),
-            ),
-            longitude=geo[0],
-            latitude=geo[1],
-            updated_at=strptime(
-                attr.get("aktualitaet_belegungsdaten"), "%Y-%m-%d %H:%M:%S"
-            ),
-        )
+        item: ParkAndRide = decode_feature(cls, PARK_AND_RIDE_FIELDS, data)
+        return item
+
+    @classmethod
+    def from_feature_collection(
+        cls: type[ParkAndRide], data: dict[str, Any]
+    ) -> list[ParkAndRide]:
+        """Return ParkAndRide objects from a FeatureCollection.
+
+        Args:
+        ----
+            data: The FeatureCollection from the API.
+
+        Returns:
+        -------
+            A list of ParkAndRide objects.
+
+        """
+        return decode_features(cls, PARK_AND_RIDE_FIELDS, data["features"])
 
 
-@dataclass
+@dataclass(slots=True)
 class Garage:
     """Object representing a garage."""
 
@@ -161,29 +153,27 @@ class Garage:
             A Garage object.
 
         """
-        attr = data["properties"]
-        geo = data["geometry"]["coordinates"]
-        return cls(
-            spot_id=str(data.get("id")),
-            name=attr.get("name"),
-            park_type=attr.get("art"),
-            disabled_parking_spaces=attr.get("behindertenst"),
-            status=attr.get("situation"),
-            address=f"{attr.get('strasse')} {attr.get('hausnr')}"
-            if attr.get("strasse")
-            else None,
-            price=None if attr.get("preise") == " " else attr.get("preise"),
-            data_origin=attr.get("datenherkunft"),
-            free_space=attr.get("frei"),
-            capacity=attr.get("stellplaetze_gesamt"),
-            availability_pct=availability_calc(
-                attr.get("frei"),
-                attr.get("stellplaetze_gesamt"),
-            ),
-            longitude=geo[0],
-            latitude=geo[1],
-            updated_at=strptime(attr.get("received"), "%d.%m.%Y, %H:%M"),
-        )
+        item: Garage = decode_feature(cls, GARAGE_FIELDS, data)
+        return item
+
+    @classmethod
+    def from_feature_collection(
+        cls: type[Garage], data: dict[str, Any]
+    ) -> list[Garage]:
+        """Return Garage objects from a FeatureCollection.
+
+        Garages without location coordinates are left out.
+
+        Args:
+        ----
+            data: The FeatureCollection from the API.
+
+        Returns:
+        -------
+            A list of Garage objects.
+
+        """
+        return decode_features(cls, GARAGE_FIELDS, data["features"])
 
 
 def availability_calc(
@@ -215,7 +205,100 @@ def availability_calc(
         return None
 
 
-def strptime(date_string: str, date_format: str, default: None = None) -> Any:
+# Patterns for the timestamp formats used by the datasets, which are parsed
+# without going through datetime.strptime. Like strptime, a space in the
+# format matches one or more whitespace characters.
+TIMESTAMP_PATTERNS: dict[str, re.Pattern[str]] = {
+    "%Y-%m-%d %H:%M:%S": re.compile(
+        r"(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})\s+"
+        r"(?P<hour>\d{1,2}):(?P<minute>\d{1,2}):(?P<second>\d{1,2})"
+    ),
+    "%d.%m.%Y, %H:%M": re.compile(
+        r"(?P<day>\d{1,2})\.(?P<month>\d{1,2})\.(?P<year>\d{4}),\s+"
+        r"(?P<hour>\d{1,2}):(?P<minute>\d{1,2})"
+    ),
+}
+
+
+@lru_cache(maxsize=1)
+def timezone() -> BaseTzInfo:
+    """Return the timezone of the timestamps of the API.
+
+    pytz is only imported when the first timestamp is parsed.
+
+    Returns
+    -------
+        The Europe/Berlin timezone.
+
+    """
+    import pytz  # noqa: PLC0415
+
+    return pytz.timezone("Europe/Berlin")
+
+
+def __getattr__(name: str) -> Any:
+    """Return the attributes that are loaded on first use.
+
+    Args:
+    ----
+        name: The name of the attribute.
+
+    Returns:
+    -------
+        The Europe/Berlin timezone for TIMEZONE.
+
+    Raises:
+    ------
+        AttributeError: If the module has no such attribute.
+
+    """
+    if name == "TIMEZONE":
+        return timezone()
+    msg = f"module {__name__!r} has no attribute {name!r}"
+    raise AttributeError(msg)
+
+
+@lru_cache(maxsize=1024)
+def _parse_timestamp(date_string: str, date_format: str) -> datetime:
+    """Parse a local timestamp of Hamburg into an aware datetime.
+
+    Many records share the same timestamp, so the results are cached.
+
+    Args:
+    ----
+        date_string: The date string.
+        date_format: The format of the date string.
+
+    Returns:
+    -------
+        The datetime object, localized to the Europe/Berlin timezone.
+
+    Raises:
+    ------
+        ValueError: If the date string does not match the format.
+
+    """
+    pattern = TIMESTAMP_PATTERNS.get(date_format)
+    if pattern is None:
+        naive = datetime.strptime(date_string, date_format)  # noqa: DTZ007
+    else:
+        match = pattern.fullmatch(date_string)
+        if match is None:
+            msg = f"time data {date_string!r} does not match format {date_format!r}"
+            raise ValueError(msg)
+        parts = match.groupdict("0")
+        naive = datetime(  # noqa: DTZ001
+            int(parts["year"]),
+            int(parts["month"]),
+            int(parts["day"]),
+            int(parts["hour"]),
+            int(parts["minute"]),
+            int(parts.get("second", "0")),
+        )
+    return timezone().localize(naive)
+
+
+def strptime(date_string: str | None, date_format: str, default: None = None) -> Any:
     """Strptime function with default value.
 
     Args:
@@ -230,8 +313,318 @@ def strptime(date_string: str, date_format: str, default: None = None) -> Any:
 
     """
     try:
-        return datetime.strptime(date_string, date_format).replace(
-            tzinfo=pytz.timezone("Europe/Berlin")
-        )
+        return _parse_timestamp(date_string, date_format)
     except (ValueError, TypeError):
         return default
+
+
+@dataclass(frozen=True, slots=True)
+class Prop:
+    """Accessor that reads a single property of a feature."""
+
+    key: str
+    convert: Callable[[Any], Any] | None = None
+
+    def __call__(self, attr: dict[str, Any]) -> Any:
+        """Read the property from the properties of a feature.
+
+        Args:
+        ----
+            attr: The properties of the feature.
+
+        Returns:
+        -------
+            The (converted) value, or None if the property is missing.
+
+        """
+        value = attr.get(self.key)
+        if value is None or self.convert is None:
+            return value
+        return self.convert(value)
+
+
+def prop(key: str, convert: Callable[[Any], Any] | None = None) -> Prop:
+    """Return an accessor that reads a single property of a feature.
+
+    Args:
+    ----
+        key: The name of the property.
+        convert: Function to convert the value with, when it is not None.
+
+    Returns:
+    -------
+        The accessor.
+
+    """
+    return Prop(key, convert)
+
+
+def compile_decoder(
+    model: Callable[..., Any],
+    fields: dict[str, Accessor],
+) -> Callable[[dict[str, Any]], Any]:
+    """Build a function that decodes a single feature with a mapping table.
+
+    The ID and coordinates of the feature are passed as the spot_id,
+    longitude and latitude fields, the other fields are read from the
+    properties with the accessors of the mapping table. The table is
+    read once into a tuple, which the decoder loops over for every
+    feature.
+
+    Args:
+    ----
+        model: The model class to create.
+        fields: The mapping table of model field names to accessors.
+
+    Returns:
+    -------
+        The decoder function.
+
+    Raises:
+    ------
+        ValueError: If a field name is not a valid identifier.
+
+    """
+    accessors = tuple(fields.items())
+    for name, _ in accessors:
+        if not name.isidentifier():
+            msg = f"Invalid field name in mapping table: {name!r}"
+            raise ValueError(msg)
+
+    def decode(data: dict[str, Any]) -> Any:
+        attr = data["properties"]
+        geo = data["geometry"]["coordinates"]
+        return model(
+            spot_id=str(data.get("id")),
+            longitude=geo[0],
+            latitude=geo[1],
+            **{name: accessor(attr) for name, accessor in accessors},
+        )
+
+    return decode
+
+
+def decode_feature(
+    model: Callable[..., Any],
+    fields: dict[str, Accessor],
+    data: dict[str, Any],
+) -> Any:
+    """Return a model object from a feature, using a mapping table.
+
+    Args:
+    ----
+        model: The model class to create.
+        fields: The mapping table of model field names to accessors.
+        data: The feature from the API.
+
+    Returns:
+    -------
+        A model object.
+
+    """
+    return compile_decoder(model, fields)(data)
+
+
+def decode_features(
+    model: Callable[..., Any],
+    fields: dict[str, Accessor],
+    features: Iterable[dict[str, Any]],
+) -> list[Any]:
+    """Return model objects from a features array in one pass.
+
+    Features without a geometry are left out.
+
+    Args:
+    ----
+        model: The model class to create.
+        fields: The mapping table of model field names to accessors.
+        features: The features from the API.
+
+    Returns:
+    -------
+        A list of model objects.
+
+    """
+    decode = compile_decoder(model, fields)
+    return [decode(data) for data in features if data["geometry"] is not None]
+
+
+@dataclass(frozen=True, slots=True)
+class Availability:
+    """Accessor that calculates the availability percentage of a feature."""
+
+    free_space_key: str
+    capacity_key: str
+
+    def __call__(self, attr: dict[str, Any]) -> float | None:
+        """Calculate the availability from the properties of a feature.
+
+        Args:
+        ----
+            attr: The properties of the feature.
+
+        Returns:
+        -------
+            The availability percentage, or None if it is unknown.
+
+        """
+        free_space: Any = attr.get(self.free_space_key)
+        capacity: Any = attr.get(self.capacity_key)
+        return availability_calc(free_space, capacity)
+
+
+def availability(free_space_key: str, capacity_key: str) -> Availability:
+    """Return an accessor that calculates the availability percentage.
+
+    Args:
+    ----
+        free_space_key: The name of the free space property.
+        capacity_key: The name of the capacity property.
+
+    Returns:
+    -------
+        The accessor.
+
+    """
+    return Availability(free_space_key, capacity_key)
+
+
+@dataclass(frozen=True, slots=True)
+class Timestamp:
+    """Accessor that parses a timestamp property of a feature."""
+
+    key: str
+    date_format: str
+
+    def __call__(self, attr: dict[str, Any]) -> Any:
+        """Parse the timestamp from the properties of a feature.
+
+        Args:
+        ----
+            attr: The properties of the feature.
+
+        Returns:
+        -------
+            The datetime object, or None if it cannot be parsed.
+
+        """
+        return strptime(attr.get(self.key), self.date_format)
+
+
+def timestamp(key: str, date_format: str) -> Timestamp:
+    """Return an accessor that parses a timestamp property.
+
+    Args:
+    ----
+        key: The name of the property.
+        date_format: The format of the timestamp.
+
+    Returns:
+    -------
+        The accessor.
+
+    """
+    return Timestamp(key, date_format)
+
+
+def strip_spaces(string: str) -> str:
+    """Strip spaces from a string.
+
+    Args:
+    ----
+        string: The string to strip.
+
+    Returns:
+    -------
+        The string without leading and trailing spaces.
+
+    """
+    return string.strip()
+
+
+def _park_and_ride_tickets(attr: dict[str, Any]) -> dict[str, Any]:
+    """Return the ticket prices of a park and ride.
+
+    Args:
+    ----
+        attr: The properties of the feature.
+
+    Returns:
+    -------
+        A dictionary with the day, month and year ticket.
+
+    """
+    return {
+        "day": attr.get("ticket_1_tag"),
+        "month": attr.get("ticket_30_tage"),
+        "year": attr.get("ticket_1_jahr"),
+    }
+
+
+def _garage_address(attr: dict[str, Any]) -> str | None:
+    """Return the address of a garage.
+
+    Args:
+    ----
+        attr: The properties of the feature.
+
+    Returns:
+    -------
+        The street and house number, or None without a street.
+
+    """
+    street = attr.get("strasse")
+    return f"{street} {attr.get('hausnr')}" if street else None
+
+
+def _garage_price(attr: dict[str, Any]) -> str | None:
+    """Return the price list of a garage.
+
+    Args:
+    ----
+        attr: The properties of the feature.
+
+    Returns:
+    -------
+        The price list, or None if it is empty.
+
+    """
+    price = attr.get("preise")
+    return None if price == " " else price
+
+
+# Mapping tables of the model fields onto the properties of each dataset.
+DISABLED_PARKING_FIELDS: dict[str, Accessor] = {
+    "street": prop("nahe_adresse", strip_spaces),
+    "limitation": prop("befristung", strip_spaces),
+    "number": prop("anzahl"),
+}
+
+PARK_AND_RIDE_FIELDS: dict[str, Accessor] = {
+    "name": prop("name"),
+    "park_type": prop("art"),
+    "address": prop("adresse"),
+    "construction_year": prop("baujahr"),
+    "public_transport_line": prop("linie"),
+    "disabled_parking_spaces": prop("stellplaetze_behinderte_gesamt", int),
+    "tickets": _park_and_ride_tickets,
+    "url": prop("homepage"),
+    "free_space": prop("stellplaetze_frei", int),
+    "capacity": prop("stellplaetze_gesamt", int),
+    "availability_pct": availability("stellplaetze_frei", "stellplaetze_gesamt"),
+    "updated_at": timestamp("aktualitaet_belegungsdaten", "%Y-%m-%d %H:%M:%S"),
+}
+
+GARAGE_FIELDS: dict[str, Accessor] = {
+    "name": prop("name"),
+    "park_type": prop("art"),
+    "disabled_parking_spaces": prop("behindertenst"),
+    "status": prop("situation"),
+    "address": _garage_address,
+    "price": _garage_price,
+    "data_origin": prop("datenherkunft"),
+    "free_space": prop("frei"),
+    "capacity": prop("stellplaetze_gesamt"),
+    "availability_pct": availability("frei", "stellplaetze_gesamt"),
+    "updated_at": timestamp("received", "%d.%m.%Y, %H:%M"),
+}
@@ -0,0 +1,215 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Self
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable
+
+    from .delta import Delta
+
+# Seconds to wait after the expected upstream update, before polling again.
+UPDATE_GRACE = 5.0
+
+
+def latest_update(delta: Delta) -> datetime | None:
+    """Return the newest update time of the added and changed records.
+
+    Args:
+    ----
+        delta: The changes of a poll.
+
+    Returns:
+    -------
+        The newest `updated_at`, or None if no record has one.
+
+    """
+    moments = [
+        moment
+        for item in [*delta.added, *(change.current for change in delta.changed)]
+        if isinstance(moment := getattr(item, "updated_at", None), datetime)
+    ]
+    return max(moments, default=None)
+
+
+@dataclass
+class Subscription:
+    """Async iterator over the changes published by a poller."""
+
+    poller: Poller
+    queue: asyncio.Queue[Delta | None] = field(
+        default_factory=asyncio.Queue, repr=False
+    )
+
+    def __aiter__(self) -> Self:
+        """Return the subscription as async iterator.
+
+        Returns
+        -------
+            The subscription.
+
+        """
+        return self
+
+    async def __anext__(self) -> Delta:
+        """Wait for the next changes.
+
+        Returns
+        -------
+            A Delta object with the changes of a poll.
+
+        Raises
+        ------
+            StopAsyncIteration: When the poller has stopped.
+
+        """
+        delta = await self.queue.get()
+        if delta is None:
+            raise StopAsyncIteration
+        return delta
+
+    def close(self) -> None:
+        """Stop receiving changes."""
+        self.poller.unsubscribe(self)
+
+
+@dataclass
+class Poller:
+    """Refresh a collection in the background and publish what changed.
+
+    The interval adapts to the update cadence of the data: the time
+    between two successive `updated_at` values of the records is used to
+    predict the next upstream update, and the collection is not polled
+    again before then. Polls that find nothing new back off exponentially
+    up to `max_interval`. A failed poll, for example on a malformed page,
+    is kept in `last_error` and polling carries on.
+    """
+
+    changes: Callable[[], Awaitable[Delta]]
+    interval: float = 60.0
+    max_interval: float = 900.0
+
+    last_error: Exception | None = field(default=None, init=False)
+    _delay: float = field(default=0.0, init=False, repr=False)
+    _latest: datetime | None = field(default=None, init=False, repr=False)
+    _cadence: float | None = field(default=None, init=False, repr=False)
+    _subscriptions: list[Subscription] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _task: asyncio.Task[None] | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Start at the base interval."""
+        self._delay = self.interval
+
+    @property
+    def running(self) -> bool:
+        """Return if the poller is running.
+
+        Returns
+        -------
+            True between start and stop.
+
+        """
+        return self._task is not None and not self._task.done()
+
+    def subscribe(self) -> Subscription:
+        """Subscribe to the changes of the collection.
+
+        Returns
+        -------
+            A Subscription, iterate over it to receive Delta objects.
+
+        """
+        subscription = Subscription(self)
+        self._subscriptions.append(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        """Stop publishing changes to a subscription.
+
+        Args:
+        ----
+            subscription: The subscription to remove.
+
+        """
+        with contextlib.suppress(ValueError):
+            self._subscriptions.remove(subscription)
+        subscription.queue.put_nowait(None)
+
+    def start(self) -> None:
+        """Start polling in the background."""
+        if not self.running:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Stop polling and end the subscriptions."""
+        if self._task is not None:
+            task, self._task = self._task, None
+            task.cancel()
+            # Unlike awaiting the task, waiting for it does not raise its
+            # exception, but a cancellation of stop itself is passed on.
+            await asyncio.wait([task])
+            if not task.cancelled():
+                task.exception()
+        for subscription in list(self._subscriptions):
+            self.unsubscribe(subscription)
+
+    async def poll(self) -> Delta:
+        """Poll the collection once and publish the changes.
+
+        Returns
+        -------
+            A Delta object with the changes since the previous poll.
+
+        """
+        delta = await self.changes()
+        newest = latest_update(delta)
+        if newest is not None and (self._latest is None or newest > self._latest):
+            if self._latest is not None:
+                self._cadence = (newest - self._latest).total_seconds()
+            self._latest = newest
+        if delta:
+            self._delay = self.interval
+            for subscription in self._subscriptions:
+                subscription.queue.put_nowait(delta)
+        else:
+            self._delay = min(self._delay * 2, self.max_interval)
+        return delta
+
+    def next_delay(self, now: datetime | None = None) -> float:
+        """Return how long to wait before the next poll.
+
+        Args:
+        ----
+            now: The current time, defaults to now.
+
+        Returns:
+        -------
+            The delay in seconds, between `interval` and `max_interval`.
+
+        """
+        delay = self._delay
+        if self._latest is not None and self._cadence is not None:
+            now = now or datetime.now(tz=UTC)
+            expected = (self._latest - now).total_seconds() + self._cadence
+            if expected > 0:
+                delay = expected + UPDATE_GRACE
+        return min(max(delay, self.interval), self.max_interval)
+
+    async def _run(self) -> None:
+        """Poll until the poller is stopped."""
+        while True:
+            try:
+                await self.poll()
+            except Exception as exception:  # noqa: BLE001
+                self.last_error = exception
+                self._delay = min(self._delay * 2, self.max_interval)
+            else:
+                self.last_error = None
+            await asyncio.sleep(self.next_delay())
@@ -0,0 +1,165 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import random
+import socket
+import time
+from dataclasses import dataclass, field
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+RETRY_STATUSES = frozenset(
+    {
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    }
+)
+
+
+def retry_after(exception: BaseException) -> float | None:
+    """Return the delay the API asked for with a Retry-After header.
+
+    Args:
+    ----
+        exception: The exception of the failed request.
+
+    Returns:
+    -------
+        The delay in seconds, or None if the API did not ask for one.
+
+    """
+    from aiohttp import ClientResponseError  # noqa: PLC0415
+
+    if not isinstance(exception, ClientResponseError) or not exception.headers:
+        return None
+    value = exception.headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        moment = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((moment - datetime.now(tz=UTC)).total_seconds(), 0.0)
+
+
+@dataclass(frozen=True, slots=True)
+class RetryPolicy:
+    """Object representing how failed requests are retried.
+
+    The delay between attempts grows exponentially, with full jitter so
+    that many clients do not retry in lockstep. A Retry-After header of
+    the API takes precedence over the computed delay.
+    """
+
+    attempts: int = 3
+    backoff: float = 0.5
+    max_backoff: float = 30.0
+    statuses: frozenset[int] = RETRY_STATUSES
+
+    def is_transient(self, exception: BaseException) -> bool:
+        """Return if a failed request is worth retrying.
+
+        Args:
+        ----
+            exception: The exception of the failed request.
+
+        Returns:
+        -------
+            True for timeouts, connection errors and the retry statuses.
+
+        """
+        from aiohttp import ClientError, ClientResponseError  # noqa: PLC0415
+
+        if isinstance(exception, ClientResponseError):
+            return exception.status in self.statuses
+        return isinstance(exception, (TimeoutError, ClientError, socket.gaierror))
+
+    def delay(self, attempt: int, exception: BaseException) -> float:
+        """Return how long to wait before the next attempt.
+
+        Args:
+        ----
+            attempt: The number of the failed attempt, starting at 0.
+            exception: The exception of the failed request.
+
+        Returns:
+        -------
+            The delay in seconds.
+
+        """
+        requested = retry_after(exception)
+        if requested is not None:
+            return min(requested, self.max_backoff)
+        ceiling = min(self.max_backoff, self.backoff * 2**attempt)
+        return random.uniform(0, ceiling)  # noqa: S311
+
+
+@dataclass
+class CircuitBreaker:
+    """Fail fast for endpoints of the API that keep failing.
+
+    After `failure_threshold` consecutive failures of an endpoint the
+    circuit opens and requests fail immediately. Once `reset_timeout` has
+    passed, a single trial request is let through: when it succeeds the
+    circuit closes again, otherwise it stays open for another period.
+    """
+
+    failure_threshold: int = 5
+    reset_timeout: float = 30.0
+
+    _failures: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _opened_at: dict[str, float] = field(default_factory=dict, init=False, repr=False)
+
+    def allow(self, endpoint: str) -> bool:
+        """Return if a request to an endpoint may be sent.
+
+        Args:
+        ----
+            endpoint: The endpoint, for example the dataset name.
+
+        Returns:
+        -------
+            False while the circuit of the endpoint is open.
+
+        """
+        opened_at = self._opened_at.get(endpoint)
+        if opened_at is None:
+            return True
+        if time.monotonic() - opened_at < self.reset_timeout:
+            return False
+        # Let one trial request through and hold back the others.
+        self._opened_at[endpoint] = time.monotonic()
+        return True
+
+    def record_success(self, endpoint: str) -> None:
+        """Close the circuit of an endpoint after a successful request.
+
+        Args:
+        ----
+            endpoint: The endpoint, for example the dataset name.
+
+        """
+        self._failures.pop(endpoint, None)
+        self._opened_at.pop(endpoint, None)
+
+    def record_failure(self, endpoint: str) -> None:
+        """Count a failed request and open the circuit at the threshold.
+
+        Args:
+        ----
+            endpoint: The endpoint, for example the dataset name.
+
+        """
+        failures = self._failures.get(endpoint, 0) + 1
+        self._failures[endpoint] = failures
+        if failures >= self.failure_threshold:
+            self._opened_at[endpoint] = time.monotonic()
@@ -0,0 +1,187 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import IntEnum
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Iterator
+
+
+class Priority(IntEnum):
+    """Priority of a request, lower values are sent first."""
+
+    HIGH = 0
+    NORMAL = 1
+    LOW = 2
+
+
+# Static datasets are bulk synced, so live occupancy data goes first.
+DEFAULT_PRIORITIES: dict[str, Priority] = {
+    "behindertenstellplaetze": Priority.LOW,
+    "p_und_r": Priority.HIGH,
+    "parkhaeuser": Priority.HIGH,
+}
+
+_PRIORITY: ContextVar[Priority | None] = ContextVar("hamburg_priority", default=None)
+
+
+@contextmanager
+def request_priority(priority: Priority) -> Iterator[None]:
+    """Send all requests made in this context with the given priority.
+
+    The priority is also used by the tasks started in the context, such
+    as the concurrent page requests of a collection.
+
+    Args:
+    ----
+        priority: The priority of the requests.
+
+    Yields:
+    ------
+        Nothing, the priority applies until the context exits.
+
+    """
+    token = _PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        _PRIORITY.reset(token)
+
+
+@dataclass
+class RequestScheduler:
+    """Token bucket rate limiter that hands out request slots by priority.
+
+    Requests wait until a token is available and fewer than
+    `max_concurrent` requests are in flight, after which the waiting
+    request with the highest priority goes first. `budgets` limits how
+    many requests of a priority can be in flight at the same time, so
+    bulk syncs cannot take every slot.
+    """
+
+    rate: float | None = None
+    burst: int = 1
+    max_concurrent: int = 10
+    budgets: dict[Priority, int] = field(default_factory=dict)
+    priorities: dict[str, Priority] = field(
+        default_factory=lambda: dict(DEFAULT_PRIORITIES)
+    )
+
+    _tokens: float = field(default=0.0, init=False, repr=False)
+    _updated_at: float = field(default_factory=time.monotonic, init=False, repr=False)
+    _active: dict[Priority, int] = field(default_factory=dict, init=False, repr=False)
+    _waiters: list[tuple[Priority, int, asyncio.Future[None]]] = field(
+        default_factory=list, init=False, repr=False
+    )
+    _counter: itertools.count[int] = field(
+        default_factory=itertools.count, init=False, repr=False
+    )
+    _timer: asyncio.TimerHandle | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Start with a full bucket."""
+        self._tokens = float(self.burst)
+
+    def priority(self, endpoint: str) -> Priority:
+        """Return the priority of a request to an endpoint.
+
+        Args:
+        ----
+            endpoint: The endpoint, for example the dataset name.
+
+        Returns:
+        -------
+            The priority set with request_priority, or else the
+            priority of the endpoint.
+
+        """
+        priority = _PRIORITY.get()
+        if priority is not None:
+            return priority
+        return self.priorities.get(endpoint, Priority.NORMAL)
+
+    @asynccontextmanager
+    async def slot(self, priority: Priority) -> AsyncIterator[None]:
+        """Wait for a request slot and hold it until the context exits.
+
+        Args:
+        ----
+            priority: The priority of the request.
+
+        Yields:
+        ------
+            Nothing, the request can be sent.
+
+        """
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._dispatch()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                self._release(priority)
+            raise
+        try:
+            yield
+        finally:
+            self._release(priority)
+
+    def _release(self, priority: Priority) -> None:
+        """Free the slot of a finished request.
+
+        Args:
+        ----
+            priority: The priority of the request.
+
+        """
+        self._active[priority] -= 1
+        self._dispatch()
+
+    def _refill(self) -> None:
+        """Add the tokens that became available since the last refill."""
+        now = time.monotonic()
+        if self.rate is not None:
+            self._tokens = min(
+                float(self.burst),
+                self._tokens + (now - self._updated_at) * self.rate,
+            )
+        self._updated_at = now
+
+    def _dispatch(self) -> None:
+        """Hand out slots to waiting requests, in order of priority."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        blocked: list[tuple[Priority, int, asyncio.Future[None]]] = []
+        while self._waiters and sum(self._active.values()) < self.max_concurrent:
+            waiter = heapq.heappop(self._waiters)
+            priority, _, future = waiter
+            if future.done():
+                continue
+            budget = self.budgets.get(priority)
+            if budget is not None and self._active.get(priority, 0) >= budget:
+                blocked.append(waiter)
+                continue
+            if self.rate is not None:
+                self._refill()
+                if self._tokens < 1:
+                    blocked.append(waiter)
+                    self._timer = asyncio.get_running_loop().call_later(
+                        (1 - self._tokens) / self.rate, self._dispatch
+                    )
+                    break
+                self._tokens -= 1
+            self._active[priority] = self._active.get(priority, 0) + 1
+            future.set_result(None)
+        for waiter in blocked:
+            heapq.heappush(self._waiters, waiter)
@@ -0,0 +1,417 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import json
+import math
+import mmap
+import os
+import struct
+import sys
+import time
+from array import array
+from dataclasses import dataclass, field, fields
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal, Self, get_args, get_type_hints
+
+from .exceptions import UDPHamburgError
+from .models import DisabledParking, Garage, ParkAndRide, timezone
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator
+
+MAGIC = b"UDPH"
+FORMAT_VERSION = 1
+
+# Magic, format version, reserved, number of records, saved at (UNIX time)
+# and the name of the model. The header is 40 bytes, so the columns that
+# follow it are aligned to 8 bytes.
+HEADER = struct.Struct("<4sHHId20s")
+
+# Numeric columns, stored as little-endian doubles with NaN as missing value.
+COLUMNS = ("longitude", "latitude", "free_space", "capacity", "availability_pct")
+
+MODELS: dict[str, type[Any]] = {
+    model.__name__: model for model in (DisabledParking, Garage, ParkAndRide)
+}
+
+
+def _encode(value: Any) -> Any:
+    """Return a JSON serializable version of a model field.
+
+    Args:
+    ----
+        value: The value that json cannot serialize.
+
+    Returns:
+    -------
+        The datetime as ISO 8601 string.
+
+    Raises:
+    ------
+        TypeError: If the value is not a datetime.
+
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    msg = f"Cannot store {type(value).__name__} in a snapshot"
+    raise TypeError(msg)
+
+
+def _column_value(item: Any, name: str) -> float:
+    """Return the value of a numeric column for a model object.
+
+    Args:
+    ----
+        item: The model object.
+        name: The name of the column.
+
+    Returns:
+    -------
+        The value, or NaN if it is missing.
+
+    """
+    if name == "capacity" and not hasattr(item, "capacity"):
+        name = "number"
+    value = getattr(item, name, None)
+    return math.nan if value is None else float(value)
+
+
+@dataclass
+class Snapshot:
+    """A stored set of model objects, read from a memory mapped file.
+
+    Opening a snapshot only reads the header. The numeric columns are
+    views on the mapped file, and records are only decoded into model
+    objects when they are accessed.
+    """
+
+    model: type[Any]
+    saved_at: float
+    _mmap: mmap.mmap = field(repr=False)
+    _count: int = field(repr=False)
+    _columns: dict[str, memoryview] = field(repr=False)
+    _offsets: memoryview = field(repr=False)
+    _records: int = field(repr=False)
+
+    _datetime_fields: frozenset[str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Find the fields that are stored as ISO 8601 strings."""
+        hints = get_type_hints(self.model)
+        self._datetime_fields = frozenset(
+            name
+            for name, hint in hints.items()
+            if hint is datetime or datetime in get_args(hint)
+        )
+
+    @classmethod
+    def open(cls: type[Snapshot], path: str | os.PathLike[str]) -> Snapshot:
+        """Open a snapshot file.
+
+        Args:
+        ----
+            path: The path of the file.
+
+        Returns:
+        -------
+            A Snapshot object.
+
+        Raises:
+        ------
+            UDPHamburgError: If the file is not a snapshot.
+
+        """
+        msg = f"Not a snapshot file: {path}"
+        with Path(path).open("rb") as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as exception:
+                raise UDPHamburgError(msg) from exception
+        try:
+            magic, version, _, count, saved_at, name = HEADER.unpack_from(mapped)
+            model = MODELS.get(name.rstrip(b"\0").decode())
+        except (struct.error, UnicodeDecodeError):
+            magic, version, count, saved_at, model = b"", 0, 0, 0.0, None
+        records = HEADER.size + (len(COLUMNS) + 1) * count * 8 + 8
+        if (
+            magic != MAGIC
+            or version != FORMAT_VERSION
+            or model is None
+            or len(mapped) < records
+        ):
+            mapped.close()
+            raise UDPHamburgError(msg)
+
+        view = memoryview(mapped)
+        size = count * 8
+        columns: dict[str, memoryview] = {}
+        for index, column in enumerate(COLUMNS):
+            position = HEADER.size + index * size
+            columns[column] = _native(view[position : position + size], "d")
+        position = HEADER.size + len(COLUMNS) * size
+        offsets = _native(view[position:records], "Q")
+        view.release()
+        return cls(model, saved_at, mapped, count, columns, offsets, records)
+
+    @property
+    def age(self) -> float:
+        """Return how long ago the snapshot was saved.
+
+        Returns
+        -------
+            The age in seconds.
+
+        """
+        return time.time() - self.saved_at
+
+    def column(self, name: str) -> memoryview:
+        """Return a numeric column without copying it.
+
+        Args:
+        ----
+            name: One of longitude, latitude, free_space, capacity or
+                availability_pct.
+
+        Returns:
+        -------
+            A view of doubles, with NaN as missing value.
+
+        """
+        return self._columns[name]
+
+    def __len__(self) -> int:
+        """Return the number of records.
+
+        Returns
+        -------
+            The number of records.
+
+        """
+        return self._count
+
+    def __getitem__(self, index: int) -> Any:
+        """Decode a single record.
+
+        Args:
+        ----
+            index: The position of the record.
+
+        Returns:
+        -------
+            A model object.
+
+        Raises:
+        ------
+            IndexError: If there is no record at the position.
+
+        """
+        if not -self._count <= index < self._count:
+            msg = "Snapshot index out of range"
+            raise IndexError(msg)
+        index %= self._count
+        start = self._records + self._offsets[index]
+        end = self._records + self._offsets[index + 1]
+        data = json.loads(self._mmap[start:end])
+        for name in self._datetime_fields:
+            value = data.get(name)
+            if value is not None:
+                data[name] = datetime.fromisoformat(value).astimezone(timezone())
+        return self.model(**data)
+
+    def __iter__(self) -> Iterator[Any]:
+        """Decode the records one by one.
+
+        Yields
+        ------
+            Model objects.
+
+        """
+        for index in range(self._count):
+            yield self[index]
+
+    def items(self) -> list[Any]:
+        """Decode all records.
+
+        Returns
+        -------
+            A list of model objects.
+
+        """
+        return list(self)
+
+    def close(self) -> None:
+        """Release the columns and unmap the file."""
+        for view in self._columns.values():
+            view.release()
+        self._columns.clear()
+        self._offsets.release()
+        self._count = 0
+        self._mmap.close()
+
+    def __enter__(self) -> Self:
+        """Enter the context.
+
+        Returns
+        -------
+            The Snapshot object.
+
+        """
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the snapshot.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        self.close()
+
+
+def _native(view: memoryview, typecode: Literal["d", "Q"]) -> memoryview[Any]:
+    """Return a little-endian column of the file as native values.
+
+    Args:
+    ----
+        view: The bytes of the column.
+        typecode: The array type code of the values.
+
+    Returns:
+    -------
+        The column itself, or a byte swapped copy on big-endian systems.
+
+    """
+    if sys.byteorder == "little":
+        return view.cast(typecode)
+    values = array(typecode, view.tobytes())
+    values.byteswap()
+    return memoryview(values)
+
+
+@dataclass
+class SnapshotStore:
+    """Store the last fetched collections in a directory.
+
+    Each collection is written to a single file: a header, the numeric
+    columns as arrays of doubles, an offset table and the records as
+    JSON. Files are replaced atomically, so a reader never sees a
+    partially written snapshot.
+    """
+
+    directory: str | os.PathLike[str]
+
+    def path(self, name: str) -> Path:
+        """Return the path of a snapshot.
+
+        Args:
+        ----
+            name: The name of the snapshot, for example 'garages'.
+
+        Returns:
+        -------
+            The path of the file.
+
+        """
+        return Path(self.directory) / f"{name}.snapshot"
+
+    def save(
+        self,
+        name: str,
+        items: Iterable[Any],
+        *,
+        model: type[Any] | None = None,
+    ) -> Path:
+        """Write a set of model objects to a snapshot.
+
+        Args:
+        ----
+            name: The name of the snapshot, for example 'garages'.
+            items: DisabledParking, ParkAndRide or Garage objects.
+            model: The model of the objects. By default it is taken from
+                the objects, so it is required to save an empty set.
+
+        Returns:
+        -------
+            The path of the file.
+
+        Raises:
+        ------
+            UDPHamburgError: If the objects are not of a single model.
+
+        """
+        items = list(items)
+        models = {type(item) for item in items}
+        if model is None and not items:
+            msg = "The model is required to save an empty snapshot"
+            raise UDPHamburgError(msg)
+        if model is None and len(models) == 1:
+            model = next(iter(models))
+        if model is None or model not in MODELS.values() or models - {model}:
+            msg = "A snapshot holds objects of a single model"
+            raise UDPHamburgError(msg)
+
+        names = [item.name for item in fields(model)]
+        records = [
+            json.dumps(
+                {name: getattr(item, name) for name in names},
+                default=_encode,
+                separators=(",", ":"),
+            ).encode()
+            for item in items
+        ]
+        offsets = array("Q", [0])
+        for record in records:
+            offsets.append(offsets[-1] + len(record))
+        columns = [
+            array("d", [_column_value(item, name) for item in items])
+            for name in COLUMNS
+        ]
+        if sys.byteorder != "little":
+            offsets.byteswap()
+            for column in columns:
+                column.byteswap()
+
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temporary = path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with temporary.open("wb") as file:
+                file.write(
+                    HEADER.pack(
+                        MAGIC,
+                        FORMAT_VERSION,
+                        0,
+                        len(items),
+                        time.time(),
+                        model.__name__.encode(),
+                    )
+                )
+                for column in columns:
+                    file.write(column.tobytes())
+                file.write(offsets.tobytes())
+                file.writelines(records)
+            temporary.replace(path)
+        except BaseException:
+            temporary.unlink(missing_ok=True)
+            raise
+        return path
+
+    def load(self, name: str) -> Snapshot | None:
+        """Open a snapshot.
+
+        Args:
+        ----
+            name: The name of the snapshot, for example 'garages'.
+
+        Returns:
+        -------
+            A Snapshot object, or None if there is no snapshot yet.
+
+        """
+        path = self.path(name)
+        if not path.exists():
+            return None
+        return Snapshot.open(path)
@@ -0,0 +1,380 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import heapq
+import math
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable
+
+# Mean earth radius in meters, and the length of one degree of latitude.
+EARTH_RADIUS = 6_371_008.8
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+
+
+def haversine(
+    latitude_1: float,
+    longitude_1: float,
+    latitude_2: float,
+    longitude_2: float,
+) -> float:
+    """Calculate the great-circle distance between two points.
+
+    Args:
+    ----
+        latitude_1: The latitude of the first point.
+        longitude_1: The longitude of the first point.
+        latitude_2: The latitude of the second point.
+        longitude_2: The longitude of the second point.
+
+    Returns:
+    -------
+        The distance in meters.
+
+    """
+    phi_1 = math.radians(latitude_1)
+    phi_2 = math.radians(latitude_2)
+    d_phi = phi_2 - phi_1
+    d_lambda = math.radians(longitude_2 - longitude_1)
+    a = (
+        math.sin(d_phi / 2) ** 2
+        + math.cos(phi_1) * math.cos(phi_2) * math.sin(d_lambda / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS * math.asin(math.sqrt(a))
+
+
+@dataclass
+class SpatialIndex:
+    """In-memory grid index over locations, keyed by their spot ID.
+
+    Locations are bucketed in square grid cells of `cell_size` degrees.
+    Queries only compute distances for the locations in the cells around
+    the query point, in a single batch per ring of cells.
+    """
+
+    cell_size: float = 0.01
+
+    _items: dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _cells: dict[tuple[int, int], dict[str, Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _cell_of: dict[str, tuple[int, int]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    @classmethod
+    def from_items(
+        cls: type[SpatialIndex], items: Iterable[Any], cell_size: float = 0.01
+    ) -> SpatialIndex:
+        """Return a SpatialIndex object with the given locations.
+
+        Args:
+        ----
+            items: DisabledParking, ParkAndRide or Garage objects.
+            cell_size: The size of the grid cells in degrees.
+
+        Returns:
+        -------
+            A SpatialIndex object.
+
+        """
+        index = cls(cell_size=cell_size)
+        index.update(items)
+        return index
+
+    def _cell(self, latitude: float, longitude: float) -> tuple[int, int]:
+        """Return the grid cell of a point.
+
+        Args:
+        ----
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+
+        Returns:
+        -------
+            The row and column of the cell.
+
+        """
+        return (
+            math.floor(latitude / self.cell_size),
+            math.floor(longitude / self.cell_size),
+        )
+
+    def update(self, items: Iterable[Any]) -> None:
+        """Add locations, or replace them when the spot ID is already indexed.
+
+        Use it to apply refreshed occupancy data, locations that moved
+        are put in their new grid cell.
+
+        Args:
+        ----
+            items: DisabledParking, ParkAndRide or Garage objects.
+
+        """
+        for item in items:
+            spot_id = item.spot_id
+            cell = self._cell(item.latitude, item.longitude)
+            previous_cell = self._cell_of.get(spot_id)
+            if previous_cell is not None and previous_cell != cell:
+                self._discard(spot_id, previous_cell)
+            self._items[spot_id] = item
+            self._cell_of[spot_id] = cell
+            self._cells.setdefault(cell, {})[spot_id] = item
+
+    def remove(self, spot_id: str) -> None:
+        """Remove a location from the index.
+
+        Args:
+        ----
+            spot_id: The spot ID of the location.
+
+        """
+        cell = self._cell_of.pop(spot_id, None)
+        if cell is not None:
+            del self._items[spot_id]
+            self._discard(spot_id, cell)
+
+    def _discard(self, spot_id: str, cell: tuple[int, int]) -> None:
+        """Remove a location from a grid cell.
+
+        Args:
+        ----
+            spot_id: The spot ID of the location.
+            cell: The grid cell of the location.
+
+        """
+        bucket = self._cells[cell]
+        del bucket[spot_id]
+        if not bucket:
+            del self._cells[cell]
+
+    def _ring(self, center: tuple[int, int], radius: int) -> list[Any]:
+        """Return the locations in the ring of cells around a cell.
+
+        Args:
+        ----
+            center: The grid cell in the center.
+            radius: The distance of the ring in cells, 0 is the center.
+
+        Returns:
+        -------
+            A list of model objects.
+
+        """
+        row, column = center
+        if radius == 0:
+            return list(self._cells.get(center, {}).values())
+        cells = self._cells
+        items: list[Any] = []
+        for d_row in range(-radius, radius + 1):
+            step = 1 if abs(d_row) == radius else 2 * radius
+            for d_column in range(-radius, radius + 1, step):
+                bucket = cells.get((row + d_row, column + d_column))
+                if bucket:
+                    items.extend(bucket.values())
+        return items
+
+    def _distances(
+        self, latitude: float, longitude: float, items: list[Any]
+    ) -> list[float]:
+        """Calculate the distances from a point to many locations at once.
+
+        Args:
+        ----
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+            items: The model objects.
+
+        Returns:
+        -------
+            The distances in meters, in the order of the items.
+
+        """
+        phi = math.radians(latitude)
+        cos_phi = math.cos(phi)
+        radians = math.radians
+        sin = math.sin
+        cos = math.cos
+        asin = math.asin
+        sqrt = math.sqrt
+        diameter = 2 * EARTH_RADIUS
+        return [
+            diameter
+            * asin(
+                sqrt(
+                    sin((radians(item.latitude) - phi) / 2) ** 2
+                    + cos_phi
+                    * cos(radians(item.latitude))
+                    * sin(radians(item.longitude - longitude) / 2) ** 2
+                )
+            )
+            for item in items
+        ]
+
+    def nearest(
+        self,
+        latitude: float,
+        longitude: float,
+        n: int = 1,
+        predicate: Callable[[Any], bool] | None = None,
+    ) -> list[tuple[float, Any]]:
+        """Find the locations closest to a point.
+
+        Args:
+        ----
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+            n: The number of locations to return.
+            predicate: Only consider the locations it returns True for,
+                for example garages with free space.
+
+        Returns:
+        -------
+            A list of (distance in meters, model object) tuples,
+            closest first.
+
+        """
+        if not self._cells or n <= 0:
+            return []
+        center = self._cell(latitude, longitude)
+        rows = [cell[0] for cell in self._cells]
+        columns = [cell[1] for cell in self._cells]
+        max_radius = max(
+            abs(center[0] - min(rows)),
+            abs(center[0] - max(rows)),
+            abs(center[1] - min(columns)),
+            abs(center[1] - max(columns)),
+        )
+        # A ring is at least this far away per cell, along the (shorter)
+        # longitude axis at the latitude of the query.
+        ring_distance = (
+            self.cell_size
+            * METERS_PER_DEGREE
+            * max(math.cos(math.radians(min(abs(latitude) + 1, 90))), 1e-6)
+        )
+
+        found: list[tuple[float, int, Any]] = []
+        for radius in range(max_radius + 1):
+            items = self._ring(center, radius)
+            if predicate is not None:
+                items = [item for item in items if predicate(item)]
+            for distance, item in zip(
+                self._distances(latitude, longitude, items), items, strict=True
+            ):
+                found.append((distance, len(found), item))
+            if len(found) >= n and (
+                heapq.nsmallest(n, found)[-1][0] <= radius * ring_distance
+            ):
+                break
+        return [(distance, item) for distance, _, item in heapq.nsmallest(n, found)]
+
+    def within_radius(
+        self,
+        latitude: float,
+        longitude: float,
+        radius: float,
+    ) -> list[tuple[float, Any]]:
+        """Find the locations within a distance of a point.
+
+        Args:
+        ----
+            latitude: The latitude of the point.
+            longitude: The longitude of the point.
+            radius: The distance in meters.
+
+        Returns:
+        -------
+            A list of (distance in meters, model object) tuples,
+            closest first.
+
+        """
+        d_latitude = radius / METERS_PER_DEGREE
+        d_longitude = d_latitude / max(
+            math.cos(math.radians(min(abs(latitude) + d_latitude, 90))), 1e-6
+        )
+        items = self.within_bbox(
+            longitude - d_longitude,
+            latitude - d_latitude,
+            longitude + d_longitude,
+            latitude + d_latitude,
+        )
+        matches = [
+            (distance, item)
+            for distance, item in zip(
+                self._distances(latitude, longitude, items), items, strict=True
+            )
+            if distance <= radius
+        ]
+        matches.sort(key=lambda match: match[0])
+        return matches
+
+    def within_bbox(
+        self,
+        min_longitude: float,
+        min_latitude: float,
+        max_longitude: float,
+        max_latitude: float,
+    ) -> list[Any]:
+        """Find the locations within a bounding box.
+
+        Args:
+        ----
+            min_longitude: The western edge of the box.
+            min_latitude: The southern edge of the box.
+            max_longitude: The eastern edge of the box.
+            max_latitude: The northern edge of the box.
+
+        Returns:
+        -------
+            A list of model objects.
+
+        """
+        min_row, min_column = self._cell(min_latitude, min_longitude)
+        max_row, max_column = self._cell(max_latitude, max_longitude)
+        if (max_row - min_row + 1) * (max_column - min_column + 1) > len(self._cells):
+            buckets = [
+                bucket
+                for (row, column), bucket in self._cells.items()
+                if min_row <= row <= max_row and min_column <= column <= max_column
+            ]
+        else:
+            buckets = [
+                bucket
+                for row in range(min_row, max_row + 1)
+                for column in range(min_column, max_column + 1)
+                if (bucket := self._cells.get((row, column)))
+            ]
+        return [
+            item
+            for bucket in buckets
+            for item in bucket.values()
+            if min_latitude <= item.latitude <= max_latitude
+            and min_longitude <= item.longitude <= max_longitude
+        ]
+
+    def __len__(self) -> int:
+        """Return the number of indexed locations.
+
+        Returns
+        -------
+            The number of locations.
+
+        """
+        return len(self._items)
+
+    def __contains__(self, spot_id: object) -> bool:
+        """Return if a spot ID is indexed.
+
+        Args:
+        ----
+            spot_id: The spot ID of the location.
+
+        Returns:
+        -------
+            True if the location is in the index.
+
+        """
+        return spot_id in self._items
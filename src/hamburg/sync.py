@@ -0,0 +1,194 @@
+"""Asynchronous Python client providing Urban Data information of Hamburg."""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Self
+
+from .hamburg import UDPHamburg
+
+if TYPE_CHECKING:
+    from collections.abc import Coroutine
+
+    from .datasets import Collection
+    from .filters import Query
+    from .models import DisabledParking, Garage, ParkAndRide
+
+
+@dataclass
+class SyncUDPHamburg:
+    """Blocking client for batch jobs, such as ETL scripts.
+
+    The requests run on an event loop of its own, so the pages of a
+    collection are still fetched concurrently. By default the pages are
+    parsed in the calling thread. With `processes` set, each page is sent
+    undecoded to a pool of worker processes, None for one per CPU core,
+    which decode the JSON and build the models. That only pays off for
+    large pages and decoders that do much more work than unpickling the
+    models that come back.
+    """
+
+    client: UDPHamburg = field(default_factory=UDPHamburg)
+    processes: int | None = 0
+
+    _runner: asyncio.Runner = field(
+        default_factory=asyncio.Runner, init=False, repr=False
+    )
+    _executor: ProcessPoolExecutor | None = field(default=None, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        """Start the worker processes, unless the client has an executor."""
+        if self.client.executor is None and self.processes != 0:
+            self._executor = ProcessPoolExecutor(max_workers=self.processes)
+            self.client.executor = self._executor
+
+    def _run(self, coroutine: Coroutine[Any, Any, Any]) -> Any:
+        """Run a coroutine of the client until it is done.
+
+        Args:
+        ----
+            coroutine: The coroutine.
+
+        Returns:
+        -------
+            The result of the coroutine.
+
+        """
+        return self._runner.run(coroutine)
+
+    def disabled_parkings(
+        self,
+        limit: int | None = 10,
+        query: Query | None = None,
+    ) -> list[DisabledParking]:
+        """Get all disabled parking spaces.
+
+        Args:
+        ----
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
+
+        Returns:
+        -------
+            A list of DisabledParking objects.
+
+        """
+        items: list[DisabledParking] = self._run(
+            self.client.disabled_parkings(limit, query)
+        )
+        return items
+
+    def park_and_rides(
+        self,
+        limit: int | None = 10,
+        query: Query | None = None,
+    ) -> list[ParkAndRide]:
+        """Get all park and ride spaces.
+
+        Args:
+        ----
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
+
+        Returns:
+        -------
+            A list of ParkAndRide objects.
+
+        """
+        items: list[ParkAndRide] = self._run(self.client.park_and_rides(limit, query))
+        return items
+
+    def garages(
+        self,
+        limit: int | None = 10,
+        set_filter: str | None = None,
+        query: Query | None = None,
+    ) -> list[Garage]:
+        """Get all garages.
+
+        Args:
+        ----
+            limit: Number of items to return, None to fetch all items.
+            set_filter: Filter the garages by a defined filter expression.
+            query: Filter the garages on the server, see Query.
+
+        Returns:
+        -------
+            A list of Garage objects.
+
+        """
+        items: list[Garage] = self._run(self.client.garages(limit, set_filter, query))
+        return items
+
+    def collections(self, dataset: str) -> list[Collection]:
+        """Get the collections of a dataset.
+
+        Args:
+        ----
+            dataset: The name of the dataset, for example 'parkhaeuser'.
+
+        Returns:
+        -------
+            A list of Collection objects.
+
+        """
+        collections: list[Collection] = self._run(self.client.collections(dataset))
+        return collections
+
+    def items(
+        self,
+        collection: str | Collection,
+        *,
+        limit: int | None = 10,
+        query: Query | None = None,
+    ) -> list[Any]:
+        """Get the items of any collection.
+
+        Args:
+        ----
+            collection: A Collection object, or its path in the form
+                'dataset/collection'.
+            limit: Number of items to return, None to fetch all items.
+            query: Filter the items on the server, see Query.
+
+        Returns:
+        -------
+            A list of objects of the registered model, or else of
+            Feature objects.
+
+        """
+        items: list[Any] = self._run(
+            self.client.items(collection, limit=limit, query=query)
+        )
+        return items
+
+    def close(self) -> None:
+        """Close the client, its event loop and the worker processes."""
+        self._run(self.client.close())
+        self._runner.close()
+        if self._executor is not None:
+            self._executor.shutdown()
+            self.client.executor = None
+            self._executor = None
+
+    def __enter__(self) -> Self:
+        """Enter the context.
+
+        Returns
+        -------
+            The SyncUDPHamburg object.
+
+        """
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        """Close the client.
+
+        Args:
+        ----
+            _exc_info: Exec type.
+
+        """
+        self.close()
@@ -0,0 +1,109 @@
+"""Test the occupancy analytics of the Urban Data Platform API client."""
+
+import json
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from hamburg import (
+    Garage,
+    LocationColumns,
+    OccupancyReport,
+    OccupancyStats,
+    ParkAndRide,
+    UDPHamburg,
+    emptiest,
+    fullest,
+)
+
+from . import load_fixtures
+
+
+def _garages() -> list[Garage]:
+    """Return the garages of the live fixture."""
+    features = json.loads(load_fixtures("garages_live.geojson"))["features"]
+    return Garage.from_feature_collection({"features": features})
+
+
+def test_stats() -> None:
+    """Test the availability is weighted by capacity."""
+    stats = OccupancyStats()
+    stats.add(10, 100, 2)
+    stats.add(90, 100)
+    stats.add(None, 50)
+    stats.add(5, 0)
+    assert stats.count == 4
+    assert stats.reporting == 2
+    assert stats.occupied == 100
+    assert stats.availability_pct == 50.0
+    assert stats.disabled_parking_spaces == 2
+    assert OccupancyStats().availability_pct is None
+
+
+def test_report_groups() -> None:
+    """Test the totals of each group add up to the total."""
+    garages = _garages()
+    report = OccupancyReport.from_models(garages, by="data_origin")
+    assert report.total.count == len(garages)
+    assert sum(stats.count for stats in report.groups.values()) == len(garages)
+    assert sum(stats.free_space for stats in report.groups.values()) == (
+        report.total.free_space
+    )
+    reporting = [
+        item for item in garages if item.free_space is not None and item.capacity
+    ]
+    assert report.total.free_space == sum(item.free_space or 0 for item in reporting)
+    assert set(report.groups) == {item.data_origin for item in garages}
+
+    by_status = OccupancyReport.from_models(garages, by=lambda item: item.status)
+    assert set(by_status.groups) == {item.status for item in garages}
+
+
+def test_report_from_columns() -> None:
+    """Test a report of the columns matches a report of the models."""
+    features = json.loads(load_fixtures("park_and_ride.geojson"))["features"]
+    items = [ParkAndRide.from_dict(item) for item in features]
+    columns = LocationColumns.from_models(items)
+    expected = OccupancyReport.from_models(items, by="park_type")
+    report = OccupancyReport.from_columns(columns, [item.park_type for item in items])
+    assert report.total.free_space == expected.total.free_space
+    assert report.total.availability_pct == expected.total.availability_pct
+    for key, stats in expected.groups.items():
+        assert report.groups[key].capacity == stats.capacity
+    assert OccupancyReport.from_columns(columns).groups == {}
+    with pytest.raises(ValueError, match="Expected"):
+        OccupancyReport.from_columns(columns, ["P+R"])
+
+
+def test_top() -> None:
+    """Test the fullest and emptiest locations."""
+    garages = _garages()
+    known = sorted(
+        item.availability_pct for item in garages if item.availability_pct is not None
+    )
+    assert [item.availability_pct for item in fullest(garages, 3)] == known[:3]
+    assert [item.availability_pct for item in emptiest(garages, 3)] == (known[::-1][:3])
+    columns = LocationColumns.from_models(garages)
+    rows = fullest(columns, 3)
+    assert [row["availability_pct"] for row in rows] == known[:3]
+    assert emptiest(columns, 1)[0]["availability_pct"] == known[-1]
+
+
+async def test_collect(aresponses: ResponsesMockServer) -> None:
+    """Test a report is collected from an async iterator."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        ),
+    )
+    async with UDPHamburg() as client:
+        report = await OccupancyReport.collect(
+            client.iter_garages(limit=10), by="park_type"
+        )
+    assert report.total.count == 10
+    assert sum(stats.count for stats in report.groups.values()) == 10
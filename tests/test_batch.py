@@ -0,0 +1,98 @@
+"""Test the batch requests of the Urban Data Platform API client."""
+
+import asyncio
+
+from aresponses import ResponsesMockServer
+
+from hamburg import UDPHamburg, fetch_all, iter_fetch_all
+from hamburg.exceptions import UDPHamburgConnectionError
+
+from . import load_fixtures
+
+
+async def test_fetch_all(aresponses: ResponsesMockServer) -> None:
+    """Test one failing dataset does not discard the others."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages.geojson"),
+        ),
+    )
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/p_und_r/collections/p_und_r/items",
+        "GET",
+        aresponses.Response(status=500),
+    )
+    async with UDPHamburg() as client:
+        results = await fetch_all(
+            {
+                "park_and_rides": client.park_and_rides(),
+                "garages": client.garages(),
+            }
+        )
+    assert list(results) == ["park_and_rides", "garages"]
+    assert results["garages"].ok
+    assert len(results["garages"].value) == 10
+    assert not results["park_and_rides"].ok
+    assert results["park_and_rides"].value is None
+    assert isinstance(results["park_and_rides"].error, UDPHamburgConnectionError)
+
+
+async def test_iter_fetch_all() -> None:
+    """Test results are yielded as soon as each request is done."""
+
+    async def request(delay: float, value: str) -> str:
+        await asyncio.sleep(delay)
+        return value
+
+    names = [
+        result.name
+        async for result in iter_fetch_all(
+            {"slow": request(0.05, "slow"), "fast": request(0, "fast")}
+        )
+    ]
+    assert names == ["fast", "slow"]
+
+
+async def test_fetch_all_other_errors() -> None:
+    """Test any exception of a request is reported in its result."""
+
+    async def fail() -> None:
+        msg = "broken model"
+        raise ValueError(msg)
+
+    async def succeed() -> str:
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await fetch_all({"fail": fail(), "succeed": succeed()})
+    assert isinstance(results["fail"].error, ValueError)
+    assert results["succeed"].ok
+    assert results["succeed"].value == "value"
+
+
+async def test_iter_fetch_all_stops_early() -> None:
+    """Test requests that are still running are cancelled on a break."""
+    slow = asyncio.Event()
+
+    async def fast() -> None:
+        return None
+
+    async def wait() -> None:
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            slow.set()
+            raise
+
+    results = iter_fetch_all({"fast": fast(), "slow": wait()})
+    async for result in results:
+        assert result.name == "fast"
+        break
+    await results.aclose()
+    assert slow.is_set()
@@ -0,0 +1,100 @@
+"""Test the response cache of the Urban Data Platform API client."""
+
+# pylint: disable=protected-access
+from aiohttp.web import Request
+from aresponses import Response, ResponsesMockServer
+
+from hamburg import ResponseCache, UDPHamburg
+from hamburg.cache import CacheEntry
+
+from . import load_fixtures
+
+
+async def test_fresh_entry(aresponses: ResponsesMockServer) -> None:
+    """Test a fresh cached response is used without a request."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        ),
+    )
+    async with UDPHamburg(cache=ResponseCache()) as client:
+        first = await client._request("test", params={"limit": 10})
+        second = await client._request("test", params={"limit": 10})
+    assert first is second
+    assert len(aresponses.history) == 1
+
+
+async def test_revalidate_entry(aresponses: ResponsesMockServer) -> None:
+    """Test an expired entry is revalidated and reused on a 304 response."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={
+                "Content-Type": "application/geo+json",
+                "ETag": '"abc"',
+                "Last-Modified": "Sun, 11 Feb 2024 02:17:45 GMT",
+            },
+            text=load_fixtures("garages.geojson"),
+        ),
+    )
+
+    async def response_handler(request: Request) -> Response:
+        assert request.headers["If-None-Match"] == '"abc"'
+        assert request.headers["If-Modified-Since"] == "Sun, 11 Feb 2024 02:17:45 GMT"
+        return aresponses.Response(status=304)
+
+    aresponses.add("api.hamburg.de", "/datasets/v1/test", "GET", response_handler)
+
+    async with UDPHamburg(cache=ResponseCache(default_ttl=0)) as client:
+        first = await client._request("test")
+        second = await client._request("test")
+    assert first is second
+    assert len(aresponses.history) == 2
+
+
+async def test_garages_cached(aresponses: ResponsesMockServer) -> None:
+    """Test collection methods leave the cached response untouched."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        ),
+    )
+    async with UDPHamburg(cache=ResponseCache()) as client:
+        first = await client.garages()
+        second = await client.garages()
+    assert first == second
+    assert len(aresponses.history) == 1
+
+
+def test_ttl_per_dataset() -> None:
+    """Test the time to live is picked by dataset."""
+    cache = ResponseCache(default_ttl=30)
+    assert cache.ttl("behindertenstellplaetze/collections/x/items") == 6 * 3600
+    assert cache.ttl("parkhaeuser/collections/verkehr_parkhaeuser/items") == 30
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used entry is evicted."""
+    cache = ResponseCache(max_entries=2)
+    for key in ("a", "b"):
+        cache.set(key, CacheEntry(data=key, expires_at=0))
+    assert cache.get("a") is not None
+    cache.set("c", CacheEntry(data="c", expires_at=0))
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    cache.clear()
+    assert len(cache) == 0
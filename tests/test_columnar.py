@@ -0,0 +1,51 @@
+"""Test the columnar container of the Urban Data Platform API client."""
+
+import json
+import math
+
+from aresponses import ResponsesMockServer
+
+from hamburg import DisabledParking, LocationColumns, ParkAndRide, UDPHamburg
+
+from . import load_fixtures
+
+
+def test_from_models() -> None:
+    """Test the columns are filled from model objects."""
+    features = json.loads(load_fixtures("park_and_ride.geojson"))["features"]
+    items = [ParkAndRide.from_dict(item) for item in features]
+    columns = LocationColumns.from_models(items)
+    assert len(columns) == len(items)
+    assert columns.spot_id == [item.spot_id for item in items]
+    assert list(columns.free_space) == [item.free_space for item in items]
+    assert columns.row(0)["availability_pct"] == items[0].availability_pct
+
+
+def test_disabled_parking_columns() -> None:
+    """Test locations without occupancy data are stored as missing values."""
+    features = json.loads(load_fixtures("disabled_parking.geojson"))["features"]
+    columns = LocationColumns.from_models(
+        DisabledParking.from_dict(item) for item in features
+    )
+    assert math.isnan(columns.free_space[0])
+    row = columns.row(0)
+    assert row["free_space"] is None
+    assert row["capacity"] == features[0]["properties"]["anzahl"]
+
+
+async def test_collect(aresponses: ResponsesMockServer) -> None:
+    """Test the columns are collected from an async iterator."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        ),
+    )
+    async with UDPHamburg() as client:
+        columns = await LocationColumns.collect(client.iter_garages(limit=10))
+    assert len(columns) == 10
+    assert columns.row(0)["spot_id"] == columns.spot_id[0]
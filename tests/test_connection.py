@@ -0,0 +1,72 @@
+"""Test the connection settings of the Urban Data Platform API client."""
+
+# pylint: disable=protected-access
+from aiohttp import TCPConnector
+from aiohttp.web import Request
+from aresponses import Response, ResponsesMockServer
+
+from hamburg import ConnectionSettings, UDPHamburg
+
+from . import load_fixtures
+
+
+async def test_create_session() -> None:
+    """Test the connection pool of the session is configured."""
+    settings = ConnectionSettings(
+        pool_size=10,
+        pool_size_per_host=4,
+        keepalive_timeout=60,
+        dns_cache_ttl=None,
+    )
+    async with settings.create_session() as session:
+        connector = session.connector
+        assert isinstance(connector, TCPConnector)
+        assert connector.limit == 10
+        assert connector.limit_per_host == 4
+        assert not connector.use_dns_cache
+
+
+async def test_shared_session(aresponses: ResponsesMockServer) -> None:
+    """Test clients share a session and request compressed responses."""
+
+    async def response_handler(request: Request) -> Response:
+        assert request.headers["Accept-Encoding"] == "gzip, deflate"
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        )
+
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        response_handler,
+        repeat=2,
+    )
+    async with ConnectionSettings().create_session() as session:
+        for _ in range(2):
+            async with UDPHamburg(session=session) as client:
+                await client._request("test")
+        assert not session.closed
+
+
+async def test_internal_session_settings(aresponses: ResponsesMockServer) -> None:
+    """Test the internal session is created from the connection settings."""
+
+    async def response_handler(request: Request) -> Response:
+        assert request.headers["Accept-Encoding"] == "identity"
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        )
+
+    aresponses.add("api.hamburg.de", "/datasets/v1/test", "GET", response_handler)
+    settings = ConnectionSettings(pool_size=5, compression=False)
+    async with UDPHamburg(connection=settings) as client:
+        await client._request("test")
+        assert client.session is not None
+        assert isinstance(client.session.connector, TCPConnector)
+        assert client.session.connector.limit == 5
+    assert client.session.closed
@@ -0,0 +1,139 @@
+"""Test the generic collections of the Urban Data Platform API client."""
+
+import json
+from dataclasses import dataclass
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from hamburg import Collection, Feature, Garage, UDPHamburg
+from hamburg.datasets import items_uri
+from hamburg.models import prop
+
+from . import load_fixtures
+
+COLLECTIONS = {
+    "collections": [
+        {
+            "id": "ladestationen",
+            "title": "E-Ladestationen",
+            "description": "Ladestationen für Elektrofahrzeuge",
+            "itemType": "feature",
+            "extent": {"spatial": {"bbox": [[9.7, 53.4, 10.3, 53.75]]}},
+        },
+        {
+            "id": "ladepunkte",
+            "extent": {"spatial": {"bbox": [[9.7, 53.4, 0, 10.3, 53.75, 100]]}},
+        },
+        {"id": "betreiber"},
+    ]
+}
+
+
+@dataclass(slots=True)
+class Station:
+    """Object representing a user model of a collection."""
+
+    spot_id: str
+    number: int
+    longitude: float
+    latitude: float
+
+
+def test_feature() -> None:
+    """Test generic features keep their properties and geometry."""
+    data = json.loads(load_fixtures("garages.geojson"))
+    features = Feature.from_feature_collection(data)
+    assert len(features) == len(data["features"])
+    feature = Feature.from_dict(data["features"][0])
+    assert feature == features[0]
+    assert feature.properties == data["features"][0]["properties"]
+    assert feature.longitude == data["features"][0]["geometry"]["coordinates"][0]
+    assert feature.latitude == data["features"][0]["geometry"]["coordinates"][1]
+
+    line = Feature("1", {}, {"type": "LineString", "coordinates": [[0, 0], [1, 1]]})
+    assert line.longitude is None
+    assert line.latitude is None
+    assert Feature.from_dict({"id": 2}).geometry is None
+
+
+def test_collection() -> None:
+    """Test collections are read from the collections endpoint."""
+    collections = [
+        Collection.from_dict("emobility", item) for item in COLLECTIONS["collections"]
+    ]
+    assert collections[0].path == "emobility/ladestationen"
+    assert collections[0].title == "E-Ladestationen"
+    assert collections[0].bbox == (9.7, 53.4, 10.3, 53.75)
+    assert collections[1].bbox == (9.7, 53.4, 10.3, 53.75)
+    assert collections[2].bbox is None
+    assert items_uri(collections[0]) == "emobility/collections/ladestationen/items"
+    assert items_uri("/emobility/ladestationen/") == (
+        "emobility/collections/ladestationen/items"
+    )
+    for path in ("emobility", "emobility/", "a/b/c"):
+        with pytest.raises(ValueError, match="Invalid collection path"):
+            items_uri(path)
+
+
+async def test_collections(aresponses: ResponsesMockServer) -> None:
+    """Test the collections of a dataset are discovered."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/emobility/collections",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/json"},
+            text=json.dumps(COLLECTIONS),
+        ),
+    )
+    async with UDPHamburg() as client:
+        collections = await client.collections("emobility")
+    assert [item.collection_id for item in collections] == [
+        "ladestationen",
+        "ladepunkte",
+        "betreiber",
+    ]
+
+
+async def test_items(aresponses: ResponsesMockServer) -> None:
+    """Test the items of a collection are decoded into features or models."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/behindertenstellplaetze/collections/verkehr_behindertenparkpl/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        ),
+        repeat=aresponses.INFINITY,
+    )
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages.geojson"),
+        ),
+    )
+    path = "behindertenstellplaetze/verkehr_behindertenparkpl"
+    async with UDPHamburg() as client:
+        features = await client.items(path)
+        assert all(isinstance(item, Feature) for item in features)
+
+        client.register_model(path, Station, {"number": prop("anzahl")})
+        stations = await client.items(path, limit=5)
+        assert stations[0] == Station(
+            features[0].spot_id,
+            features[0].properties["anzahl"],
+            features[0].longitude,
+            features[0].latitude,
+        )
+
+        client.register_model("parkhaeuser/verkehr_parkhaeuser", Garage)
+        garages = await client.items("parkhaeuser/verkehr_parkhaeuser")
+        assert all(isinstance(item, Garage) for item in garages)
@@ -0,0 +1,130 @@
+"""Test the snapshot tracking of the Urban Data Platform API client."""
+
+import copy
+import json
+from unittest.mock import MagicMock
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from hamburg import Garage, ParkAndRide, SnapshotTracker, UDPHamburg
+
+from . import load_fixtures
+
+
+def test_tracker_update() -> None:
+    """Test added, removed and changed records are reported."""
+    features = json.loads(load_fixtures("park_and_ride.geojson"))["features"]
+    tracker = SnapshotTracker(ParkAndRide.from_dict)
+
+    delta = tracker.update(features)
+    assert len(delta.added) == len(features)
+    assert not delta.removed
+    assert not delta.changed
+
+    refreshed = copy.deepcopy(features[1:])
+    refreshed[0]["properties"]["stellplaetze_frei"] = "100"
+    from_dict = MagicMock(side_effect=ParkAndRide.from_dict)
+    tracker.from_dict = from_dict
+
+    delta = tracker.update(refreshed)
+    assert delta
+    assert not delta.added
+    assert [item.spot_id for item in delta.removed] == [str(features[0]["id"])]
+    assert len(delta.changed) == 1
+    change = delta.changed[0]
+    assert change.spot_id == str(features[1]["id"])
+    assert change.fields["free_space"] == (change.previous.free_space, 100)
+    assert "availability_pct" in change.fields
+    # Unchanged features are not converted into model objects again.
+    assert from_dict.call_count == 1
+    assert len(tracker.items) == len(refreshed)
+
+    assert not tracker.update(refreshed)
+
+
+def test_tracker_update_failure() -> None:
+    """Test a feature that fails to convert keeps the previous snapshot."""
+    features = json.loads(load_fixtures("park_and_ride.geojson"))["features"]
+    tracker = SnapshotTracker(ParkAndRide.from_dict)
+    tracker.update(features)
+
+    broken = copy.deepcopy(features)
+    broken[-1]["properties"]["stellplaetze_frei"] = "n/a"
+    with pytest.raises(ValueError, match="n/a"):
+        tracker.update(broken)
+    assert len(tracker.items) == len(features)
+
+    delta = tracker.update(features)
+    assert not delta
+
+
+async def test_garage_changes(aresponses: ResponsesMockServer) -> None:
+    """Test the garage changes are tracked between calls."""
+    collection = json.loads(load_fixtures("garages_live.geojson"))
+    collection["numberMatched"] = collection["numberReturned"]
+    for _ in range(2):
+        aresponses.add(
+            "api.hamburg.de",
+            "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+            "GET",
+            aresponses.Response(
+                status=200,
+                headers={"Content-Type": "application/geo+json"},
+                text=json.dumps(collection),
+            ),
+        )
+        collection["features"][0]["properties"]["frei"] = 1
+
+    async with UDPHamburg() as client:
+        delta = await client.garage_changes(set_filter="frei>=0")
+        assert all(isinstance(item, Garage) for item in delta.added)
+        delta = await client.garage_changes(set_filter="frei>=0")
+    assert not delta.added
+    assert [change.fields["free_space"][1] for change in delta.changed] == [1]
+
+
+async def test_park_and_ride_changes(aresponses: ResponsesMockServer) -> None:
+    """Test the park and ride changes are tracked between calls."""
+    collection = json.loads(load_fixtures("park_and_ride.geojson"))
+    collection["numberMatched"] = collection["numberReturned"]
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/p_und_r/collections/p_und_r/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=json.dumps(collection),
+        ),
+        repeat=2,
+    )
+    async with UDPHamburg() as client:
+        delta = await client.park_and_ride_changes()
+        assert delta.added
+        delta = await client.park_and_ride_changes()
+    assert not delta
+
+
+async def test_changes_without_geometry(aresponses: ResponsesMockServer) -> None:
+    """Test features without a geometry are left out of the changes."""
+    collection = json.loads(load_fixtures("park_and_ride.geojson"))
+    collection["numberMatched"] = collection["numberReturned"]
+    collection["features"][0]["geometry"] = None
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/p_und_r/collections/p_und_r/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=json.dumps(collection),
+        ),
+        repeat=2,
+    )
+    async with UDPHamburg() as client:
+        spaces = await client.park_and_rides(limit=None)
+        delta = await client.park_and_ride_changes()
+    spot_ids = [item.spot_id for item in spaces]
+    assert str(collection["features"][0]["id"]) not in spot_ids
+    assert [item.spot_id for item in delta.added] == spot_ids
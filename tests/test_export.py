@@ -0,0 +1,243 @@
+"""Test the exporters of the Urban Data Platform API client."""
+
+import csv
+import io
+import json
+import sys
+from dataclasses import fields
+from typing import Any
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from hamburg import (
+    ArrowExporter,
+    CSVExporter,
+    Feature,
+    Garage,
+    GeoJSONExporter,
+    NDJSONExporter,
+    ParkAndRide,
+    UDPHamburg,
+)
+from hamburg.export import _json_dumps, default_json_dumps
+
+from . import load_fixtures
+
+
+def _park_and_rides() -> list[ParkAndRide]:
+    """Return the park and rides of the fixture."""
+    data = json.loads(load_fixtures("park_and_ride.geojson"))
+    return ParkAndRide.from_feature_collection(data)
+
+
+@pytest.mark.parametrize("native", [True, False])
+def test_ndjson(native: bool) -> None:  # noqa: FBT001
+    """Test models are written as one JSON object per line."""
+    items = _park_and_rides()
+    file = io.BytesIO()
+    with NDJSONExporter(file, chunk_size=4) as exporter:
+        if not native:
+            exporter._dumps = _json_dumps
+        assert exporter.write(items) == len(items)
+    lines = file.getvalue().decode().splitlines()
+    assert exporter.count == len(lines) == len(items)
+    first = json.loads(lines[0])
+    assert first["spot_id"] == items[0].spot_id
+    assert first["tickets"] == items[0].tickets
+    assert first["updated_at"] == items[0].updated_at.isoformat()
+
+
+def test_ndjson_features() -> None:
+    """Test Feature objects get the same columns with either JSON encoder."""
+    data = json.loads(load_fixtures("garages.geojson"))
+    outputs = []
+    for dumps in (default_json_dumps(), _json_dumps):
+        file = io.BytesIO()
+        with NDJSONExporter(file) as exporter:
+            exporter._dumps = dumps
+            exporter.write(Feature.from_dict(item) for item in data["features"])
+        outputs.append([json.loads(line) for line in file.getvalue().splitlines()])
+    assert outputs[0] == outputs[1]
+    first = data["features"][0]
+    assert outputs[0][0] == {
+        "spot_id": str(first["id"]),
+        **first["properties"],
+        "longitude": first["geometry"]["coordinates"][0],
+        "latitude": first["geometry"]["coordinates"][1],
+    }
+
+
+def test_geojson() -> None:
+    """Test models are written as a FeatureCollection of points."""
+    items = _park_and_rides()
+    file = io.BytesIO()
+    with GeoJSONExporter(file, chunk_size=3) as exporter:
+        exporter.write(items)
+    data = json.loads(file.getvalue())
+    assert data["type"] == "FeatureCollection"
+    assert len(data["features"]) == len(items)
+    feature = data["features"][0]
+    assert feature["id"] == items[0].spot_id
+    assert feature["geometry"]["coordinates"] == [
+        items[0].longitude,
+        items[0].latitude,
+    ]
+    assert "longitude" not in feature["properties"]
+    assert feature["properties"]["free_space"] == items[0].free_space
+    assert ParkAndRide.from_feature_collection(data) != []
+
+
+def test_geojson_features() -> None:
+    """Test raw pages and Feature objects are written as they are."""
+    body = load_fixtures("garages.geojson").encode()
+    features = json.loads(body)["features"]
+    file = io.BytesIO()
+    with GeoJSONExporter(file) as exporter:
+        assert exporter.write_page(body) == len(features)
+    assert json.loads(file.getvalue())["features"] == features
+
+    file = io.BytesIO()
+    with GeoJSONExporter(file) as exporter:
+        exporter.write(Feature.from_dict(item) for item in features)
+    exported = json.loads(file.getvalue())["features"][0]
+    assert exported["properties"] == features[0]["properties"]
+    assert exported["geometry"] == features[0]["geometry"]
+
+    file = io.BytesIO()
+    GeoJSONExporter(file).close()
+    assert json.loads(file.getvalue()) == {"type": "FeatureCollection", "features": []}
+
+
+def test_csv() -> None:
+    """Test models are written as CSV rows."""
+    data = json.loads(load_fixtures("garages_live.geojson"))
+    items = Garage.from_feature_collection(data)
+    file = io.BytesIO()
+    with CSVExporter(file, chunk_size=2) as exporter:
+        exporter.write(items)
+    rows = list(csv.DictReader(io.StringIO(file.getvalue().decode())))
+    assert len(rows) == len(items)
+    assert rows[0]["spot_id"] == items[0].spot_id
+    assert float(rows[0]["latitude"]) == items[0].latitude
+    assert rows[0]["updated_at"] == (
+        items[0].updated_at.isoformat() if items[0].updated_at else ""
+    )
+
+    file = io.BytesIO()
+    with CSVExporter(file) as exporter:
+        exporter.write(_park_and_rides()[:1])
+    row = next(csv.DictReader(io.StringIO(file.getvalue().decode())))
+    assert json.loads(row["tickets"]) == _park_and_rides()[0].tickets
+
+
+def test_csv_page() -> None:
+    """Test the features of a page get a column for each property."""
+    data = json.loads(load_fixtures("garages.geojson"))
+    file = io.BytesIO()
+    with CSVExporter(file) as exporter:
+        exporter.write_page(data)
+    reader = csv.reader(io.StringIO(file.getvalue().decode()))
+    header = next(reader)
+    assert header[0] == "spot_id"
+    assert header[-2:] == ["longitude", "latitude"]
+    assert header[1:-2] == list(data["features"][0]["properties"])
+    assert len(list(reader)) == len(data["features"])
+
+    file = io.BytesIO()
+    with CSVExporter(file) as exporter:
+        exporter.write(Feature.from_dict(item) for item in data["features"])
+    assert file.getvalue().decode().splitlines()[0] == ",".join(header)
+
+
+async def test_write_async(aresponses: ResponsesMockServer) -> None:
+    """Test records are written straight from an async iterator."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages.geojson"),
+        ),
+    )
+    file = io.BytesIO()
+    async with UDPHamburg() as client:
+        with NDJSONExporter(file) as exporter:
+            assert await exporter.write_async(client.iter_garages(limit=10)) == 10
+    assert len(file.getvalue().splitlines()) == 10
+
+
+def test_arrow_missing(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test a clear error is raised without pyarrow."""
+    monkeypatch.setitem(sys.modules, "pyarrow", None)
+    with pytest.raises(ImportError, match="requires pyarrow"):
+        ArrowExporter(io.BytesIO(), format="parquet")
+
+
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_arrow(file_format: str) -> None:
+    """Test models are written as Arrow or Parquet."""
+    pa = pytest.importorskip("pyarrow")
+    items = _park_and_rides()
+    file = io.BytesIO()
+    with ArrowExporter(file, chunk_size=5, format=file_format) as exporter:  # type: ignore[arg-type]
+        exporter.write(items)
+    file.seek(0)
+    if file_format == "parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        table = pq.read_table(file)
+    else:
+        table = pa.ipc.open_stream(file).read_all()
+    assert table.num_rows == len(items)
+    assert table.column("spot_id").to_pylist() == [item.spot_id for item in items]
+
+
+def _read_arrow(file: io.BytesIO, file_format: str) -> Any:
+    """Return the table of an Arrow stream or Parquet file."""
+    pa = pytest.importorskip("pyarrow")
+    file.seek(0)
+    if file_format == "parquet":
+        pq = pytest.importorskip("pyarrow.parquet")
+        return pq.read_table(file)
+    return pa.ipc.open_stream(file).read_all()
+
+
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_arrow_late_values(file_format: str) -> None:
+    """Test a column without values in the first chunk is filled in later."""
+    pytest.importorskip("pyarrow")
+    items = _park_and_rides()
+    assert items[0].url is None
+    file = io.BytesIO()
+    with ArrowExporter(file, chunk_size=1, format=file_format) as exporter:  # type: ignore[arg-type]
+        exporter.write(items)
+    table = _read_arrow(file, file_format)
+    assert table.column("url").to_pylist() == [item.url for item in items]
+
+    features = [
+        {"id": index, "properties": {"level": level}, "geometry": None}
+        for index, level in enumerate([None, 2, "3"])
+    ]
+    file = io.BytesIO()
+    with ArrowExporter(file, chunk_size=1, format=file_format) as exporter:  # type: ignore[arg-type]
+        exporter.write(features)
+    table = _read_arrow(file, file_format)
+    assert table.column("level").to_pylist() == [None, "2", "3"]
+
+
+@pytest.mark.parametrize("file_format", ["arrow", "parquet"])
+def test_arrow_empty(file_format: str) -> None:
+    """Test an export without records is a valid file."""
+    pytest.importorskip("pyarrow")
+    file = io.BytesIO()
+    ArrowExporter(file, format=file_format, model=Garage).close()  # type: ignore[arg-type]
+    table = _read_arrow(file, file_format)
+    assert table.num_rows == 0
+    assert table.schema.names == [name.name for name in fields(Garage)]
+    assert str(table.schema.field("free_space").type) == "int64"
+
+    file = io.BytesIO()
+    ArrowExporter(file, format=file_format).close()  # type: ignore[arg-type]
+    assert _read_arrow(file, file_format).num_rows == 0
@@ -0,0 +1,113 @@
+"""Test the server-side filters of the Urban Data Platform API client."""
+
+from aiohttp.web import Request
+from aresponses import Response, ResponsesMockServer
+
+from hamburg import Query, UDPHamburg
+from hamburg.filters import cql_literal, cql_property
+
+from . import load_fixtures
+
+
+def test_cql_literal() -> None:
+    """Test values are written as CQL2 text literals."""
+    assert cql_literal("Hamburg") == "'Hamburg'"
+    assert cql_literal("Jungfern'stieg") == "'Jungfern''stieg'"
+    assert cql_literal(10) == "10"
+    assert cql_literal(1.5) == "1.5"
+    assert cql_literal(value=True) == "TRUE"
+    assert cql_literal(value=False) == "FALSE"
+
+
+def test_cql_property() -> None:
+    """Test property names are quoted unless they are plain identifiers."""
+    assert cql_property("stellplaetze_frei") == "stellplaetze_frei"
+    assert cql_property("name der anlage") == '"name der anlage"'
+    assert cql_property('frei" = 1 OR "a') == '"frei"" = 1 OR ""a"'
+    assert cql_property("or") == '"or"'
+    query = Query(where={"frei = 1 OR art": "Parkhaus"})
+    assert query.filter == "\"frei = 1 OR art\" = 'Parkhaus'"
+
+
+def test_query_params() -> None:
+    """Test the query is turned into OGC API parameters."""
+    assert Query().params() == {}
+    query = Query(
+        bbox=(9.9, 53.5, 10.1, 53.6),
+        where={"art": "Parkhaus", "bezirk": "Mitte"},
+        cql="frei > 10",
+        properties=["name", "frei", "gesamt"],
+    )
+    assert query.filter == "art = 'Parkhaus' AND bezirk = 'Mitte' AND (frei > 10)"
+    assert query.params() == {
+        "bbox": "9.9,53.5,10.1,53.6",
+        "filter": "art = 'Parkhaus' AND bezirk = 'Mitte' AND (frei > 10)",
+        "properties": "name,frei,gesamt",
+    }
+    assert Query(cql="frei > 10").filter == "frei > 10"
+    assert Query(cql="frei > 10").params("frei>=0") == {
+        "filter": "(frei>=0) AND (frei > 10)"
+    }
+    assert Query(properties=["name"]).params("frei>=0") == {
+        "filter": "frei>=0",
+        "properties": "name",
+    }
+
+
+async def test_query_request(aresponses: ResponsesMockServer) -> None:
+    """Test the filters are sent with every collection request."""
+    queries: list[dict[str, str]] = []
+
+    async def response_handler(request: Request) -> Response:
+        queries.append(dict(request.query))
+        return Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("park_and_ride.geojson"),
+        )
+
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/p_und_r/collections/p_und_r/items",
+        "GET",
+        response_handler,
+        repeat=aresponses.INFINITY,
+    )
+    query = Query(bbox=(9.9, 53.5, 10.1, 53.6), properties=["name", "frei"])
+    async with UDPHamburg() as client:
+        spaces = await client.park_and_rides(query=query)
+        delta = await client.park_and_ride_changes(query=query)
+    assert spaces
+    assert delta.added
+    assert queries[0] == {
+        "bbox": "9.9,53.5,10.1,53.6",
+        "properties": "name,frei",
+        "limit": "10",
+    }
+    assert queries[1]["bbox"] == "9.9,53.5,10.1,53.6"
+
+
+async def test_garage_query(aresponses: ResponsesMockServer) -> None:
+    """Test the filters of a garage query are joined with the set filter."""
+    queries: list[dict[str, str]] = []
+
+    async def response_handler(request: Request) -> Response:
+        queries.append(dict(request.query))
+        return Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        )
+
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        response_handler,
+        repeat=aresponses.INFINITY,
+    )
+    query = Query(where={"art": "Parkhaus"})
+    async with UDPHamburg() as client:
+        await client.garages(set_filter="frei>=0", query=query)
+        await client.garage_changes(set_filter="frei>=0", query=query)
+    assert {item["filter"] for item in queries} == {"(frei>=0) AND (art = 'Parkhaus')"}
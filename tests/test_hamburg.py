@@ -2,14 +2,20 @@
 
 # pylint: disable=protected-access
 import asyncio
+import json
+import sys
+from collections.abc import Awaitable, Callable
+from typing import Any
 from unittest.mock import patch
 
 import pytest
 from aiohttp import ClientError, ClientResponse, ClientSession
+from aiohttp.web import Request
 from aresponses import Response, ResponsesMockServer
 
-from hamburg import UDPHamburg
+from hamburg import ResponseCache, UDPHamburg
 from hamburg.exceptions import UDPHamburgConnectionError, UDPHamburgError
+from hamburg.hamburg import default_json_loads
 
 from . import load_fixtures
 
@@ -49,6 +55,23 @@ async def test_internal_session(aresponses: ResponsesMockServer) -> None:
         await client._request("test")
 
 
+async def test_api_url(aresponses: ResponsesMockServer) -> None:
+    """Test requests are sent to another instance of the API."""
+    aresponses.add(
+        "localhost:8080",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        ),
+    )
+    async with UDPHamburg(api_url="http://localhost:8080/datasets/v1/") as client:
+        response = await client._request("test")
+    assert response["numberMatched"] == 901
+
+
 async def test_timeout(aresponses: ResponsesMockServer) -> None:
     """Test request timeout from the Urban Data Platform API of Hamburg."""
 
@@ -101,3 +124,277 @@ async def test_client_error() -> None:
             pytest.raises(UDPHamburgConnectionError),
         ):
             assert await client._request("test")
+
+
+def _paged_handler(
+    total: int,
+    *,
+    matched: bool = True,
+    cap: int | None = None,
+) -> Callable[[Request], Awaitable[Response]]:
+    """Return a handler that serves a collection of `total` items in pages."""
+
+    async def response_handler(request: Request) -> Response:
+        limit = min(int(request.query["limit"]), cap or total)
+        offset = int(request.query.get("offset", 0))
+        features = [
+            {
+                "type": "Feature",
+                "id": index,
+                "geometry": {"type": "Point", "coordinates": [10.0, 53.5]},
+                "properties": {"anzahl": 1},
+            }
+            for index in range(offset, min(offset + limit, total))
+        ]
+        collection: dict[str, Any] = {
+            "type": "FeatureCollection",
+            "numberReturned": len(features),
+            "features": features,
+        }
+        if matched:
+            collection["numberMatched"] = total
+        return Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=json.dumps(collection),
+        )
+
+    return response_handler
+
+
+async def test_request_all_pages(aresponses: ResponsesMockServer) -> None:
+    """Test all pages of a collection are fetched concurrently."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        _paged_handler(25),
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg(page_size=10) as client:
+        response = await client._request_items("test", limit=None)
+    assert response["numberReturned"] == 25
+    assert [item["id"] for item in response["features"]] == list(range(25))
+    assert len(aresponses.history) == 3
+
+
+async def test_request_all_single_page(aresponses: ResponsesMockServer) -> None:
+    """Test no extra pages are fetched when the first page holds everything."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        _paged_handler(5),
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg(page_size=10) as client:
+        response = await client._request_items("test", limit=None)
+    assert response["numberReturned"] == 5
+    assert len(aresponses.history) == 1
+
+
+async def test_request_all_without_count(aresponses: ResponsesMockServer) -> None:
+    """Test pages are walked sequentially when the total count is unknown."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        _paged_handler(20, matched=False),
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg(page_size=10) as client:
+        response = await client._request_items("test", limit=None)
+    assert response["numberReturned"] == 20
+    assert len(aresponses.history) == 3
+
+
+async def test_request_all_capped_without_count(
+    aresponses: ResponsesMockServer,
+) -> None:
+    """Test all pages are walked when the server caps the page size."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        _paged_handler(12, matched=False, cap=5),
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg(page_size=10) as client:
+        response = await client._request_items("test", limit=None)
+    assert [item["id"] for item in response["features"]] == list(range(12))
+    assert len(aresponses.history) == 3
+
+
+async def test_iter_pages_window(aresponses: ResponsesMockServer) -> None:
+    """Test pages are only fetched ahead up to the concurrency limit."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        _paged_handler(100),
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg(page_size=10, max_concurrent_requests=2) as client:
+        pages = client._iter_pages("test", limit=None)
+        await anext(pages)
+        page = await anext(pages)
+        assert page["features"][0]["id"] == 10
+        # The consumer pauses, the window holds the next two pages.
+        await asyncio.sleep(0.1)
+        assert len(aresponses.history) == 4
+
+        remaining = [page["features"][0]["id"] async for page in pages]
+    assert remaining == list(range(20, 100, 10))
+    assert len(aresponses.history) == 10
+
+
+async def test_iter_pages_stops_early(aresponses: ResponsesMockServer) -> None:
+    """Test pending page requests are cancelled when iteration stops early."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/behindertenstellplaetze/collections/verkehr_behindertenparkpl/items",
+        "GET",
+        _paged_handler(50),
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg(page_size=10, max_concurrent_requests=1) as client:
+        spaces = client.iter_disabled_parkings()
+        first = [item.spot_id async for item in spaces if int(item.spot_id) < 15]
+        assert first == [str(index) for index in range(15)]
+
+        async for item in client.iter_disabled_parkings():
+            if item.spot_id == "12":
+                break
+    assert len(aresponses.history) < 10
+
+
+async def test_json_loads(aresponses: ResponsesMockServer) -> None:
+    """Test a custom JSON decoder is used for the response body."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        ),
+    )
+    decoded: list[bytes] = []
+
+    def loads(body: bytes) -> Any:
+        decoded.append(body)
+        return json.loads(body)
+
+    async with UDPHamburg(json_loads=loads) as client:
+        response = await client._request("test")
+    assert response["numberMatched"] == 901
+    assert decoded == [load_fixtures("disabled_parking.geojson").encode()]
+
+
+def test_default_json_loads() -> None:
+    """Test the standard library decoder is used without orjson."""
+    default_json_loads.cache_clear()
+    with patch.dict(sys.modules, {"orjson": None}):
+        assert default_json_loads() is json.loads
+    default_json_loads.cache_clear()
+
+
+async def test_raw_items(aresponses: ResponsesMockServer) -> None:
+    """Test the undecoded response body is returned."""
+
+    async def response_handler(request: Request) -> Response:
+        assert request.query["limit"] == "5"
+        assert request.query["offset"] == "10"
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages.geojson"),
+        )
+
+    aresponses.add("api.hamburg.de", "/datasets/v1/test", "GET", response_handler)
+    async with UDPHamburg(cache=ResponseCache()) as client:
+        body = await client.raw_items("test", limit=5, offset=10)
+    assert body == load_fixtures("garages.geojson").encode()
+
+
+async def test_single_flight(aresponses: ResponsesMockServer) -> None:
+    """Test concurrent identical requests share a single request."""
+
+    async def response_handler(_: Request) -> Response:
+        await asyncio.sleep(0.05)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        )
+
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        response_handler,
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg() as client:
+        results = await asyncio.gather(
+            *(client.garages(set_filter="frei>=0") for _ in range(5)),
+            client.garages(limit=5, set_filter="frei>=0"),
+        )
+        assert not client._in_flight
+    assert all(result == results[0] for result in results[1:5])
+    assert len(aresponses.history) == 2
+
+
+async def test_request_method(aresponses: ResponsesMockServer) -> None:
+    """Test requests other than GET are sent without sharing."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "POST",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        ),
+    )
+    async with UDPHamburg(cache=ResponseCache()) as client:
+        response = await client._request("test", method="POST")
+        assert response["numberMatched"] == 901
+        assert client.cache is not None
+        assert len(client.cache) == 0
+
+
+async def test_single_flight_cancel(aresponses: ResponsesMockServer) -> None:
+    """Test a cancelled caller does not cancel the shared request."""
+
+    async def response_handler(_: Request) -> Response:
+        await asyncio.sleep(0.05)
+        return aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        )
+
+    aresponses.add("api.hamburg.de", "/datasets/v1/test", "GET", response_handler)
+    async with UDPHamburg() as client:
+        first = asyncio.ensure_future(client._request("test"))
+        second = asyncio.ensure_future(client._request("test"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        assert (await second)["numberMatched"] == 901
+        assert first.cancelled()
+
+
+async def test_single_flight_error() -> None:
+    """Test an error is raised to every caller of a shared request."""
+    async with ClientSession() as session:
+        client = UDPHamburg(session=session)
+        with patch.object(session, "request", side_effect=ClientError) as request:
+            results = await asyncio.gather(
+                client._request("test"),
+                client._request("test"),
+                return_exceptions=True,
+            )
+        assert all(isinstance(result, UDPHamburgConnectionError) for result in results)
+        assert request.call_count == 1
@@ -0,0 +1,111 @@
+"""Test the occupancy history of the Urban Data Platform API client."""
+
+import json
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from hamburg import Change, Delta, OccupancyRecorder, ParkAndRide
+
+from . import load_fixtures
+
+START = datetime(2026, 1, 5, 8, 0, tzinfo=UTC)
+
+
+def test_downsampling() -> None:
+    """Test the samples are averaged in each resolution."""
+    recorder = OccupancyRecorder()
+    for minute in range(120):
+        recorder.add("1", START + timedelta(minutes=minute), minute, 200)
+
+    minutes = recorder.series("1", resolution=60)
+    assert len(minutes) == 120
+    assert minutes[0].timestamp == START
+    assert minutes[0].capacity == 200
+
+    quarters = recorder.series("1", resolution=900)
+    assert len(quarters) == 8
+    assert quarters[0].free_space == 7
+    assert (quarters[0].minimum, quarters[0].maximum) == (0, 14)
+    assert quarters[0].count == 15
+
+    hours = recorder.series("1")
+    assert [sample.free_space for sample in hours] == [29.5, 89.5]
+    assert recorder.latest("1") == minutes[-1]
+
+
+def test_range() -> None:
+    """Test a range query picks the finest resolution that covers it."""
+    recorder = OccupancyRecorder(size=60)
+    for minute in range(180):
+        recorder.add("1", START + timedelta(minutes=minute), minute)
+
+    recent = recorder.series("1", START + timedelta(minutes=150))
+    assert [sample.free_space for sample in recent] == list(range(150, 180))
+    assert recent[0].capacity is None
+
+    older = recorder.series(
+        "1", START + timedelta(minutes=20), START + timedelta(minutes=40)
+    )
+    assert [sample.timestamp.minute for sample in older] == [15, 30]
+    assert recorder.series("1", START + timedelta(days=1)) == []
+    assert recorder.series("2") == []
+    assert recorder.latest("2") is None
+    with pytest.raises(ValueError, match="Resolution"):
+        recorder.series("1", resolution=120)
+
+
+def test_ring_buffer() -> None:
+    """Test the oldest buckets are dropped once a ring is full."""
+    recorder = OccupancyRecorder(resolutions=(60,), size=10)
+    for minute in range(25):
+        recorder.add("1", START + timedelta(minutes=minute), minute)
+    samples = recorder.series("1")
+    assert [sample.free_space for sample in samples] == list(range(15, 25))
+
+
+def test_ring_growth() -> None:
+    """Test the rings grow with the buckets instead of being preallocated."""
+    recorder = OccupancyRecorder(size=1440)
+    recorder.add("1", START, 10)
+    recorder.add("1", START + timedelta(minutes=1), 20)
+    assert [len(ring.start) for ring in recorder._rings["1"]] == [2, 1, 1]
+
+    recorder = OccupancyRecorder(resolutions=(60,), size=3)
+    for minute in range(5):
+        recorder.add("1", START + timedelta(minutes=minute), minute)
+    assert len(recorder._rings["1"][0].start) == 3
+    samples = recorder.series("1")
+    assert [sample.free_space for sample in samples] == [2, 3, 4]
+
+
+def test_record() -> None:
+    """Test records are deduplicated on their update time."""
+    features = json.loads(load_fixtures("park_and_ride.geojson"))["features"]
+    items = [ParkAndRide.from_dict(item) for item in features]
+    recorder = OccupancyRecorder()
+    assert recorder.record(items) == len({item.spot_id for item in items})
+    assert recorder.record(items) == 0
+    assert len(recorder) == len(items)
+    assert items[0].spot_id in recorder
+    assert set(recorder.spot_ids) == {item.spot_id for item in items}
+
+    current = replace(
+        items[0],
+        free_space=items[0].free_space + 1,
+        updated_at=items[0].updated_at + timedelta(minutes=5),
+    )
+    delta = Delta(changed=[Change(items[0], current, {})])
+    assert recorder.record_delta(delta) == 1
+    latest = recorder.latest(current.spot_id)
+    assert latest is not None
+    assert latest.free_space == current.free_space
+
+
+def test_resolutions() -> None:
+    """Test the resolutions must be increasing."""
+    with pytest.raises(ValueError, match="resolutions"):
+        OccupancyRecorder(resolutions=(900, 60))
+    with pytest.raises(ValueError, match="resolutions"):
+        OccupancyRecorder(resolutions=())
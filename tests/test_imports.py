@@ -0,0 +1,74 @@
+"""Test the import time of the Urban Data Platform API client."""
+
+import json
+import subprocess
+import sys
+from importlib import metadata
+
+import pytest
+
+import hamburg
+from hamburg import hamburg as client_module
+from hamburg import models
+
+HEAVY_MODULES = ("aiohttp", "yarl", "pytz", "importlib.metadata")
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run code in a fresh interpreter and return the modules it loaded.
+
+    Args:
+    ----
+        code: The code to run.
+
+    Returns:
+    -------
+        The top-level names of the imported modules, plus importlib.metadata.
+
+    """
+    script = f"import sys\n{code}\nimport json\nprint(json.dumps(sorted(sys.modules)))"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", script],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    modules = json.loads(result.stdout)
+    return {name.split(".")[0] for name in modules} | (
+        {"importlib.metadata"} & set(modules)
+    )
+
+
+@pytest.mark.parametrize(
+    "code",
+    [
+        "import hamburg",
+        "from hamburg import DisabledParking, Garage, ParkAndRide",
+        "from hamburg import LocationColumns, OccupancyReport, SpatialIndex",
+    ],
+)
+def test_cold_start(code: str) -> None:
+    """Test the package and the models load without heavy dependencies."""
+    loaded = _loaded_modules(code) - _loaded_modules("pass")
+    assert not loaded.intersection(HEAVY_MODULES)
+
+
+def test_client_imports() -> None:
+    """Test the client still loads aiohttp, but not the version."""
+    loaded = _loaded_modules("from hamburg import UDPHamburg") - _loaded_modules("pass")
+    assert "aiohttp" in loaded
+    assert "importlib.metadata" not in loaded
+
+
+def test_lazy_attributes() -> None:
+    """Test the lazy attributes of the package and its modules."""
+    assert hamburg.Garage is models.Garage
+    assert set(hamburg.__all__) <= set(dir(hamburg))
+    assert metadata.version("hamburg") == client_module.VERSION
+    assert client_module.user_agent() == (
+        f"PythonUDPHamburg/{metadata.version('hamburg')}"
+    )
+    assert models.TIMEZONE.zone == "Europe/Berlin"
+    for module in (hamburg, client_module, models):
+        with pytest.raises(AttributeError, match="no attribute"):
+            _ = module.missing  # type: ignore[attr-defined]
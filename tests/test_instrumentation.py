@@ -0,0 +1,105 @@
+"""Test the instrumentation of the Urban Data Platform API client."""
+
+from aiohttp import ClientSession
+from aresponses import ResponsesMockServer
+
+from hamburg import (
+    ConnectionSettings,
+    Instrumentation,
+    ResponseCache,
+    RetryPolicy,
+    Timing,
+    UDPHamburg,
+)
+
+from . import load_fixtures
+
+GARAGES = "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items"
+
+
+def _garages_response(aresponses: ResponsesMockServer) -> None:
+    """Add a response with the garages fixture."""
+    aresponses.add(
+        "api.hamburg.de",
+        GARAGES,
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        ),
+    )
+
+
+def test_timing() -> None:
+    """Test the duration of a timing."""
+    timing = Timing("decode", "parkhaeuser", 1_000_000_000, 1_500_000_000)
+    assert timing.duration == 0.5
+    assert timing.attributes == {}
+
+
+async def test_request_metrics(aresponses: ResponsesMockServer) -> None:
+    """Test the stages of a request are timed and counted per endpoint."""
+    _garages_response(aresponses)
+    instrumentation = Instrumentation()
+    timings: list[Timing] = []
+    unsubscribe = instrumentation.subscribe(timings.append)
+    async with UDPHamburg(instrumentation=instrumentation) as client:
+        garages = await client.garages()
+    unsubscribe()
+
+    metrics = instrumentation.metrics["parkhaeuser"]
+    assert metrics.requests == 1
+    assert metrics.bytes_received == len(load_fixtures("garages_live.geojson").encode())
+    assert metrics.models == len(garages)
+    assert {"ttfb", "download", "decode", "models"} <= set(metrics.seconds)
+    assert {timing.name for timing in timings} == set(metrics.seconds)
+    decode = next(timing for timing in timings if timing.name == "decode")
+    assert decode.endpoint == "parkhaeuser"
+    assert decode.attributes == {"size": metrics.bytes_received}
+    models = next(timing for timing in timings if timing.name == "models")
+    assert models.attributes == {"count": len(garages)}
+
+
+async def test_cache_and_retry_metrics(aresponses: ResponsesMockServer) -> None:
+    """Test cache hits, retries and errors are counted."""
+    aresponses.add(
+        "api.hamburg.de",
+        GARAGES,
+        "GET",
+        aresponses.Response(status=503),
+    )
+    _garages_response(aresponses)
+    instrumentation = Instrumentation()
+    async with UDPHamburg(
+        instrumentation=instrumentation,
+        cache=ResponseCache(),
+        retry=RetryPolicy(backoff=0),
+    ) as client:
+        await client.garages()
+        await client.garages()
+    metrics = instrumentation.metrics["parkhaeuser"]
+    assert metrics.requests == 2
+    assert metrics.retries == 1
+    assert metrics.errors == 0
+    assert metrics.cache_hits == 1
+
+
+async def test_shared_session(aresponses: ResponsesMockServer) -> None:
+    """Test only the requests of the client are traced in a shared session."""
+    _garages_response(aresponses)
+    aresponses.add(
+        "example.com",
+        "/",
+        "GET",
+        aresponses.Response(status=200, text="OK"),
+    )
+    instrumentation = Instrumentation()
+    settings = ConnectionSettings()
+    async with settings.create_session([instrumentation.trace_config()]) as session:
+        assert isinstance(session, ClientSession)
+        client = UDPHamburg(session=session, instrumentation=instrumentation)
+        await client.garages()
+        async with session.get("http://example.com/") as response:
+            await response.text()
+    assert list(instrumentation.metrics) == ["parkhaeuser"]
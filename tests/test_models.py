@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import json
+from dataclasses import dataclass
+from datetime import timedelta
+
+import pytest
 from aresponses import ResponsesMockServer
 from syrupy.assertion import SnapshotAssertion
 
 from hamburg import DisabledParking, Garage, ParkAndRide, UDPHamburg
+from hamburg.models import decode_features, prop, strip_spaces, strptime
 
 from . import load_fixtures
 
@@ -96,3 +102,92 @@ async def test_garages_live_data(
     assert spaces == snapshot
     for item in spaces:
         assert isinstance(item, Garage)
+
+
+async def test_iter_garages(
+    aresponses: ResponsesMockServer,
+    hamburg_client: UDPHamburg,
+) -> None:
+    """Test garages are streamed from the response as model objects."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        ),
+    )
+    features = json.loads(load_fixtures("garages_live.geojson"))["features"]
+    spaces = [item async for item in hamburg_client.iter_garages(limit=10)]
+    assert spaces == [
+        Garage.from_dict(item) for item in features if item["geometry"] is not None
+    ]
+
+
+def test_strptime() -> None:
+    """Test the timestamps are localized to the timezone of Hamburg."""
+    winter = strptime("2024-02-11  00:40:56", "%Y-%m-%d %H:%M:%S")
+    assert winter.utcoffset() == timedelta(hours=1)
+    assert (winter.hour, winter.minute, winter.second) == (0, 40, 56)
+
+    summer = strptime("11.07.2024, 03:15", "%d.%m.%Y, %H:%M")
+    assert summer.utcoffset() == timedelta(hours=2)
+    assert summer is strptime("11.07.2024, 03:15", "%d.%m.%Y, %H:%M")
+
+    other = strptime("2024/07/11", "%Y/%m/%d")
+    assert other.utcoffset() == timedelta(hours=2)
+
+    assert strptime("11.07.2024", "%d.%m.%Y, %H:%M") is None
+    assert strptime(None, "%d.%m.%Y, %H:%M") is None  # type: ignore[arg-type]
+
+
+def test_from_feature_collection() -> None:
+    """Test the batch decoder builds the same objects as from_dict."""
+    for model, fixture in (
+        (DisabledParking, "disabled_parking.geojson"),
+        (ParkAndRide, "park_and_ride.geojson"),
+        (Garage, "garages_live.geojson"),
+    ):
+        collection = json.loads(load_fixtures(fixture))
+        assert model.from_feature_collection(collection) == [
+            model.from_dict(item) for item in collection["features"]
+        ]
+
+
+def test_decode_features_mapping() -> None:
+    """Test a custom mapping table decodes another dataset."""
+
+    @dataclass
+    class ChargingStation:
+        spot_id: str
+        operator: str | None
+        outlets: int | None
+        longitude: float
+        latitude: float
+
+    features = [
+        {
+            "id": 1,
+            "geometry": {"type": "Point", "coordinates": [10.0, 53.5]},
+            "properties": {"betreiber": " Stromnetz ", "anzahl": "4"},
+        },
+        {"id": 2, "geometry": None, "properties": {}},
+    ]
+    stations = decode_features(
+        ChargingStation,
+        {
+            "operator": prop("betreiber", strip_spaces),
+            "outlets": prop("anzahl", int),
+        },
+        features,
+    )
+    assert stations == [ChargingStation("1", "Stromnetz", 4, 10.0, 53.5)]
+
+    operator = prop("betreiber", strip_spaces)
+    assert operator({"betreiber": " Stromnetz "}) == "Stromnetz"
+    assert operator({}) is None
+
+    with pytest.raises(ValueError, match="Invalid field name"):
+        decode_features(ChargingStation, {"not valid": prop("anzahl")}, features)
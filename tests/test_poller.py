@@ -0,0 +1,128 @@
+"""Test the background poller of the Urban Data Platform API client."""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
+
+from aresponses import ResponsesMockServer
+
+from hamburg import Change, Delta, Poller, UDPHamburg
+from hamburg.exceptions import UDPHamburgConnectionError
+from hamburg.poller import UPDATE_GRACE, latest_update
+
+from . import load_fixtures
+
+NOW = datetime(2026, 5, 1, 12, 0, tzinfo=UTC)
+
+
+def _record(updated_at: datetime | None) -> SimpleNamespace:
+    """Return a record with an update time."""
+    return SimpleNamespace(spot_id="1", updated_at=updated_at)
+
+
+def test_latest_update() -> None:
+    """Test the newest update time of the added and changed records."""
+    assert latest_update(Delta()) is None
+    delta = Delta(
+        added=[_record(NOW), _record(None)],
+        changed=[Change(_record(NOW), _record(NOW + timedelta(minutes=1)), {})],
+        removed=[_record(NOW + timedelta(hours=1))],
+    )
+    assert latest_update(delta) == NOW + timedelta(minutes=1)
+
+
+async def test_adaptive_interval() -> None:
+    """Test the interval follows the update cadence of the data."""
+    deltas = [
+        Delta(added=[_record(NOW)]),
+        Delta(changed=[Change(_record(NOW), _record(NOW + timedelta(minutes=5)), {})]),
+        Delta(),
+        Delta(),
+    ]
+
+    async def changes() -> Delta:
+        return deltas.pop(0)
+
+    poller = Poller(changes, interval=10, max_interval=3600)
+    await poller.poll()
+    # Without a cadence, polls keep the base interval.
+    assert poller.next_delay(NOW) == 10
+
+    await poller.poll()
+    # The next update is expected five minutes after the last one.
+    assert poller.next_delay(NOW + timedelta(minutes=6)) == 240 + UPDATE_GRACE
+
+    # Once the update is overdue, polls without changes back off.
+    await poller.poll()
+    await poller.poll()
+    assert poller.next_delay(NOW + timedelta(minutes=20)) == 40
+    assert Poller(changes, interval=10, max_interval=30)._delay == 10
+
+
+async def test_poll_subscription(aresponses: ResponsesMockServer) -> None:
+    """Test changes are published and the poller stops with the client."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/p_und_r/collections/p_und_r/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("park_and_ride.geojson"),
+        ),
+        repeat=aresponses.INFINITY,
+    )
+    async with UDPHamburg() as client:
+        poller = client.poll(client.park_and_ride_changes, interval=0.01)
+        poller.start()
+        subscription = poller.subscribe()
+        delta = await anext(subscription)
+        assert delta.added
+        assert poller.running
+    assert not poller.running
+    assert [delta async for delta in subscription] == []
+
+
+async def test_poll_error() -> None:
+    """Test failed polls are recorded and polling continues."""
+    errors: list[Exception | None] = []
+    retried = asyncio.Event()
+
+    async def changes() -> Delta:
+        if not errors:
+            errors.append(None)
+            msg = "Timeout occurred while connecting to the API."
+            raise UDPHamburgConnectionError(msg)
+        errors.append(poller.last_error)
+        retried.set()
+        return Delta()
+
+    poller = Poller(changes, interval=0.01, max_interval=0.01)
+    subscription = poller.subscribe()
+    poller.start()
+    await asyncio.wait_for(retried.wait(), timeout=5)
+    assert isinstance(errors[1], UDPHamburgConnectionError)
+    subscription.close()
+    await poller.stop()
+    assert poller.last_error is None
+    assert [delta async for delta in subscription] == []
+
+
+async def test_poll_unexpected_error() -> None:
+    """Test any failed poll is recorded and does not end the poller."""
+    polled = asyncio.Event()
+
+    async def changes() -> Delta:
+        polled.set()
+        msg = "features"
+        raise KeyError(msg)
+
+    async with UDPHamburg() as client:
+        poller = client.poll(changes, interval=0.01, max_interval=0.01)
+        subscription = poller.subscribe()
+        await asyncio.wait_for(polled.wait(), timeout=5)
+        await asyncio.sleep(0.05)
+        assert poller.running
+        assert isinstance(poller.last_error, KeyError)
+    assert not poller.running
+    assert [delta async for delta in subscription] == []
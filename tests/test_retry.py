@@ -0,0 +1,146 @@
+"""Test the retry policy and circuit breaker of the Urban Data Platform client."""
+
+# pylint: disable=protected-access
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+
+import pytest
+from aiohttp import ClientResponseError, RequestInfo
+from aresponses import ResponsesMockServer
+from multidict import CIMultiDict, CIMultiDictProxy
+from yarl import URL
+
+from hamburg import (
+    CircuitBreaker,
+    RetryPolicy,
+    UDPHamburg,
+    UDPHamburgCircuitOpenError,
+    UDPHamburgConnectionError,
+)
+from hamburg.retry import retry_after
+
+from . import load_fixtures
+
+
+def _response_error(status: int, headers: dict[str, str]) -> ClientResponseError:
+    """Return a response error with the given status and headers."""
+    url = URL("https://api.hamburg.de/datasets/v1/test")
+    return ClientResponseError(
+        RequestInfo(url, "GET", CIMultiDictProxy(CIMultiDict()), url),
+        (),
+        status=status,
+        headers=CIMultiDictProxy(CIMultiDict(headers)),
+    )
+
+
+async def test_retry_transient(aresponses: ResponsesMockServer) -> None:
+    """Test a transient error is retried after the Retry-After delay."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(status=503, headers={"Retry-After": "0"}),
+    )
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        ),
+    )
+    async with UDPHamburg(retry=RetryPolicy(attempts=2)) as client:
+        response = await client._request("test")
+    assert response["numberMatched"] == 901
+    assert len(aresponses.history) == 2
+
+
+async def test_no_retry_client_error(aresponses: ResponsesMockServer) -> None:
+    """Test a client error is not retried and does not open the circuit."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(status=404),
+        repeat=2,
+    )
+    breaker = CircuitBreaker(failure_threshold=1)
+    async with UDPHamburg(
+        retry=RetryPolicy(attempts=3, backoff=0), circuit_breaker=breaker
+    ) as client:
+        for _ in range(2):
+            with pytest.raises(UDPHamburgConnectionError):
+                await client._request("test")
+    assert len(aresponses.history) == 2
+
+
+async def test_circuit_breaker(aresponses: ResponsesMockServer) -> None:
+    """Test the circuit opens after repeated failures and closes again."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(status=502),
+        repeat=4,
+    )
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/test",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("disabled_parking.geojson"),
+        ),
+    )
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=60)
+    async with UDPHamburg(
+        retry=RetryPolicy(attempts=2, backoff=0), circuit_breaker=breaker
+    ) as client:
+        for _ in range(2):
+            with pytest.raises(UDPHamburgConnectionError):
+                await client._request("test")
+        with pytest.raises(UDPHamburgCircuitOpenError):
+            await client._request("test")
+        assert len(aresponses.history) == 4
+
+        breaker.reset_timeout = 0
+        await client._request("test")
+        assert breaker.allow("test")
+
+
+def test_circuit_breaker_trial() -> None:
+    """Test a single trial request is let through after the reset timeout."""
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=0)
+    breaker.record_failure("test")
+    assert breaker.allow("test")
+    breaker.reset_timeout = 60
+    assert not breaker.allow("test")
+    assert breaker.allow("other")
+
+
+def test_retry_after() -> None:
+    """Test the Retry-After header is read in seconds and as a date."""
+    assert retry_after(_response_error(429, {"Retry-After": "12"})) == 12
+    moment = datetime.now(tz=UTC) + timedelta(seconds=30)
+    delay = retry_after(
+        _response_error(503, {"Retry-After": format_datetime(moment, usegmt=True)})
+    )
+    assert delay is not None
+    assert 25 < delay <= 30
+    assert retry_after(_response_error(503, {"Retry-After": "soon"})) is None
+    assert retry_after(_response_error(503, {})) is None
+    assert retry_after(TimeoutError()) is None
+
+
+def test_retry_delay() -> None:
+    """Test the delay grows exponentially and is capped."""
+    policy = RetryPolicy(backoff=1, max_backoff=5)
+    error = _response_error(503, {})
+    for attempt in range(5):
+        assert 0 <= policy.delay(attempt, error) <= min(5, 2**attempt)
+    assert policy.delay(0, _response_error(429, {"Retry-After": "60"})) == 5
+    assert policy.is_transient(TimeoutError())
+    assert not policy.is_transient(_response_error(400, {}))
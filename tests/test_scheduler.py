@@ -0,0 +1,115 @@
+"""Test the request scheduler of the Urban Data Platform API client."""
+
+# pylint: disable=protected-access
+import asyncio
+import time
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from hamburg import Priority, RequestScheduler, UDPHamburg, request_priority
+
+from . import load_fixtures
+
+
+async def _run(
+    scheduler: RequestScheduler,
+    priority: Priority,
+    name: str,
+    order: list[str],
+) -> None:
+    """Take a slot, record the order and hold it briefly."""
+    async with scheduler.slot(priority):
+        order.append(name)
+        await asyncio.sleep(0.01)
+
+
+async def test_priority_order() -> None:
+    """Test waiting requests with a higher priority go first."""
+    scheduler = RequestScheduler(max_concurrent=1)
+    order: list[str] = []
+    async with scheduler.slot(Priority.NORMAL):
+        tasks = [
+            asyncio.ensure_future(_run(scheduler, Priority.LOW, "bulk", order)),
+            asyncio.ensure_future(_run(scheduler, Priority.HIGH, "live", order)),
+            asyncio.ensure_future(_run(scheduler, Priority.NORMAL, "other", order)),
+        ]
+        await asyncio.sleep(0)
+    await asyncio.gather(*tasks)
+    assert order == ["live", "other", "bulk"]
+
+
+async def test_rate_limit() -> None:
+    """Test requests are spread out by the token bucket."""
+    scheduler = RequestScheduler(rate=50, burst=1)
+    order: list[str] = []
+    start = time.monotonic()
+    await asyncio.gather(
+        *(_run(scheduler, Priority.NORMAL, str(index), order) for index in range(4))
+    )
+    assert time.monotonic() - start >= 0.05
+    assert order == ["0", "1", "2", "3"]
+
+
+async def test_budget() -> None:
+    """Test a priority cannot use more slots than its budget."""
+    scheduler = RequestScheduler(max_concurrent=2, budgets={Priority.LOW: 1})
+    order: list[str] = []
+    async with scheduler.slot(Priority.LOW):
+        tasks = [
+            asyncio.ensure_future(_run(scheduler, Priority.LOW, "bulk", order)),
+            asyncio.ensure_future(_run(scheduler, Priority.HIGH, "live", order)),
+        ]
+        await asyncio.sleep(0)
+        assert order == ["live"]
+    await asyncio.gather(*tasks)
+    assert order == ["live", "bulk"]
+
+
+async def test_cancel_waiting() -> None:
+    """Test a cancelled waiter does not take a slot."""
+    scheduler = RequestScheduler(max_concurrent=1)
+    order: list[str] = []
+    async with scheduler.slot(Priority.NORMAL):
+        waiting = asyncio.ensure_future(
+            _run(scheduler, Priority.HIGH, "cancelled", order)
+        )
+        other = asyncio.ensure_future(_run(scheduler, Priority.LOW, "other", order))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+    await other
+    assert order == ["other"]
+    assert sum(scheduler._active.values()) == 0
+
+
+def test_priority() -> None:
+    """Test the priority follows the endpoint unless set for the context."""
+    scheduler = RequestScheduler()
+    assert scheduler.priority("parkhaeuser") == Priority.HIGH
+    assert scheduler.priority("behindertenstellplaetze") == Priority.LOW
+    assert scheduler.priority("unknown") == Priority.NORMAL
+    with request_priority(Priority.LOW):
+        assert scheduler.priority("parkhaeuser") == Priority.LOW
+    assert scheduler.priority("parkhaeuser") == Priority.HIGH
+
+
+async def test_client_scheduler(aresponses: ResponsesMockServer) -> None:
+    """Test the client sends its requests through the scheduler."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/p_und_r/collections/p_und_r/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("park_and_ride.geojson"),
+        ),
+    )
+    scheduler = RequestScheduler(rate=10, burst=2)
+    async with UDPHamburg(scheduler=scheduler) as client:
+        with request_priority(Priority.LOW):
+            spaces = await client.park_and_rides()
+    assert len(spaces) == 10
+    assert scheduler._active == {Priority.LOW: 0}
@@ -0,0 +1,150 @@
+"""Test the snapshot store of the Urban Data Platform API client."""
+
+import json
+import math
+from dataclasses import replace
+from pathlib import Path
+
+import pytest
+
+from hamburg import (
+    DisabledParking,
+    Garage,
+    ParkAndRide,
+    Snapshot,
+    SnapshotStore,
+)
+from hamburg.exceptions import UDPHamburgError
+
+from . import load_fixtures
+
+
+@pytest.mark.parametrize(
+    ("model", "fixture"),
+    [
+        (DisabledParking, "disabled_parking.geojson"),
+        (ParkAndRide, "park_and_ride.geojson"),
+        (Garage, "garages_live.geojson"),
+    ],
+)
+def test_round_trip(tmp_path: Path, model: type, fixture: str) -> None:
+    """Test model objects are loaded back unchanged."""
+    items = model.from_feature_collection(json.loads(load_fixtures(fixture)))
+    store = SnapshotStore(tmp_path / "snapshots")
+    path = store.save("items", items)
+    assert path == tmp_path / "snapshots" / "items.snapshot"
+
+    snapshot = store.load("items")
+    assert snapshot is not None
+    with snapshot:
+        assert snapshot.model is model
+        assert 0 <= snapshot.age < 60
+        assert len(snapshot) == len(items)
+        assert snapshot.items() == items
+        assert snapshot[-1] == items[-1]
+        assert list(snapshot.column("latitude")) == [item.latitude for item in items]
+    assert len(snapshot) == 0
+
+
+def test_columns(tmp_path: Path) -> None:
+    """Test the numeric columns use NaN for missing values."""
+    data = json.loads(load_fixtures("disabled_parking.geojson"))
+    items = DisabledParking.from_feature_collection(data)
+    store = SnapshotStore(tmp_path)
+    store.save("disabled_parkings", items)
+    with Snapshot.open(store.path("disabled_parkings")) as snapshot:
+        assert math.isnan(snapshot.column("free_space")[0])
+        assert snapshot.column("capacity")[0] == items[0].number
+        with pytest.raises(IndexError):
+            snapshot[len(items)]
+
+
+def test_updated_at_timezone(tmp_path: Path) -> None:
+    """Test timestamps are loaded back in the timezone of Hamburg."""
+    data = json.loads(load_fixtures("park_and_ride.geojson"))
+    items = ParkAndRide.from_feature_collection(data)
+    store = SnapshotStore(tmp_path)
+    path = store.save("park_and_rides", items)
+    with Snapshot.open(path) as snapshot:
+        assert str(snapshot[0].updated_at.tzinfo) == str(items[0].updated_at.tzinfo)
+
+
+def test_missing_and_invalid(tmp_path: Path) -> None:
+    """Test missing and invalid snapshot files."""
+    store = SnapshotStore(tmp_path)
+    assert store.load("garages") is None
+
+    store.path("empty").touch()
+    store.path("short").write_bytes(b"UDPH")
+    store.path("invalid").write_bytes(b"not a snapshot file at all" * 4)
+    for name in ("empty", "short", "invalid"):
+        with pytest.raises(UDPHamburgError):
+            store.load(name)
+
+    # A truncated file is rejected as well.
+    data = json.loads(load_fixtures("park_and_ride.geojson"))
+    path = store.save("truncated", ParkAndRide.from_feature_collection(data))
+    path.write_bytes(path.read_bytes()[:100])
+    with pytest.raises(UDPHamburgError):
+        store.load("truncated")
+
+
+def test_save_single_model(tmp_path: Path) -> None:
+    """Test a snapshot only holds objects of a single model."""
+    garages = Garage.from_feature_collection(
+        json.loads(load_fixtures("garages_live.geojson"))
+    )
+    spaces = DisabledParking.from_feature_collection(
+        json.loads(load_fixtures("disabled_parking.geojson"))
+    )
+    store = SnapshotStore(tmp_path)
+    with pytest.raises(UDPHamburgError):
+        store.save("mixed", [*garages, *spaces])
+    with pytest.raises(UDPHamburgError, match="model is required"):
+        store.save("empty", [])
+    with pytest.raises(UDPHamburgError):
+        store.save("wrong", garages, model=DisabledParking)
+    with pytest.raises(TypeError):
+        store.save("invalid", [replace(garages[0], price=object())])
+
+
+def test_save_empty(tmp_path: Path) -> None:
+    """Test an empty collection is saved with an explicit model."""
+    store = SnapshotStore(tmp_path)
+    store.save("garages", [], model=Garage)
+    snapshot = store.load("garages")
+    assert snapshot is not None
+    assert snapshot.model is Garage
+    assert len(snapshot) == 0
+    assert snapshot.items() == []
+    assert not snapshot.column("free_space")
+
+
+def test_datetime_fields(tmp_path: Path) -> None:
+    """Test the datetime fields are found from the type hints of a model."""
+    store = SnapshotStore(tmp_path)
+    expected: dict[type, set[str]] = {
+        DisabledParking: set(),
+        ParkAndRide: {"updated_at"},
+        Garage: {"updated_at"},
+    }
+    for model, names in expected.items():
+        store.save(model.__name__, [], model=model)
+        snapshot = store.load(model.__name__)
+        assert snapshot is not None
+        assert snapshot._datetime_fields == names
+
+
+def test_save_failure(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test the temporary file is removed when a snapshot cannot be written."""
+    store = SnapshotStore(tmp_path)
+    store.save("garages", [], model=Garage)
+
+    def replace_file(_path: Path, _target: Path) -> None:
+        msg = "disk full"
+        raise OSError(msg)
+
+    monkeypatch.setattr(Path, "replace", replace_file)
+    with pytest.raises(OSError, match="disk full"):
+        store.save("garages", [], model=Garage)
+    assert [path.name for path in tmp_path.iterdir()] == ["garages.snapshot"]
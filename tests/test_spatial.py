@@ -0,0 +1,98 @@
+"""Test the spatial index of the Urban Data Platform API client."""
+
+import json
+from dataclasses import replace
+
+import pytest
+
+from hamburg import DisabledParking, Garage, SpatialIndex
+from hamburg.spatial import haversine
+
+from . import load_fixtures
+
+
+def _garages() -> list[Garage]:
+    """Return the garages of the fixture."""
+    data = json.loads(load_fixtures("garages_live.geojson"))
+    return Garage.from_feature_collection(data)
+
+
+def test_haversine() -> None:
+    """Test the distance between two points."""
+    assert haversine(53.55, 9.99, 53.55, 9.99) == 0
+    # One degree of latitude is about 111 km.
+    assert haversine(53.0, 10.0, 54.0, 10.0) == pytest.approx(111_195, rel=1e-3)
+
+
+@pytest.mark.parametrize("cell_size", [0.001, 0.01, 1.0])
+def test_nearest(cell_size: float) -> None:
+    """Test the nearest locations match a linear scan."""
+    garages = _garages()
+    index = SpatialIndex.from_items(garages, cell_size=cell_size)
+    assert len(index) == len(garages)
+    for latitude, longitude in ((53.55, 9.99), (53.6, 10.1), (52.0, 8.0)):
+        expected = sorted(
+            garages,
+            key=lambda garage: haversine(
+                latitude, longitude, garage.latitude, garage.longitude
+            ),
+        )[:5]
+        result = index.nearest(latitude, longitude, n=5)
+        assert [item.spot_id for _, item in result] == [
+            garage.spot_id for garage in expected
+        ]
+        assert result[0][0] == pytest.approx(
+            haversine(latitude, longitude, expected[0].latitude, expected[0].longitude)
+        )
+
+
+def test_nearest_predicate() -> None:
+    """Test only the locations matching the predicate are returned."""
+    garages = _garages()
+    index = SpatialIndex.from_items(garages)
+    result = index.nearest(53.55, 9.99, n=len(garages), predicate=lambda _: False)
+    assert result == []
+    assert SpatialIndex().nearest(53.55, 9.99) == []
+
+
+def test_within_radius_and_bbox() -> None:
+    """Test the radius and bounding box queries match a linear scan."""
+    garages = _garages()
+    index = SpatialIndex.from_items(garages)
+    result = index.within_radius(53.55, 9.99, 2000)
+    assert {item.spot_id for _, item in result} == {
+        garage.spot_id
+        for garage in garages
+        if haversine(53.55, 9.99, garage.latitude, garage.longitude) <= 2000
+    }
+    assert [distance for distance, _ in result] == sorted(
+        distance for distance, _ in result
+    )
+
+    inside = index.within_bbox(9.9, 53.5, 10.0, 53.6)
+    assert {item.spot_id for item in inside} == {
+        garage.spot_id
+        for garage in garages
+        if 9.9 <= garage.longitude <= 10.0 and 53.5 <= garage.latitude <= 53.6
+    }
+    # A box with more cells than the index holds scans the occupied cells.
+    assert len(index.within_bbox(-180, -90, 180, 90)) == len(garages)
+
+
+def test_update_and_remove() -> None:
+    """Test locations are replaced, moved and removed."""
+    features = json.loads(load_fixtures("disabled_parking.geojson"))["features"]
+    items = [DisabledParking.from_dict(item) for item in features]
+    index = SpatialIndex.from_items(items)
+    item = items[0]
+
+    moved = replace(item, latitude=0.0, longitude=0.0)
+    index.update([moved])
+    assert len(index) == len(items)
+    assert index.nearest(0.0, 0.0)[0] == (0.0, moved)
+
+    index.remove(item.spot_id)
+    index.remove("unknown")
+    assert item.spot_id not in index
+    assert len(index) == len(items) - 1
+    assert index.within_bbox(-1, -1, 1, 1) == []
@@ -0,0 +1,172 @@
+"""Test the blocking client of the Urban Data Platform API."""
+
+import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+import pytest
+from aresponses import ResponsesMockServer
+
+from hamburg import (
+    Feature,
+    Garage,
+    Instrumentation,
+    ParkAndRide,
+    ResponseCache,
+    SyncUDPHamburg,
+    UDPHamburg,
+)
+from hamburg.models import availability, prop, timestamp
+
+from . import load_fixtures
+
+FIXTURES = {
+    "parkhaeuser/collections/verkehr_parkhaeuser/items": "garages.geojson",
+    "p_und_r/collections/p_und_r/items": "park_and_ride.geojson",
+    "behindertenstellplaetze/collections/verkehr_behindertenparkpl/items": (
+        "disabled_parking.geojson"
+    ),
+}
+
+
+@dataclass(slots=True)
+class Occupancy:
+    """Model of the occupancy of a garage, decoded in worker processes."""
+
+    spot_id: str
+    free_space: int | None
+    availability_pct: float | None
+    updated_at: datetime | None
+    longitude: float
+    latitude: float
+
+
+OCCUPANCY_FIELDS = {
+    "free_space": prop("frei"),
+    "availability_pct": availability("frei", "stellplaetze_gesamt"),
+    "updated_at": timestamp("received", "%d.%m.%Y, %H:%M"),
+}
+
+
+@pytest.fixture(name="requests")
+def mock_requests(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Serve the fixtures without a network, record the requested URIs."""
+    requests: list[str] = []
+
+    async def request(
+        _client: UDPHamburg, uri: str, *, raw: bool = False, **_kwargs: Any
+    ) -> Any:
+        requests.append(uri)
+        text = load_fixtures(FIXTURES[uri])
+        return text.encode() if raw else json.loads(text)
+
+    monkeypatch.setattr(UDPHamburg, "_request", request)
+    return requests
+
+
+@pytest.mark.parametrize("processes", [0, 1])
+def test_sync_client(requests: list[str], processes: int) -> None:
+    """Test the blocking client, with and without worker processes."""
+    with SyncUDPHamburg(processes=processes) as client:
+        assert isinstance(client.client.executor, ProcessPoolExecutor) == bool(
+            processes
+        )
+        garages = client.garages()
+        park_and_rides = client.park_and_rides()
+        features = client.items("p_und_r/p_und_r")
+    assert client.client.executor is None
+    assert len(requests) == 3
+    assert len(garages) == 10
+    assert all(isinstance(item, Garage) for item in garages)
+    assert all(isinstance(item, ParkAndRide) for item in park_and_rides)
+    assert all(isinstance(item, Feature) for item in features)
+    assert [item.spot_id for item in features] == [
+        str(item.spot_id) for item in park_and_rides
+    ]
+
+
+def test_sync_client_executor(requests: list[str]) -> None:
+    """Test an executor of the client is kept, and not shut down."""
+    with ThreadPoolExecutor(1) as executor:
+        client = SyncUDPHamburg(UDPHamburg(executor=executor))
+        assert len(client.disabled_parkings()) > 0
+        client.close()
+        assert client.client.executor is executor
+        assert executor.submit(len, requests).result() == 1
+
+
+async def test_executor(aresponses: ResponsesMockServer) -> None:
+    """Test decoding and building models in a thread pool."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages.geojson"),
+        ),
+    )
+    with ThreadPoolExecutor(1) as executor:
+        async with UDPHamburg(executor=executor) as client:
+            garages = await client.garages()
+    assert len(garages) == 10
+    assert all(isinstance(item, Garage) for item in garages)
+
+
+@pytest.mark.parametrize("cache", [False, True])
+async def test_process_pool(aresponses: ResponsesMockServer, cache: bool) -> None:  # noqa: FBT001
+    """Test pages are decoded in worker processes, unless they are cached."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages.geojson"),
+        ),
+        repeat=2,
+    )
+    instrumentation = Instrumentation()
+    async with UDPHamburg() as client:
+        expected = await client.garages()
+    with ProcessPoolExecutor(1) as executor:
+        async with UDPHamburg(
+            executor=executor,
+            instrumentation=instrumentation,
+            cache=ResponseCache() if cache else None,
+        ) as client:
+            garages = await client.garages()
+    assert garages == expected
+    seconds = instrumentation.endpoint("parkhaeuser").seconds
+    # Without a cache the JSON is decoded in the worker, with the models.
+    assert ("decode" in seconds) == cache
+    assert "models" in seconds
+
+
+async def test_process_pool_accessors(aresponses: ResponsesMockServer) -> None:
+    """Test a mapping built from the accessor helpers works in a process pool."""
+    aresponses.add(
+        "api.hamburg.de",
+        "/datasets/v1/parkhaeuser/collections/verkehr_parkhaeuser/items",
+        "GET",
+        aresponses.Response(
+            status=200,
+            headers={"Content-Type": "application/geo+json"},
+            text=load_fixtures("garages_live.geojson"),
+        ),
+        repeat=2,
+    )
+    collection = "parkhaeuser/verkehr_parkhaeuser"
+    async with UDPHamburg() as client:
+        client.register_model(collection, Occupancy, OCCUPANCY_FIELDS)
+        expected = await client.items(collection)
+    with ProcessPoolExecutor(1) as executor:
+        async with UDPHamburg(executor=executor) as client:
+            client.register_model(collection, Occupancy, OCCUPANCY_FIELDS)
+            items = await client.items(collection)
+    assert items == expected
+    assert any(item.updated_at is not None for item in items)